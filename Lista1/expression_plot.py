@@ -0,0 +1,185 @@
+"""
+Wykresy dowolnych wyrażeń y = f(x) podanych przez użytkownika (rozszerzenie task_5_mod.py).
+
+Wyrażenie (np. 'sin(x) / x' albo 'x^3 - 2*x') jest parsowane raz: drzewo składni (ast) sprawdzane jest
+z listą dozwolonych operacji i nazw, a następnie kompilowane do funkcji liczącej na całych tablicach numpy.
+Skompilowane wyrażenia są zapamiętywane (lru_cache), więc ponowne rysowanie nie parsuje tekstu od nowa.
+
+Próbkowanie jest adaptacyjne: zamiast stałej siatki np.linspace(a, b, 100) funkcja liczona jest na rzadkiej
+siatce, a potem tylko odcinki, na których wykres się zagina (punkt odstaje od cięciwy sąsiadów o więcej niż
+tolerance zakresu osi y), dzielone są na pół - do wyczerpania budżetu punktów. Płaskie fragmenty zostają rzadkie.
+"""
+import ast
+import functools
+
+import numpy as np
+
+FUNCTIONS = {
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan, 'arcsin': np.arcsin, 'arccos': np.arccos, 'arctan': np.arctan,
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh, 'exp': np.exp, 'log': np.log, 'log10': np.log10,
+    'log2': np.log2, 'sqrt': np.sqrt, 'abs': np.abs, 'sign': np.sign, 'floor': np.floor, 'ceil': np.ceil,
+}
+CONSTANTS = {'pi': np.float64(np.pi), 'e': np.float64(np.e)}  # jak liczby z wyrażenia: inf zamiast OverflowError
+OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.USub, ast.UAdd)
+
+
+def _check_node(node):
+    """Sprawdza, czy węzeł drzewa składni jest dozwolony (liczby, x, stałe, operatory i funkcje z listy)."""
+    if isinstance(node, ast.Expression):
+        _check_node(node.body)
+    elif isinstance(node, ast.BinOp):
+        if not isinstance(node.op, OPERATORS):
+            raise ValueError(f"Niedozwolony operator: {type(node.op).__name__}")
+        _check_node(node.left)
+        _check_node(node.right)
+    elif isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, OPERATORS):
+            raise ValueError(f"Niedozwolony operator: {type(node.op).__name__}")
+        _check_node(node.operand)
+    elif isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords or len(node.args) != 1:
+            raise ValueError(f"Niedozwolona funkcja: {ast.unparse(node.func)} (dozwolone: {', '.join(FUNCTIONS)})")
+        _check_node(node.args[0])
+    elif isinstance(node, ast.Name):
+        if node.id != 'x' and node.id not in CONSTANTS:
+            raise ValueError(f"Nieznana nazwa: {node.id}")
+    elif isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Niedozwolona stała: {node.value!r}")
+    else:
+        raise ValueError(f"Niedozwolona konstrukcja: {type(node).__name__}")
+
+
+def _numbers_to_numpy(tree):
+    """
+    Zamienia liczby w drzewie na nazwy wartości np.float64 (zwracany słownik nazwa -> wartość). Podwyrażenia
+    stałe liczone są wtedy jak reszta wyrażenia - z inf/nan numpy zamiast wyjątków i arytmetyki int Pythona
+    ('1/0' to inf, '2^10000' to inf, a '9^9^9' nie liczy wielkiej liczby całkowitej).
+    """
+    numbers = {}
+
+    class Replace(ast.NodeTransformer):
+        def visit_Constant(self, node):
+            name = f'_number_{len(numbers)}'
+            numbers[name] = np.float64(node.value)
+            return ast.copy_location(ast.Name(name, ast.Load()), node)
+
+    Replace().visit(tree)
+    return numbers
+
+
+@functools.lru_cache(maxsize=128)
+def compile_expression(text):
+    """
+    Kompiluje wyrażenie zmiennej x do funkcji f(x) liczącej na tablicach numpy ('^' oznacza potęgę). \n
+    Wynik jest zapamiętywany dla danego tekstu wyrażenia.
+
+    Returns:
+        function: f(x) -> np.array o kształcie x (wartości spoza dziedziny to nan).
+    """
+    source = text.strip().replace('^', '**')
+    try:
+        tree = ast.parse(source, mode='eval')
+    except SyntaxError:
+        raise ValueError(f"Niepoprawne wyrażenie: {text}") from None
+    _check_node(tree)
+    numbers = _numbers_to_numpy(tree)
+    code = compile(tree, '<wyrażenie>', 'eval')
+    namespace = {'__builtins__': {}, **FUNCTIONS, **CONSTANTS, **numbers}
+
+    def f(x):
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            y = eval(code, namespace, {'x': x})
+        # wyrażenie stałe (np. '2') też zwraca tablicę o kształcie x
+        return np.broadcast_to(np.asarray(y, dtype=float), x.shape).copy()
+
+    return f
+
+
+def split_expressions(text):
+    """Dzieli tekst na wyrażenia rozdzielone przecinkami spoza nawiasów (np. '1, sin(x), x^2')."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        depth += (char == '(') - (char == ')')
+        if char == ',' and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+    parts.append(text[start:].strip())
+    return [part for part in parts if part]
+
+
+def _bend(x, y, y_scale):
+    """
+    Odchylenie każdego punktu od cięciwy między sąsiadami (względem y_scale); inf na granicy dziedziny
+    (punkt skończony obok nan) lub przy nan po obu stronach punktu skończonego.
+    """
+    bend = np.zeros(len(x))
+    if len(x) < 3:
+        return bend
+    left, right = x[1:-1] - x[:-2], x[2:] - x[1:-1]
+    chord = (y[:-2] * right + y[2:] * left) / (left + right)
+    with np.errstate(invalid='ignore'):
+        bend[1:-1] = np.abs(y[1:-1] - chord) / y_scale
+    finite = np.isfinite(y)
+    edge = np.zeros(len(x), dtype=bool)
+    edge[:-1] |= finite[:-1] != finite[1:]
+    edge[1:] |= finite[:-1] != finite[1:]
+    bend[edge] = np.inf
+    bend[~finite & ~edge] = 0.0
+    return np.nan_to_num(bend, nan=np.inf)
+
+
+def adaptive_sample(f, x_start, x_end, max_points=1000, initial_points=None, tolerance=1e-3, y_range=None):
+    """
+    Próbkowanie adaptacyjne funkcji f (liczącej na tablicach) na [x_start, x_end]. \n
+    Zaczyna od initial_points punktów (domyślnie max_points // 8, co najmniej 65) o odstępach zaburzonych
+    o najwyżej ±1/4 odstępu (stałe ziarno, więc wynik jest powtarzalny) - równe odstępy mogą trafić w alias
+    funkcji okresowej (np. same zera sin(x) na [0, 128π]), który wyglądałby na płaską linię. \n
+    W każdej rundzie odcinki przy punktach, które odstają od cięciwy sąsiadów o więcej niż tolerance·(zakres y),
+    są dzielone na pół - wszystkie nowe środki liczone są jednym wywołaniem f. Gdy odcinków do podziału jest
+    więcej niż pozostały budżet max_points, dzielone są te najbardziej zagięte.
+
+    Args:
+        y_range (tuple): Zakres osi y, względem którego mierzone jest zagięcie (domyślnie rozstęp 2-98 percentyla
+            wartości, by asymptoty nie zaniżały dokładności reszty wykresu).
+
+    Returns:
+        tuple: (x, y) - posortowane próbki (liczba wywołań f dla pojedynczych punktów to len(x)).
+    """
+    if initial_points is None:
+        initial_points = max(65, max_points // 8)
+    x = np.linspace(x_start, x_end, max(2, min(initial_points, max_points)))
+    jitter = np.random.default_rng(0).uniform(-0.25, 0.25, len(x) - 2)
+    x[1:-1] += jitter * (x[1] - x[0])
+    y = f(x)
+    min_width = (x_end - x_start) * 1e-9
+    while len(x) < max_points:
+        if y_range is not None:
+            y_scale = abs(y_range[1] - y_range[0])
+        else:
+            finite = y[np.isfinite(y)]
+            y_scale = np.subtract(*np.percentile(finite, [98, 2])) if finite.size else 0.0
+        y_scale = max(y_scale, 1e-12)
+
+        bend = _bend(x, y, y_scale)
+        interval_bend = np.maximum(bend[:-1], bend[1:])
+        split = np.flatnonzero((interval_bend > tolerance) & (np.diff(x) > min_width))
+        if not split.size:
+            break
+        budget = max_points - len(x)
+        if split.size > budget:
+            split = np.sort(split[np.argpartition(-interval_bend[split], budget - 1)[:budget]])
+        middle = 0.5 * (x[split] + x[split + 1])
+        x = np.insert(x, split + 1, middle)
+        y = np.insert(y, split + 1, f(middle))
+    return x, y
+
+
+def plot_expression(ax, text, x_start, x_end, max_points=1000, tolerance=1e-3, y_range=None, **kwargs):
+    """Rysuje y = wyrażenie(x) z próbkowaniem adaptacyjnym; zwraca linię matplotlib."""
+    x, y = adaptive_sample(compile_expression(text), x_start, x_end, max_points, tolerance=tolerance,
+                           y_range=y_range)
+    kwargs.setdefault('label', f'y={text}')
+    (line,) = ax.plot(x, y, **kwargs)
+    return line
@@ -0,0 +1,296 @@
+"""
+Budowa dużych grafów geometrycznych (drogi, magazyny) z tablic współrzędnych wierzchołków.
+
+Wagi krawędzi (odległości euklidesowe) liczone są jedną operacją na tablicach, a krawędzie mogą zostać
+wygenerowane automatycznie - k najbliższych sąsiadów albo wszyscy sąsiedzi w promieniu r - przy użyciu
+siatki przestrzennej (kubełki o stałym boku), więc porównywane są tylko punkty z sąsiednich komórek.
+Wynikiem jest tablica krawędzi (E, 2) z wagami, zamieniana na graf networkx albo zwartą reprezentację
+CSR (indptr, indices, data) bez pętli w Pythonie po krawędziach.
+"""
+import networkx as nx
+import numpy as np
+
+
+def edge_weights(x, y, edges):
+    """Długości euklidesowe wszystkich krawędzi (E, 2) naraz."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    return np.hypot(x[edges[:, 0]] - x[edges[:, 1]], y[edges[:, 0]] - y[edges[:, 1]])
+
+
+def edges_from_labels(nodes, labelled_edges):
+    """Zamienia krawędzie podane nazwami wierzchołków (np. [(1, 2), ...]) na indeksy w tablicy nodes."""
+    nodes = np.asarray(nodes)
+    order = np.argsort(nodes)
+    labelled_edges = np.asarray(labelled_edges).reshape(-1, 2)
+    position = np.searchsorted(nodes, labelled_edges, sorter=order)
+    if np.any(position >= len(nodes)) or np.any(nodes[order[np.minimum(position, len(nodes) - 1)]] != labelled_edges):
+        raise ValueError("Krawędź odwołuje się do nieistniejącego wierzchołka")
+    return order[position]
+
+
+class SpatialGrid:
+    """
+    Siatka kubełków o boku cell_size - indeksowane są tylko komórki zajęte, więc pamięć jest O(N) niezależnie
+    od rozpiętości punktów i boku komórki. Punkty są posortowane według klucza komórki, klucze komórek zajętych
+    to cells (rosnąco), a punkty m-tej z nich to order[start[m]:start[m + 1]] (układ jak w CSR).
+    """
+
+    def __init__(self, x, y, cell_size):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.cell_size = float(cell_size)
+        self.origin = (self.x.min(), self.y.min())
+        self.cx = ((self.x - self.origin[0]) // self.cell_size).astype(np.int64)
+        self.cy = ((self.y - self.origin[1]) // self.cell_size).astype(np.int64)
+        self.nx_cells = int(self.cx.max()) + 1
+        self.ny_cells = int(self.cy.max()) + 1
+        key = self.cx * self.ny_cells + self.cy
+        self.order = np.argsort(key, kind='stable')
+        self.cells, first = np.unique(key[self.order], return_index=True)
+        self.start = np.append(first, len(key))
+        self.cell_of = np.empty(len(key), dtype=np.int64)  # numer zajętej komórki punktu (indeks do cells)
+        self.cell_of[self.order] = np.repeat(np.arange(len(self.cells)), np.diff(self.start))
+
+    def cell_ranges(self, cx, cy):
+        """
+        Zakresy punktów komórek (cx, cy) w tablicy order: (first, counts) - komórki poza siatką
+        i puste mają counts = 0.
+        """
+        valid = (cx >= 0) & (cx < self.nx_cells) & (cy >= 0) & (cy < self.ny_cells)
+        m = np.searchsorted(self.cells, np.where(valid, cx * self.ny_cells + cy, -1))
+        m = np.minimum(m, len(self.cells) - 1)
+        occupied = valid & (self.cells[m] == cx * self.ny_cells + cy)
+        first = self.start[m]
+        return first, np.where(occupied, self.start[m + 1] - first, 0)
+
+    def candidate_pairs(self, points, dx, dy):
+        """
+        Pary (punkt, kandydat) dla punktów 'points' i wszystkich punktów z komórki przesuniętej o (dx, dy)
+        względem komórki danego punktu. Pary jednego punktu leżą obok siebie (w kolejności 'points').
+
+        Returns:
+            tuple: (i, j, rank, counts) - punkt, kandydat, numer kandydata w obrębie punktu
+            oraz liczba kandydatów każdego punktu z 'points'.
+        """
+        first, counts = self.cell_ranges(self.cx[points] + dx, self.cy[points] + dy)
+        return self.range_pairs(points, first, counts) + (counts,)
+
+    def range_pairs(self, points, first, counts):
+        """
+        Pary (punkt, kandydat) dla punktów 'points' i zakresów order[first:first + counts] (po jednym na punkt).
+
+        Returns:
+            tuple: (i, j, rank) - punkt, kandydat i numer kandydata w obrębie punktu.
+        """
+        # rozwinięcie zakresów [first, first + count) bez pętli: indeks w obrębie zakresu z cumsum
+        total = int(counts.sum())
+        rank = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(points, counts), self.order[np.repeat(first, counts) + rank], rank
+
+
+def _default_cell_size(x, y, points_per_cell=2.0, iterations=8):
+    """
+    Bok komórki, przy którym punkt dzieli komórkę średnio z około points_per_cell punktami. \n
+    Start z gęstości jednorodnej w prostokącie otaczającym (rozpiętość węższej osi ograniczona od dołu przez
+    (szersza rozpiętość) / N, więc punkty współliniowe - droga wzdłuż osi - dają komórki jak dla prostej),
+    a potem poprawka z liczności zajętych komórek: dla skupisk (drogi, magazyny) średnia liczba punktów
+    w komórce punktu Σc²/N jest dużo większa niż przy rozkładzie jednorodnym, więc bok jest zmniejszany
+    o √(points_per_cell / (Σc²/N)) aż do osiągnięcia celu (najwyżej 'iterations' razy).
+    """
+    extent = max(np.ptp(x), np.ptp(y))
+    floor = max(extent / len(x), 1e-300)
+    area = max(np.ptp(x), floor) * max(np.ptp(y), floor)
+    cell_size = max(np.sqrt(points_per_cell * area / len(x)), 1e-12)
+    smallest = max(extent * 1e-9, 1e-12)  # punkty powtórzone nie zmniejszają komórki w nieskończoność
+    for _ in range(iterations):
+        key = (((x - x.min()) // cell_size).astype(np.int64) * (int(np.ptp(y) // cell_size) + 1)
+               + ((y - y.min()) // cell_size).astype(np.int64))
+        counts = np.unique(key, return_counts=True)[1]
+        crowding = float(counts @ counts) / len(x)
+        if crowding <= 2 * points_per_cell or cell_size <= smallest:
+            break
+        cell_size = max(cell_size * np.sqrt(points_per_cell / crowding), smallest)
+    return cell_size
+
+
+def cell_pairs(x, y, cell_size, reach=1):
+    """
+    Wszystkie pary punktów (i < j), których komórki siatki o boku cell_size (początek w (min x, min y)) różnią się
+    o co najwyżej reach w każdej osi. Przeglądana jest połowa sąsiedztwa, więc każda para pojawia się raz.
+
+    Returns:
+        tuple: (pairs (E, 2), distances (E,))
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    grid = SpatialGrid(x, y, cell_size)
+    points = np.arange(len(x))
+    pair_blocks, distance_blocks = [], []
+    offsets = [(dx, dy) for dx in range(reach + 1) for dy in range(-reach, reach + 1) if dx > 0 or dy >= 0]
+    for dx, dy in offsets:
+        i, j, _, _ = grid.candidate_pairs(points, dx, dy)
+        if (dx, dy) == (0, 0):
+            keep = i < j
+            i, j = i[keep], j[keep]
+        pair_blocks.append(np.column_stack((np.minimum(i, j), np.maximum(i, j))))
+        distance_blocks.append(np.hypot(x[i] - x[j], y[i] - y[j]))
+    return np.concatenate(pair_blocks), np.concatenate(distance_blocks)
+
+
+def radius_edges(x, y, radius):
+    """
+    Wszystkie pary wierzchołków odległe o co najwyżej radius (krawędzie nieskierowane, i < j). \n
+    Siatka o boku radius - sąsiad może leżeć tylko w tej samej lub przyległej komórce (cell_pairs z reach=1,
+    5 z 9 przesunięć), więc każda para jest porównywana raz.
+
+    Returns:
+        tuple: (edges (E, 2), weights (E,))
+    """
+    pairs, distance = cell_pairs(x, y, radius)
+    close = distance <= radius
+    return pairs[close], distance[close]
+
+
+def knn_edges(x, y, k, cell_size=None, max_block=2**24, max_rings=3, coarsening=4):
+    """
+    Krawędzie do k najbliższych sąsiadów każdego wierzchołka (graf nieskierowany, bez duplikatów). \n
+    Dla każdego punktu przeszukiwane są kwadraty (2s+1)x(2s+1) komórek dla s = 1, 2, ...; wynik jest pewny,
+    gdy k-ty sąsiad leży bliżej niż s·cell_size (każdy punkt spoza kwadratu jest dalej). Punkty rozstrzygnięte
+    odpadają, więc dalsze pierścienie liczone są tylko dla obszarów rzadkich. Po max_rings pierścieniach
+    pozostałe punkty (np. odosobnione punkty daleko od skupisk, dla których komórka dobrana do skupisk jest
+    bardzo mała) szukane są na siatce o boku coarsening razy większym - liczba poziomów rośnie logarytmicznie
+    z rozpiętością, a nie liniowo jak liczba pierścieni. Odległości do kandydatów trafiają do macierzy
+    (punkty, kandydaci) wypełnionej inf, z której k najmniejszych wybiera argpartition; punkty przetwarzane
+    są partiami, by macierz miała najwyżej max_block elementów.
+
+    Returns:
+        tuple: (edges (E, 2), weights (E,))
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0)
+    cell_size = cell_size or _default_cell_size(x, y, max(2.0, k / 2))
+    neighbours = np.empty((n, k), dtype=np.int64)
+    row_of = np.empty(n, dtype=np.int64)
+    pending = np.arange(n)
+    while pending.size:
+        grid = SpatialGrid(x, y, cell_size)
+        for s in range(1, max_rings + 1):
+            pending = _knn_ring(grid, pending, k, s, neighbours, row_of, max_block)
+            if not pending.size:
+                break
+        cell_size *= coarsening
+
+    source = np.repeat(np.arange(n, dtype=np.int64), k)
+    target = neighbours.ravel()
+    key = np.sort(np.minimum(source, target) * n + np.maximum(source, target))
+    key = key[np.concatenate(([True], key[1:] != key[:-1]))]  # krawędź i-j i j-i tylko raz
+    edges = np.column_stack((key // n, key % n))
+    return edges, edge_weights(x, y, edges)
+
+
+def _knn_ring(grid, pending, k, s, neighbours, row_of, max_block):
+    """
+    Jeden kwadrat (2s+1)x(2s+1) komórek wokół punktów pending: zapisuje sąsiadów rozstrzygniętych punktów
+    do neighbours i zwraca punkty nierozstrzygnięte.
+    """
+    x, y = grid.x, grid.y
+    offsets = [(dx, dy) for dx in range(-s, s + 1) for dy in range(-s, s + 1)]
+    # zakresy kandydatów liczone raz na zajętą komórkę (a nie na punkt) i przesunięcie; punkt bierze je
+    # przez indeks swojej komórki
+    cells, cell = np.unique(grid.cell_of[pending], return_inverse=True)
+    cell_x, cell_y = np.divmod(grid.cells[cells], grid.ny_cells)
+    ranges = [grid.cell_ranges(cell_x + dx, cell_y + dy) for dx, dy in offsets]
+    n_candidates = sum(counts for _, counts in ranges)[cell]
+    # malejąco, by szerokość macierzy partii wyznaczały punkty tej partii, a nie najgęstsza komórka skupiska
+    by_count = np.argsort(-n_candidates, kind='stable')
+    pending, cell, n_candidates = pending[by_count], cell[by_count], n_candidates[by_count]
+    covers_grid = s >= max(grid.nx_cells, grid.ny_cells)
+
+    unresolved = []
+    batch_start = 0
+    while batch_start < pending.size:
+        width = max(k + 1, int(n_candidates[batch_start]))
+        rows = slice(batch_start, batch_start + max(1, max_block // width))
+        batch, batch_cell = pending[rows], cell[rows]
+        batch_start += batch.size
+        row_of[batch] = np.arange(batch.size)
+
+        distance = np.full((batch.size, width), np.inf)
+        candidate = np.zeros((batch.size, width), dtype=np.int64)
+        filled = np.zeros(batch.size, dtype=np.int64)
+        for first, counts in ranges:
+            i, j, rank = grid.range_pairs(batch, first[batch_cell], counts[batch_cell])
+            row = row_of[i]
+            column = filled[row] + rank
+            distance[row, column] = np.where(i == j, np.inf, np.hypot(x[i] - x[j], y[i] - y[j]))
+            candidate[row, column] = j
+            filled += counts[batch_cell]
+
+        nearest = np.argpartition(distance, k - 1, axis=1)[:, :k]
+        nearest_distance = np.take_along_axis(distance, nearest, axis=1)
+        resolved = (nearest_distance.max(axis=1) <= s * grid.cell_size) | covers_grid
+        neighbours[batch[resolved]] = np.take_along_axis(candidate, nearest, axis=1)[resolved]
+        unresolved.append(batch[~resolved])
+    return np.concatenate(unresolved)
+
+
+def build_graph(x, y, edges=None, k=None, radius=None):
+    """
+    Krawędzie i wagi grafu geometrycznego: z podanej tablicy krawędzi (E, 2) indeksów wierzchołków
+    albo wygenerowane (k najbliższych sąsiadów lub sąsiedzi w promieniu radius).
+
+    Returns:
+        tuple: (edges (E, 2), weights (E,))
+    """
+    if edges is not None:
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        return edges, edge_weights(x, y, edges)
+    if k is not None:
+        return knn_edges(x, y, k)
+    if radius is not None:
+        return radius_edges(x, y, radius)
+    raise ValueError("Podaj krawędzie (edges), liczbę sąsiadów k albo promień radius")
+
+
+def to_csr(n_nodes, edges, weights, directed=False):
+    """
+    Zwarta macierz sąsiedztwa w formacie CSR: sąsiedzi wierzchołka v to indices[indptr[v]:indptr[v + 1]],
+    a wagi odpowiednich krawędzi - data[indptr[v]:indptr[v + 1]]. Graf nieskierowany zapisuje obie strony.
+
+    Returns:
+        tuple: (indptr, indices, data)
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    weights = np.asarray(weights, dtype=float)
+    source, target = edges[:, 0], edges[:, 1]
+    if not directed:
+        source, target = np.concatenate((source, target)), np.concatenate((target, source))
+        weights = np.concatenate((weights, weights))
+    order = np.argsort(source * n_nodes + target)
+    indptr = np.searchsorted(source[order], np.arange(n_nodes + 1))
+    return indptr, target[order], weights[order]
+
+
+def to_networkx(edges, weights, nodes=None, x=None, y=None):
+    """
+    Graf networkx z krawędziami i wagami (atrybut 'weight'). Opcjonalnie nazwy wierzchołków (nodes)
+    i współrzędne zapisywane jako atrybut 'pos'.
+    """
+    edges = np.asarray(edges).reshape(-1, 2)
+    g = nx.Graph()
+    if nodes is not None:
+        nodes = np.asarray(nodes)
+        edges = nodes[edges]
+        g.add_nodes_from(nodes.tolist())
+    if x is not None:
+        labels = nodes.tolist() if nodes is not None else range(len(x))
+        g.add_nodes_from((v, {'pos': (px, py)}) for v, px, py in zip(labels, np.asarray(x).tolist(),
+                                                                     np.asarray(y).tolist()))
+    g.add_weighted_edges_from(zip(edges[:, 0].tolist(), edges[:, 1].tolist(), np.asarray(weights).tolist()))
+    return g
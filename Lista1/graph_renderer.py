@@ -0,0 +1,159 @@
+"""
+Szybkie rysowanie dużych grafów w matplotlib (zamiennik nx.draw_networkx_*).
+
+nx.draw_networkx_edges i nx.draw_networkx_edge_labels tworzą osobny obiekt (artystę) dla każdej etykiety,
+więc przy kilku tysiącach elementów rysowanie trwa minuty. Tutaj:
+- wszystkie krawędzie to jedna kolekcja odcinków (LineCollection), a wszystkie wierzchołki - jeden scatter,
+- etykiety (wierzchołków i krawędzi) rysowane są tylko dla elementów widocznych w oknie osi i tylko tyle,
+  by się nie nakładały; po przybliżeniu lub przesunięciu widoku wybór jest liczony ponownie,
+- export_graph zapisuje rysunek do PNG/SVG bez okna (Figure + FigureCanvasAgg, bez pyplot).
+"""
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+CHAR_WIDTH = 0.65  # szerokość znaku (z zapasem) jako ułamek rozmiaru czcionki
+LABEL_PAD = 0.5  # margines tła etykiety w punktach
+LINE_HEIGHT = 1.4  # wysokość etykiety (z marginesem) jako wielokrotność rozmiaru czcionki
+
+
+class GraphRenderer:
+    """
+    Graf narysowany na osiach ax: krawędzie (LineCollection), wierzchołki (scatter) i etykiety bez nakładania.
+
+    Args:
+        ax: Osie matplotlib.
+        x, y (np.array): Współrzędne wierzchołków.
+        edges (np.array): Krawędzie (E, 2) jako indeksy wierzchołków.
+        node_labels (sequence): Opcjonalne etykiety wierzchołków (None lub '' - bez etykiety).
+        edge_labels (sequence): Opcjonalne etykiety krawędzi w kolejności edges.
+        max_labels (int): Największa liczba etykiet widocznych naraz.
+    """
+
+    def __init__(self, ax, x, y, edges, node_labels=None, edge_labels=None, node_size=300, node_color='tab:blue',
+                 edge_color='black', edge_width=1.0, font_size=10, max_labels=500):
+        self.ax = ax
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        xy = np.column_stack((x, y))
+
+        self.edges = LineCollection(xy[edges], colors=edge_color, linewidths=edge_width, zorder=1)
+        ax.add_collection(self.edges)
+        self.nodes = ax.scatter(x, y, s=node_size, c=node_color, zorder=2)
+        ax.update_datalim(xy)
+        ax.autoscale_view()
+
+        # kandydaci na etykiety w kolejności pierwszeństwa: najpierw wierzchołki, potem środki krawędzi
+        positions, texts = [], []
+        for labels, where in ((node_labels, xy), (edge_labels, xy[edges].mean(axis=1) if len(edges) else xy[:0])):
+            if labels is None:
+                continue
+            labels = np.array(['' if label is None else str(label) for label in labels], dtype=object)
+            keep = labels != ''
+            positions.append(where[keep])
+            texts.append(labels[keep])
+        self.label_xy = np.concatenate(positions) if positions else np.empty((0, 2))
+        self.label_text = np.concatenate(texts) if texts else np.empty(0, dtype=object)
+        self.label_length = np.array([len(text) for text in self.label_text], dtype=float)
+        self.font_size = font_size
+        self.max_labels = max_labels
+        self._texts = []
+
+        # funkcje (a nie metody) są przechowywane przez matplotlib jako silne referencje
+        ax.callbacks.connect('xlim_changed', lambda _: self.update())
+        ax.callbacks.connect('ylim_changed', lambda _: self.update())
+        ax.figure.canvas.mpl_connect('resize_event', lambda _: self.update())
+        self.update()
+
+    def visible_labels(self):
+        """
+        Indeksy etykiet do narysowania: leżące w oknie osi i nienachodzące na etykiety o wyższym pierwszeństwie. \n
+        Dwie etykiety z tej samej komórki ekranu o rozmiarze najwęższej etykiety na pewno się nakładają, więc
+        z każdej takiej komórki zostaje najwyżej jedna (tablicowo). Pozostałe sprawdzane są zachłannie, ale tylko
+        z wybranymi już etykietami z sąsiednich komórek siatki o rozmiarze najszerszej etykiety - dalsze nie
+        mogą się nakładać.
+        """
+        if not self.label_text.size:
+            return np.empty(0, dtype=np.int64)
+        x_min, x_max = sorted(self.ax.get_xlim())
+        y_min, y_max = sorted(self.ax.get_ylim())
+        px, py = self.label_xy[:, 0], self.label_xy[:, 1]
+        inside = np.flatnonzero((px >= x_min) & (px <= x_max) & (py >= y_min) & (py <= y_max))
+        if not inside.size:
+            return inside
+
+        points_to_pixels = self.ax.figure.dpi / 72.0
+        width = (self.label_length[inside] * CHAR_WIDTH * self.font_size + 2 * LABEL_PAD) * points_to_pixels
+        height = LINE_HEIGHT * self.font_size * points_to_pixels
+        pixel = self.ax.transData.transform(self.label_xy[inside])
+        fine = np.floor(pixel / (width.min(), height)).astype(np.int64)
+        _, first = np.unique(fine[:, 0] * (1 << 32) + fine[:, 1], return_index=True)
+        first.sort()
+
+        coarse = np.floor(pixel / (width.max(), height)).astype(np.int64)
+        chosen, occupied = [], {}
+        for index in first.tolist():
+            cx, cy = coarse[index]
+            box = (pixel[index, 0], pixel[index, 1], width[index])
+            if any(abs(box[0] - other[0]) < (box[2] + other[2]) / 2 and abs(box[1] - other[1]) < height
+                   for dx in (-1, 0, 1) for dy in (-1, 0, 1) for other in occupied.get((cx + dx, cy + dy), ())):
+                continue
+            occupied.setdefault((cx, cy), []).append(box)
+            chosen.append(inside[index])
+            if len(chosen) >= self.max_labels:
+                break
+        return np.array(chosen, dtype=np.int64)
+
+    def update(self):
+        """Ponowny wybór etykiet (wywoływany przy zmianie zakresu osi lub rozmiaru okna)."""
+        chosen = self.visible_labels()
+        background = dict(facecolor='white', edgecolor='none', pad=LABEL_PAD)
+        while len(self._texts) < len(chosen):
+            self._texts.append(self.ax.text(0, 0, '', fontsize=self.font_size, ha='center', va='center', zorder=3,
+                                            clip_on=True, bbox=background))
+        for text, index in zip(self._texts, chosen.tolist()):
+            text.set_position(self.label_xy[index])
+            text.set_text(self.label_text[index])
+            text.set_visible(True)
+        for text in self._texts[len(chosen):]:
+            text.set_visible(False)
+
+
+def graph_arrays(G, pos, with_labels=True, edge_labels=None):
+    """
+    Tablice do rysowania grafu networkx: współrzędne wierzchołków z pos, krawędzie jako indeksy,
+    etykiety wierzchołków (nazwy) oraz etykiety krawędzi ze słownika {(u, v): etykieta}.
+
+    Returns:
+        tuple: (x, y, edges, node_labels, edge_labels)
+    """
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    xy = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+    edge_list = list(G.edges())
+    edges = np.array([(index[u], index[v]) for u, v in edge_list], dtype=np.int64).reshape(-1, 2)
+    node_labels = [str(node) for node in nodes] if with_labels else None
+    if edge_labels is not None:
+        edge_labels = [edge_labels.get((u, v), edge_labels.get((v, u))) for u, v in edge_list]
+    return xy[:, 0], xy[:, 1], edges, node_labels, edge_labels
+
+
+def draw_graph(ax, G, pos, with_labels=True, edge_labels=None, **kwargs):
+    """Odpowiednik nx.draw_networkx(G, pos) (z opcjonalnymi etykietami krawędzi) rysujący przez GraphRenderer."""
+    return GraphRenderer(ax, *graph_arrays(G, pos, with_labels, edge_labels), **kwargs)
+
+
+def export_graph(path, x, y, edges, figsize=(10, 10), dpi=100, **kwargs):
+    """
+    Zapis grafu do pliku (format z rozszerzenia, np. .png lub .svg) bez okna i bez pyplot. \n
+    Dodatkowe argumenty trafiają do GraphRenderer (etykiety, kolory, rozmiary).
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_axis_off()
+    GraphRenderer(ax, x, y, edges, **kwargs)
+    fig.savefig(path)
+    return path
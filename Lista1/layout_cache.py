@@ -0,0 +1,225 @@
+"""
+Powtarzalne, zapamiętywane na dysku i wznawiane rozmieszczenia wierzchołków grafu (układ sprężynowy).
+
+nx.spring_layout losuje położenia początkowe przy każdym uruchomieniu, a dla dużych grafów liczy odpychanie
+każdej pary wierzchołków (O(V²) na iterację). Tutaj:
+- ziarno generatora jest stałe, więc ten sam graf daje zawsze ten sam układ,
+- układ zapisywany jest w katalogu pamięci podręcznej pod odciskiem grafu (skrót wierzchołków i krawędzi),
+- po dodaniu wierzchołków lub krawędzi obliczenia mogą wystartować z poprzedniego układu podanego jawnie
+  (nowe wierzchołki obok swoich sąsiadów) i wykonać tylko kilka iteracji dopracowania w niskiej temperaturze;
+  taki układ zapisywany jest pod osobnym kluczem (z odciskiem układu startowego), więc wynik zależy tylko
+  od grafu, ziarna i podanego układu startowego - nigdy od tego, co liczono wcześniej w tym katalogu,
+- odpychanie bliskich par liczone jest dokładnie (siatka przestrzenna z geometric_graph), a dalekich
+  przez FFT na siatce, więc iteracja kosztuje O(V + E) zamiast O(V²).
+"""
+import hashlib
+import os
+
+import networkx as nx
+import numpy as np
+
+from geometric_graph import cell_pairs
+
+CACHE_DIR = '.layout_cache'
+EXACT_REPULSION_NODES = 2000  # do tylu wierzchołków odpychanie liczone jest dokładnie dla wszystkich par
+
+
+def graph_fingerprint(G):
+    """Odcisk grafu (SHA-1) niezależny od kolejności dodawania wierzchołków i krawędzi."""
+    digest = hashlib.sha1()
+    digest.update(('directed' if G.is_directed() else 'undirected').encode())
+    for node in sorted(map(repr, G.nodes())):
+        digest.update(node.encode() + b'\0')
+    edges = ((repr(u), repr(v)) for u, v in G.edges())
+    if not G.is_directed():
+        edges = (tuple(sorted(edge)) for edge in edges)
+    for u, v in sorted(edges):
+        digest.update(u.encode() + b'\1' + v.encode() + b'\0')
+    return digest.hexdigest()
+
+
+def layout_fingerprint(nodes, positions):
+    """Odcisk (SHA-1) układu startowego: położenia podanych wierzchołków w ustalonej kolejności."""
+    digest = hashlib.sha1()
+    for key, node in sorted((repr(node), node) for node in nodes):
+        digest.update(key.encode() + b'\0' + np.asarray(positions[node], dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def _mesh_repulsion(pos, k, n_cells, near_cells=1):
+    """
+    Dalekozasięgowe odpychanie k²/d liczone na siatce (metoda cząstka-siatka): liczba wierzchołków w komórkach
+    splatana jest przez FFT z jądrem siły, a każdy wierzchołek odczytuje siłę swojej komórki. Jądro jest zerowe
+    dla komórek odległych o co najwyżej near_cells - bliskie pary liczone są dokładnie.
+
+    Returns:
+        tuple: (force (V, 2), cell_size)
+    """
+    low = pos.min(axis=0)
+    cell_size = max(np.ptp(pos, axis=0).max(), 1e-9) * (1 + 1e-9) / n_cells
+    cell = np.minimum(((pos - low) // cell_size).astype(np.int64), n_cells - 1)
+    counts = np.zeros((2 * n_cells, 2 * n_cells))
+    np.add.at(counts, (cell[:, 0], cell[:, 1]), 1.0)
+
+    # jądro siły na siatce przesunięć [-M, M) (układ zawinięty dla splotu cyklicznego bez nakładania)
+    offset = np.fft.fftfreq(2 * n_cells, 1.0 / (2 * n_cells))
+    ox, oy = np.meshgrid(offset, offset, indexing='ij')
+    scale = (ox**2 + oy**2) * cell_size  # |o|²·h, bo k²·(o·h)/|o·h|² = k²·o/(|o|²·h)
+    far = np.maximum(np.abs(ox), np.abs(oy)) > near_cells
+    spectrum = np.fft.rfft2(counts)
+    force = np.empty_like(pos)
+    for axis, o in enumerate((ox, oy)):
+        kernel = np.where(far, k * k * o / np.where(far, scale, 1.0), 0.0)
+        field = np.fft.irfft2(spectrum * np.fft.rfft2(kernel), counts.shape)
+        force[:, axis] = field[cell[:, 0], cell[:, 1]]
+    return force, cell_size
+
+
+def force_layout(edges, pos, iterations=50, temperature=0.2, near_cells=1):
+    """
+    Algorytm Fruchtermana-Reingolda na tablicach. \n
+    Przyciąganie d²/k wzdłuż krawędzi i odpychanie k²/d, gdzie k to odległość optymalna dla kwadratu [-1, 1]²;
+    dla grafów większych niż EXACT_REPULSION_NODES odpychanie bliskich par (do near_cells komórek) liczone jest
+    dokładnie, a dalekie - na siatce przez FFT (_mesh_repulsion), więc iteracja kosztuje O(V + E + M² log M)
+    zamiast O(V²). Przesunięcie w iteracji ograniczone jest temperaturą malejącą liniowo do zera.
+
+    Args:
+        edges (np.array): Krawędzie (E, 2) jako indeksy wierzchołków.
+        pos (np.array): Położenia początkowe (V, 2) - modyfikowane w miejscu.
+
+    Returns:
+        np.array: Położenia (V, 2).
+    """
+    n = len(pos)
+    if n < 2:
+        return pos
+    k = 2.0 / np.sqrt(n)
+    n_cells = int(np.clip(np.sqrt(n / 2), 4, 256))
+    a, b = edges[:, 0], edges[:, 1]
+    step = temperature / iterations
+    exact = n <= EXACT_REPULSION_NODES
+    if exact:
+        i, j = np.triu_indices(n, 1)
+    for iteration in range(iterations):
+        if exact:
+            displacement = np.zeros_like(pos)
+            distance = np.hypot(pos[i, 0] - pos[j, 0], pos[i, 1] - pos[j, 1])
+        else:
+            displacement, cell_size = _mesh_repulsion(pos, k, n_cells, near_cells)
+            # dokładne odpychanie dokładnie tych par, które jądro siatki pomija: komórki odległe o co najwyżej
+            # near_cells w każdej osi (siatka przestrzenna z geometric_graph, ten sam początek i bok komórki)
+            pairs, distance = cell_pairs(pos[:, 0], pos[:, 1], cell_size, near_cells)
+            i, j = pairs[:, 0], pairs[:, 1]
+        force = (pos[i] - pos[j]) * (k * k / np.maximum(distance, 0.01 * k)**2)[:, np.newaxis]
+
+        # przyciąganie wzdłuż krawędzi
+        edge_delta = pos[a] - pos[b]
+        edge_force = edge_delta * (np.hypot(edge_delta[:, 0], edge_delta[:, 1]) / k)[:, np.newaxis]
+
+        for axis in range(2):
+            displacement[:, axis] += (np.bincount(i, force[:, axis], n) - np.bincount(j, force[:, axis], n)
+                                      - np.bincount(a, edge_force[:, axis], n) + np.bincount(b, edge_force[:, axis], n))
+        length = np.maximum(np.hypot(displacement[:, 0], displacement[:, 1]), 1e-12)
+        limit = temperature - iteration * step
+        pos += displacement * (np.minimum(length, limit) / length)[:, np.newaxis]
+    return pos
+
+
+class LayoutCache:
+    """
+    Usługa rozmieszczania wierzchołków: układ z pamięci podręcznej (dysk) albo obliczony - od zera lub
+    ze startem od układu previous podanego jawnie (np. cache.previous - ostatni układ tej usługi).
+    Bez previous wynik zależy tylko od grafu, ziarna i liczby iteracji.
+
+    Args:
+        directory (str): Katalog pamięci podręcznej (None - bez zapisu na dysk).
+        seed (int): Ziarno położeń początkowych.
+        iterations (int): Liczba iteracji układu liczonego od zera.
+        refine_iterations (int): Liczba iteracji dopracowania przy starcie od poprzedniego układu.
+    """
+
+    def __init__(self, directory=CACHE_DIR, seed=0, iterations=50, refine_iterations=10):
+        self.directory = directory
+        self.seed = seed
+        self.iterations = iterations
+        self.refine_iterations = refine_iterations
+        self.previous = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, fingerprint, warm_start=None):
+        """Plik układu; układ dopracowany ze startu od innego układu ma w nazwie odcisk układu startowego."""
+        name = f'{fingerprint}-s{self.seed}-i{self.iterations}'
+        if warm_start is not None:
+            name += f'-w{warm_start}-r{self.refine_iterations}'
+        return os.path.join(self.directory, name + '.npz')
+
+    def layout(self, G, previous=None):
+        """
+        Słownik położeń {wierzchołek: np.array([x, y])} dla grafu G.
+
+        Args:
+            G (nx.Graph): Graf.
+            previous (dict): Układ startowy {wierzchołek: położenie}; używane są położenia wierzchołków
+                obecnych w G, pozostałe są pomijane. None (lub brak wspólnych wierzchołków) - układ od zera.
+        """
+        nodes = list(G.nodes())
+        known = np.array([node in previous for node in nodes], dtype=bool) if previous else np.zeros(len(nodes), bool)
+        warm_start = layout_fingerprint([node for node in nodes if node in previous], previous) if known.any() else None
+        path = self._path(graph_fingerprint(G), warm_start) if self.directory else None
+        if path and os.path.exists(path):
+            pos = _load(path)
+            if all(repr(node) in pos for node in nodes):
+                self.previous = {node: pos[repr(node)] for node in nodes}
+                return self.previous
+
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = np.array([(index[u], index[v]) for u, v in G.edges() if u != v], dtype=np.int64).reshape(-1, 2)
+        rng = np.random.default_rng(self.seed)
+
+        if warm_start is not None:
+            pos = self._warm_start(G, nodes, index, previous, known, rng)
+            pos = force_layout(edges, pos, self.refine_iterations, temperature=2.0 / np.sqrt(len(nodes)))
+        else:
+            pos = rng.uniform(-1, 1, (len(nodes), 2))
+            pos = force_layout(edges, pos, self.iterations)
+
+        self.previous = {node: pos[i] for node, i in index.items()}
+        if path:
+            _save(path, nodes, pos)
+        return self.previous
+
+    @staticmethod
+    def _warm_start(G, nodes, index, base, known, rng):
+        """Położenia znanych wierzchołków z base; nowe - średnia znanych sąsiadów z małym przesunięciem."""
+        pos = np.zeros((len(nodes), 2))
+        pos[known] = [base[node] for node, is_known in zip(nodes, known) if is_known]
+        jitter = 0.1 * 2.0 / np.sqrt(len(nodes))
+        placed = known.copy()
+        # nowe wierzchołki dokładane falami: najpierw sąsiedzi już rozmieszczonych
+        while not placed.all():
+            progress = False
+            for node in (node for node, is_placed in zip(nodes, placed) if not is_placed):
+                neighbours = [index[v] for v in nx.all_neighbors(G, node) if placed[index[v]]]
+                if neighbours:
+                    pos[index[node]] = pos[neighbours].mean(axis=0) + rng.normal(0, jitter, 2)
+                    placed[index[node]] = progress = True
+            if not progress:
+                rest = ~placed
+                pos[rest] = rng.uniform(pos[placed].min(axis=0), pos[placed].max(axis=0), (rest.sum(), 2))
+                placed[:] = True
+        return pos
+
+
+def _save(path, nodes, pos):
+    np.savez(path, nodes=np.array([repr(node) for node in nodes]), pos=pos)
+
+
+def _load(path):
+    with np.load(path) as data:
+        return dict(zip(data['nodes'].tolist(), data['pos']))
+
+
+def cached_spring_layout(G, directory=CACHE_DIR, seed=0, iterations=50):
+    """Jednorazowe wywołanie LayoutCache - zamiennik nx.spring_layout(G) z powtarzalnym wynikiem."""
+    return LayoutCache(directory, seed, iterations).layout(G)
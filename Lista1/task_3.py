@@ -8,6 +8,12 @@ import networkx as nx
 # dalej można z niej korzystać w kodzie pod nazwą ’plt’
 import matplotlib.pyplot as plt
 
+# powtarzalny układ sprężynowy zapamiętywany na dysku (layout_cache.py)
+from layout_cache import cached_spring_layout
+
+# rysowanie grafu jedną kolekcją krawędzi i jednym scatterem wierzchołków (graph_renderer.py)
+from graph_renderer import draw_graph
+
 # utwórz obiekt reprezentujący graf ’nx.Graph()’
 # przypisz go do zmiennej ’G’
 G = nx.Graph()
@@ -22,20 +28,16 @@ G.add_edge('C', 'D')
 
 # wybierz typ układu wierzchołków ’spring_layout’
 # przypisz go do zmiennej ’pos’
-pos = nx.spring_layout(G)  # dlaczego przy każdym uruchomieniu otrzymujemy inne rozmieszczenie?
+# nx.spring_layout(G) losuje położenia początkowe przy każdym uruchomieniu, dlatego rozmieszczenie było
+# za każdym razem inne; tutaj ziarno jest stałe, a gotowy układ wczytywany jest z katalogu .layout_cache
+pos = cached_spring_layout(G, seed=0)
 
-# wyświetl wierzchołki
+# wyświetl wierzchołki, ich etykiety i krawędzie grafu
 # wierzchołki są w pozycjach zadanych przez ’pos’
 # wierzchołki mają rozmiar ’500’
-nx.draw_networkx_nodes(G, pos, node_size=500)
-
-# wyświetl etykiety wierzchołków
-# etykiety są w pozycjach zadanych przez ’pos’
-nx.draw_networkx_labels(G, pos)
-
-# wyświetl krawędzie grafu
-# wierzchołki są w pozycjach zadanych przez ’pos’
-nx.draw_networkx_edges(G, pos)
+# (zamiast nx.draw_networkx_nodes, nx.draw_networkx_labels i nx.draw_networkx_edges - przy dużych grafach
+# każda etykieta to osobny obiekt; tutaj rysowane są tylko etykiety widoczne i nienachodzące na siebie)
+draw_graph(plt.gca(), G, pos, node_size=500)
 
 # wyświetl graf
 plt.show()
@@ -1,9 +1,12 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 
-# do operacji pierwiastkowania
+# do operacji na tablicach
 import numpy as np
 
+from geometric_graph import edge_weights, edges_from_labels, to_networkx
+from graph_renderer import draw_graph
+
 G = nx.Graph()  # czy potrzebne? NIE, bo nie korzystamy w ogóle z tego grafu, tylko z małego g (niżej)
 
 # nazwy wierzchołków
@@ -16,40 +19,30 @@ WW = [(1, 2), (2, 3), (3, 4), (4, 5), (1, 3), (3, 5)]
 Vx = {1: -5, 2: 1, 3: 2, 4: 3, 5: 4}
 Vy = {1: 0, 2: 1, 3: 0, 4: -1, 5: 0}
 
-g = nx.Graph()  # o z tego
-
-# pusty słownik
-gpos = {}
-
-# wypełnienie słownika wierzchołkami
-# pętla for przechodzi przez wszystkie elementy ’VV’
-for v in VV:
-    g.add_node(v)
-    gpos[v] = [Vx[v], Vy[v]]
+# tablice współrzędnych (w kolejności VV) i krawędzie jako pary indeksów wierzchołków
+x = np.array([Vx[v] for v in VV], dtype=float)
+y = np.array([Vy[v] for v in VV], dtype=float)
+edges = edges_from_labels(VV, WW)
 
-# zagnieżdżone pętle for
-for v1 in VV:
-    for v2 in VV:
-        # sprawdzenie czy krawędź istnieje w ’WW’
-        if (v1, v2) in WW:
-            # jeśli istnieje, to ustaw etykietę na odległość euklidesową
-            # funkcja ’str’ zwraca ciąg znaków
-            # funkcja ’np.sqrt’ zwraca pierwiastek
-            # symbol ’**’ oznacza potęgowanie
+# odległości euklidesowe wszystkich krawędzi jedną operacją na tablicach (zamiast pętli po VV × VV)
+weights = edge_weights(x, y, edges)
 
-            label = str(np.sqrt((Vx[v1] - Vx[v2]) ** 2 + (Vy[v1] - Vy[v2]) ** 2))
-            # label = str(round(np.sqrt((Vx[v1] - Vx[v2]) ** 2 + (Vy[v1] - Vy[v2]) ** 2), ndigits=2)) <- zaokr
+# graf o z tego - wierzchołki, krawędzie i wagi dodawane naraz
+g = to_networkx(edges, weights, nodes=VV)
 
-            # dodaj wagi do krawędzi
-            g.add_weighted_edges_from([(v1, v2, label)])
-
-# wyświetl żółte wierzchołki z etykietami w ustalonych wcześniej pozycjach
-nx.draw(g, gpos, with_labels=True, node_color='yellow')
-# nx.draw(g, gpos, with_labels=True, node_color='yellow', node_size=2000) <- większy rozmiar wierzchołków
-
-# pobierz i wyświetl etykiety
-labels = nx.get_edge_attributes(g, 'weight')
-nx.draw_networkx_edge_labels(g, gpos, edge_labels=labels)
+# słownik, pozycje wierzchołków
+gpos = {v: [Vx[v], Vy[v]] for v in VV}
+
+# etykieta krawędzi to odległość euklidesowa zapisana jako ciąg znaków (funkcja ’str’)
+# label = str(round(weight, ndigits=2)) <- zaokr
+labels = {(VV[i], VV[j]): str(weight) for (i, j), weight in zip(edges.tolist(), weights.tolist())}
+
+# wyświetl żółte wierzchołki z etykietami w ustalonych wcześniej pozycjach oraz etykiety krawędzi
+# (jedna kolekcja krawędzi i jeden scatter wierzchołków zamiast nx.draw + nx.draw_networkx_edge_labels)
+ax = plt.gca()
+draw_graph(ax, g, gpos, edge_labels=labels, node_color='yellow')
+# draw_graph(ax, g, gpos, edge_labels=labels, node_color='yellow', node_size=2000) <- większy rozmiar wierzchołków
+ax.set_axis_off()
 
 # wyświetl graf
 plt.show()
@@ -1,5 +1,11 @@
 import matplotlib.pyplot as plt
-import numpy as np
+
+# wyrażenia użytkownika kompilowane do funkcji numpy i próbkowanie adaptacyjne (expression_plot.py)
+from expression_plot import compile_expression, plot_expression, split_expressions
+
+# funkcje z menu (numer -> wyrażenie, kolor); własne wyrażenia dostają kolejne kolory z cyklu matplotlib
+PRESETS = {1: ('x', None), 2: ('sin(x)', 'blue'), 3: ('cos(x)', 'brown'), 4: ('x^3', 'green')}
+Y_LIMITS = [-2, 20]  # dla czytelniejszego wykresu
 
 # pytanie o przedział x
 while True:
@@ -13,7 +19,9 @@ while True:
     except ValueError:
         print("Niepoprawny format. Spróbuj ponownie.")
 
-x = np.linspace(x_start, x_end, 100)  # wygładzenie: 10 -> 100 punktów
+# zamiast stałej siatki x = np.linspace(x_start, x_end, 100) punkty dobierane są adaptacyjnie: gęsto tam,
+# gdzie wykres się zagina, rzadko na płaskich fragmentach (najwyżej MAX_POINTS wartości na funkcję)
+MAX_POINTS = 2000
 
 # pytanie o kolor wykresu
 plot_color = input("Podaj kolor 1 wykresu (np. red, blue, green): ")
@@ -24,47 +32,48 @@ print("1 - y=x")
 print("2 - y=sin(x)")
 print("3 - y=cos(x)")
 print("4 - y=x^3")
-print("Numery funkcji oddziel przecinkami (np. 1,3):")
+print("albo wpisz własne wyrażenie zmiennej x, np. sin(x)/x, exp(-x^2)*cos(5*x), sqrt(abs(x))")
+print("Numery funkcji i wyrażenia oddziel przecinkami (np. 1,3,x^2-1):")
 
 while True:
-    choices = input().replace(" ", "").split(',')  # usunięcie spacji i rozdzielenie po przecinkach
-    function_choices = []
+    choices = split_expressions(input())  # rozdzielenie po przecinkach spoza nawiasów
+    expressions = []
     valid_choices = True
     for choice_str in choices:
-        try:
+        if choice_str.isdigit():
             choice = int(choice_str)
-            if 1 <= choice <= 4:
-                function_choices.append(choice)
+            if choice in PRESETS:
+                expressions.append(PRESETS[choice])
             else:
                 print("Wybrano numer funkcji spoza zakresu. Spróbuj ponownie.")
                 valid_choices = False
                 break
-        except ValueError:
-            print("Niepoprawny format. Spróbuj ponownie.")
-            valid_choices = False
-            break
-    if valid_choices and function_choices:  # sprawdzamy, czy lista nie jest pusta i numery są poprawne
+        else:
+            try:
+                compile_expression(choice_str)  # wyrażenie parsowane raz - wynik zapamiętany do rysowania
+                expressions.append((choice_str, None))
+            except ValueError as error:
+                print(f"{error}. Spróbuj ponownie.")
+                valid_choices = False
+                break
+    if valid_choices and expressions:  # sprawdzamy, czy lista nie jest pusta i wybory są poprawne
         break
     elif not valid_choices:
         continue
     else:
-        print("Nie wybrano żadnej funkcji. Wybierz przynajmniej jedną funkcję z listy (1, 2, 3 lub 4).")
+        print("Nie wybrano żadnej funkcji. Wybierz przynajmniej jedną funkcję z listy lub wpisz wyrażenie.")
 
 _, ax = plt.subplots(figsize=(10, 5))
 
-# wyświetlenie wybranych funkcji
-if 1 in function_choices:
-    ax.plot(x, x, color=plot_color, label='$y=x$')
-if 2 in function_choices:
-    ax.plot(x, np.sin(x), color='blue', label=r'$y=\sin(x)$')
-if 3 in function_choices:
-    ax.plot(x, np.cos(x), color='brown', label=r'$y=\cos(x)$')  # funkcja cos(x)
-if 4 in function_choices:
-    ax.plot(x, x ** 3, color='green', label='$y=x^3$')  # funkcja x^3
+# wyświetlenie wybranych funkcji (pierwsza funkcja z menu, y=x, w kolorze podanym przez użytkownika)
+for text, color in expressions:
+    if text == 'x':
+        color = plot_color
+    plot_expression(ax, text, x_start, x_end, max_points=MAX_POINTS, y_range=Y_LIMITS, color=color)
 
 ax.set_xlabel('x')
 ax.set_ylabel('y')
-ax.set_ylim([-2, 20])  # dla czytelniejszego wykresu
+ax.set_ylim(Y_LIMITS)
 ax.set_title("Wykres")
 ax.legend()
 
@@ -0,0 +1,298 @@
+"""
+Łańcuchy i sieci rozpadu promieniotwórczego (rozszerzenie zadania 4).
+
+Sieć rozpadu to lista izotopów z okresami połowicznego rozpadu oraz gałęzie rodzic → pochodny z udziałem
+(frakcją) rozpadu. Liczby jąder spełniają układ liniowy N'(t) = A N(t), gdzie A[i, i] = -λᵢ,
+a A[d, p] = b·λₚ dla gałęzi p → d z frakcją b. Przy kolejności izotopów rodzic przed pochodnym macierz A
+jest dolnotrójkątna.
+
+Rozwiązanie liczone jest tablicowo dla całej siatki czasu i wielu inwentarzy początkowych naraz:
+- metodą Batemana (rozkład A = V diag(-λ) V⁻¹, N(t) = V e^{-λt} V⁻¹ N₀ - jedno mnożenie macierzy dla
+  wszystkich chwil), gdy macierz wektorów własnych V jest dobrze uwarunkowana,
+- eksponentą macierzy, gdy okresy połowicznego rozpadu są bliskie lub równe - wzór Batemana dzieli wtedy
+  przez λₖ - λᵢ ≈ 0, a w długim łańcuchu takie ilorazy się mnożą. Pętla nie biegnie po chwilach siatki:
+  dla siatki równomiernej bloki stanów są podwajane potęgami Φ^(2^j) macierzy przejścia Φ = e^{AΔt},
+  a dla dowolnej siatki każde N(tₖ) = e^{A tₖ} N₀ składane jest ze stanu w najbliższej wcześniejszej kotwicy
+  (siatka równomierna), potęg e^{Aδ·2^j} dla bitów przesunięcia i reszty < δ liczonej szeregiem Taylora -
+  wszystkie chwile naraz, bez osobnego expm dla każdego Δt.
+"""
+import os
+import sys
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+# eksponenta macierzy wspólna z dyskretyzacją ZOH z Listy 3 (katalog dopisywany na końcu sys.path, więc
+# sąsiednie task_*.py z Listy 2 mają pierwszeństwo)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Lista3'))
+from matrix_exponential import expm
+
+# największy współczynnik uwarunkowania macierzy wektorów własnych V dla wzoru Batemana - błąd wyniku rośnie
+# z cond(V), a uwarunkowanie narasta wzdłuż łańcucha z iloczynem 1/(λₖ - λᵢ); przy 1e8 błąd względny
+# pozostaje rzędu 1e-11 (powyżej - propagacja eksponentą macierzy)
+BATEMAN_MAX_CONDITION = 1e8
+# krok bazowy δ siatki binarnej to potęga dwójki z ||A||·δ <= BINARY_STEP_NORM - reszta e^{A r} N₀ (r < δ)
+# liczona jest szeregiem Taylora, którego wyrazy maleją jak BINARY_STEP_NORM^m / m!
+BINARY_STEP_NORM = 2.0**-4
+COLUMN_BLOCK = 2048  # liczba kolumn (chwila x inwentarz) przetwarzanych razem w _propagate_binary
+
+
+class DecayNetwork:
+    """
+    Sieć rozpadu: okresy połowicznego rozpadu izotopów i gałęzie rodzic → pochodny.
+
+    Args:
+        half_lives (sequence): Okresy połowicznego rozpadu (np.inf dla izotopu trwałego).
+        branches (sequence): Krotki (rodzic, pochodny) lub (rodzic, pochodny, frakcja) - indeksy lub nazwy;
+            rodzic musi poprzedzać pochodny na liście izotopów.
+        names (sequence): Opcjonalne nazwy izotopów.
+        molar_masses (sequence): Opcjonalne masy molowe - wtedy evaluate przyjmuje i zwraca masy zamiast
+            liczby jąder (przeliczenie m = N·M).
+    """
+
+    def __init__(self, half_lives, branches=(), names=None, molar_masses=None):
+        half_lives = np.asarray(half_lives, dtype=float)
+        self.n_species = len(half_lives)
+        self.names = list(names) if names is not None else [f'N{i + 1}' for i in range(self.n_species)]
+        self.lambdas = np.log(2) / half_lives  # okres nieskończony -> λ = 0
+        self.molar_masses = None if molar_masses is None else np.asarray(molar_masses, dtype=float)
+
+        self.matrix = np.diag(-self.lambdas)
+        for branch in branches:
+            parent, daughter = (self._index(species) for species in branch[:2])
+            fraction = branch[2] if len(branch) > 2 else 1.0
+            if daughter <= parent:
+                raise ValueError(f"Izotop {self.names[parent]} musi poprzedzać na liście swój pochodny "
+                                 f"{self.names[daughter]}")
+            self.matrix[daughter, parent] += fraction * self.lambdas[parent]
+        self._eigenvectors = self._bateman_eigenvectors()
+
+    def _index(self, species):
+        return self.names.index(species) if isinstance(species, str) else int(species)
+
+    def _bateman_eigenvectors(self):
+        """
+        Wektory własne dolnotrójkątnej macierzy A (podstawianie w przód) albo None, gdy sprzężone izotopy mają
+        równe stałe rozpadu lub rozkład jest źle uwarunkowany (cond(V) > BATEMAN_MAX_CONDITION) - bliskie
+        okresy połowicznego rozpadu wzdłuż łańcucha kumulują się, więc sama różnica λ w parze nie wystarcza.
+        """
+        A = self.matrix
+        V = np.eye(self.n_species)
+        for i in range(self.n_species):
+            for k in range(i + 1, self.n_species):
+                coupling = A[k, i:k] @ V[i:k, i]
+                if coupling == 0:
+                    continue
+                gap = self.lambdas[k] - self.lambdas[i]
+                if gap == 0:
+                    return None
+                V[k, i] = coupling / gap
+        with np.errstate(over='ignore', invalid='ignore'):
+            condition = np.linalg.cond(V) if np.all(np.isfinite(V)) else np.inf
+        return V if condition <= BATEMAN_MAX_CONDITION else None
+
+    @property
+    def uses_bateman(self):
+        """Czy evaluate używa wzoru Batemana (True), czy propagacji eksponentą macierzy (False)."""
+        return self._eigenvectors is not None
+
+    def evaluate(self, t, n0):
+        """
+        Inwentarze wszystkich izotopów na siatce czasu, dla jednego lub wielu inwentarzy początkowych.
+
+        Args:
+            t (np.array): Niemalejąca siatka czasu (t >= 0), w jednostkach okresów połowicznego rozpadu.
+            n0 (np.array): Inwentarz początkowy (n_species,) lub partia inwentarzy (n_batch, n_species).
+
+        Returns:
+            np.array: Tablica (K, n_species) lub (n_batch, K, n_species) dla K chwil siatki.
+        """
+        t = np.asarray(t, dtype=float)
+        n0 = np.asarray(n0, dtype=float)
+        batch = n0.reshape(-1, self.n_species)
+        if self.molar_masses is not None:
+            batch = batch / self.molar_masses
+        if t.size and (t[0] < 0 or np.any(np.diff(t) < 0)):
+            raise ValueError("Siatka czasu musi być niemalejąca i zaczynać się od t >= 0")
+
+        if self.uses_bateman:
+            inventory = self._evaluate_bateman(t, batch)
+        else:
+            inventory = self._evaluate_expm(t, batch)
+
+        if self.molar_masses is not None:
+            inventory = inventory * self.molar_masses
+        return inventory.reshape(n0.shape[:-1] + (len(t), self.n_species))
+
+    def _evaluate_bateman(self, t, batch):
+        # współczynniki przy e^{-λᵢt} dla każdego inwentarza, a potem wszystkie chwile jednym iloczynem
+        V = self._eigenvectors
+        weights = np.linalg.solve(V, batch.T)  # (n_species, n_batch)
+        exponentials = np.exp(-np.outer(t, self.lambdas))  # (K, n_species)
+        return np.einsum('ki,ib,si->bks', exponentials, weights, V, optimize=True)
+
+    def _evaluate_expm(self, t, batch):
+        # stany jako kolumny macierzy (n_species, K·n_batch) - kolumny chwili k to [k·n_batch, (k + 1)·n_batch);
+        # przy większej liczbie inwentarzy niż izotopów taniej propagować kolumny macierzy jednostkowej
+        # (macierze e^{A tₖ}) i pomnożyć przez inwentarze na końcu
+        if not len(t):
+            return np.empty((len(batch), 0, self.n_species))
+        by_matrix = len(batch) > self.n_species
+        propagated = np.eye(self.n_species) if by_matrix else batch.T
+        steps = np.diff(t)
+        if len(t) > 2 and np.allclose(steps, steps[0], rtol=1e-9, atol=0):
+            states = self._propagate_uniform(t[0], steps[0], len(t), propagated)
+        else:
+            states = self._propagate_binary(t, propagated)
+        states = states.reshape(self.n_species, len(t), propagated.shape[1]).transpose(2, 1, 0)
+        # states[j, k, i] to element (i, j) e^{A tₖ}, gdy propagowana była macierz jednostkowa
+        return np.tensordot(batch, states, axes=(1, 0)) if by_matrix else states
+
+    def _propagate_uniform(self, t0, dt, n_points, state0):
+        """
+        Stany N(t0 + k·dt) dla k < n_points. Pierwsze m chwil jest już policzonych, więc następne m to jeden
+        iloczyn Φ^m z nimi (Φ = e^{A dt}, m = 1, 2, 4, ...) - log₂ n_points dużych mnożeń zamiast pętli po chwilach.
+        """
+        n_batch = state0.shape[1]
+        states = np.empty((self.n_species, n_points * n_batch))
+        states[:, :n_batch] = self._transition(t0) @ state0 if t0 > 0 else state0
+        power = self._transition(dt)
+        filled = 1
+        while filled < n_points:
+            block = min(filled, n_points - filled)
+            states[:, filled * n_batch:(filled + block) * n_batch] = power @ states[:, :block * n_batch]
+            filled += block
+            if filled < n_points:
+                power = self._square(power, filled * dt)
+        return states
+
+    def _propagate_binary(self, t, state0):
+        """
+        Stany N(tₖ) = e^{A tₖ} N₀ dla dowolnej (niemalejącej) siatki t, wszystkie chwile naraz. tₖ = mₖδ + rₖ, a mₖ
+        dzielone jest na kotwicę (mₖ >> b) i przesunięcie (b młodszych bitów): stany w kotwicach co 2^b·δ liczy
+        _propagate_uniform (b tak, by kotwic było najwyżej tyle co chwil), przesunięcie to mnożenia przez
+        e^{Aδ·2^j} kolumn chwil z ustawionym bitem j, a reszta e^{A rₖ} to szereg Taylora.
+        """
+        A = self.matrix
+        n_batch = state0.shape[1]
+        norm = np.linalg.norm(A, np.inf)
+        if norm == 0:
+            return np.tile(state0, len(t))
+        delta = 2.0**np.floor(np.log2(BINARY_STEP_NORM / norm))
+        multiples = np.floor(t / delta)  # dokładne, bo δ to potęga dwójki (liczby całkowite jako float)
+        remainder = np.repeat(t - multiples * delta, n_batch)
+
+        # kotwice (siatka równomierna), kolumna stanu kotwicy i przesunięcie dla każdej kolumny wyniku
+        offset_bits = max(0, int(np.ceil(np.log2((multiples[-1] + 1) / len(t)))))
+        anchor = np.floor(multiples / 2.0**offset_bits)
+        offset = np.repeat((multiples - anchor * 2.0**offset_bits).astype(np.int64), n_batch)
+        anchors = self._propagate_uniform(0.0, delta * 2.0**offset_bits, int(anchor[-1]) + 1, state0)
+        source = (anchor.astype(np.int64)[:, None] * n_batch + np.arange(n_batch)).ravel()
+        # potęgi e^{Aδ·2^j} dla bitów przesunięcia (podnoszenie do kwadratu)
+        powers = [self._transition(delta)]
+        for bit in range(1, offset_bits):
+            powers.append(self._square(powers[-1], delta * 2.0**bit))
+
+        # reszta: Σ (A rₖ)^m / m! do wyrazu poniżej dokładności double
+        n_terms = 0
+        bound = 1.0  # ograniczenie ||A rₖ||^m / m! wyrazu m
+        while bound > np.finfo(float).eps / 16:
+            n_terms += 1
+            bound *= norm * delta / n_terms
+
+        # kolumnami w blokach mieszczących się w pamięci podręcznej - każdy krok to kilka przejść po bloku
+        states = np.empty((self.n_species, len(source)))
+        for start in range(0, len(source), COLUMN_BLOCK):
+            columns = slice(start, start + COLUMN_BLOCK)
+            block = anchors[:, source[columns]]
+            for bit, power in enumerate(powers):
+                selected = (offset[columns] >> bit) & 1 == 1
+                block[:, selected] = power @ block[:, selected]
+            scale = remainder[columns]
+            term = block
+            for m in range(1, n_terms + 1):
+                term = A @ term
+                term *= scale / m
+                block += term
+            states[:, columns] = block
+        return states
+
+    def _transition(self, dt):
+        """
+        Macierz przejścia e^{A dt}: expm dla kroku dt / 2^s z ||A||·dt / 2^s <= 1/2 i s kwadratów _square
+        (skalowanie i potęgowanie jak w expm, ale z dokładną przekątną e^{-λ dt} po każdym kwadracie).
+        """
+        norm = np.linalg.norm(self.matrix, np.inf) * dt
+        n_squarings = max(0, int(np.ceil(np.log2(norm / 0.5)))) if norm > 0 else 0
+        power = expm(self.matrix * (dt / 2.0**n_squarings))
+        np.fill_diagonal(power, np.exp(-self.lambdas * (dt / 2.0**n_squarings)))
+        for squaring in range(n_squarings - 1, -1, -1):
+            power = self._square(power, dt / 2.0**squaring)
+        return power
+
+    def _square(self, power, dt):
+        """
+        Kwadrat macierzy przejścia - wynik e^{A dt}. Przekątna jest wpisywana dokładnie: przy wielu kwadratach
+        jej błąd zaokrąglenia podwajałby się za każdym razem (dla izotopów długożyciowych po 40 kwadratach
+        błąd względny 2⁴⁰·ε), a przez nią także błąd elementów pod przekątną.
+        """
+        power = power @ power
+        np.fill_diagonal(power, np.exp(-self.lambdas * dt))
+        return power
+
+
+def decay_chain(half_lives, names=None, molar_masses=None):
+    """Liniowy łańcuch rozpadu N₁ → N₂ → ... → Nₙ (każdy izotop rozpada się w całości na następny)."""
+    branches = [(i, i + 1) for i in range(len(half_lives) - 1)]
+    return DecayNetwork(half_lives, branches, names, molar_masses)
+
+
+def plot_inventory(t, inventory, names, log_scale=False):
+    """Wykres inwentarzy wszystkich izotopów w czasie (jedna linia na izotop)."""
+    fig = plt.figure(figsize=(10, 6))
+    lines = plt.plot(t, inventory)
+    for line, name in zip(lines, names):
+        line.set_label(name)
+    if log_scale:
+        plt.yscale('log')
+    plt.title('Łańcuch rozpadu promieniotwórczego')
+    plt.xlabel('Czas')
+    plt.ylabel('Inwentarz')
+    plt.legend()
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.tight_layout()
+    return fig
+
+
+def run_scenario(params):
+    """
+    Uruchomienie bez pytań input() - parametry ze scenariusza: half_lives, branches (domyślnie łańcuch
+    liniowy), names, n0 (inwentarz lub lista inwentarzy), t_end, n_points, molar_masses, log_scale.
+    """
+    half_lives = np.asarray(params['half_lives'], dtype=float)
+    names = params.get('names')
+    if 'branches' in params:
+        network = DecayNetwork(half_lives, params['branches'], names, params.get('molar_masses'))
+    else:
+        network = decay_chain(half_lives, names, params.get('molar_masses'))
+    t = np.linspace(0, params['t_end'], params.get('n_points', 500))
+    n0 = np.asarray(params['n0'], dtype=float)
+    inventory = network.evaluate(t, n0)
+
+    first = inventory if n0.ndim == 1 else inventory[0]
+    results = {'method': 'bateman' if network.uses_bateman else 'expm',
+               'final_inventory': inventory[..., -1, :].tolist()}
+    return results, [plot_inventory(t, first, network.names, params.get('log_scale', False))]
+
+
+if __name__ == '__main__':
+    # przykład: radon-222 i jego krótkożyciowe produkty rozpadu (czas w minutach)
+    network = decay_chain([3.8235 * 24 * 60, 3.098, 26.8, 19.9, 164.3e-6 / 60, 22.2 * 365.25 * 24 * 60],
+                          names=['Rn-222', 'Po-218', 'Pb-214', 'Bi-214', 'Po-214', 'Pb-210'])
+    t = np.linspace(0, 300, 601)
+    inventory = network.evaluate(t, [1e6, 0, 0, 0, 0, 0])
+    print(f"Metoda: {'Bateman' if network.uses_bateman else 'eksponenta macierzy'}")
+    for name, value in zip(network.names, inventory[-1]):
+        print(f"  {name}: {value:.4e}")
+    plot_inventory(t, inventory, network.names, log_scale=True)
+    plt.show()
@@ -1,26 +1,49 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-# pobierz dane od użytkownika
-r = float(input("Podaj rozstaw kół (r): "))
-up = float(input("Podaj prędkość liniową prawego koła (up): "))
-ul = float(input("Podaj prędkość liniową lewego koła (ul): "))
-
-# oblicz stałą prędkość kątową (ze wzoru)
-omega = (1/r) * (up - ul)
-
-# zakres czasu (od 0 do 10 sekund)
-time = np.linspace(0, 10, 100)
-
-# kąt obrotu w czasie (zakładając kąt początkowy 0) w radianach
-x0 = np.deg2rad(45)
-x3 = x0 + omega * time
-
-# wyświetl wykres
-plt.figure(figsize=(8, 6))
-plt.plot(time, x3)
-plt.xlabel("Czas (s)")
-plt.ylabel("Kąt obrotu x3 (rad)")
-plt.title("Wykres kąta obrotu robota w czasie")
-plt.grid(True)  # siatka dla lepszej czytelności
-plt.show()
+
+def rotation_angle(time, r, up, ul, x0):
+    """Kąt obrotu robota w czasie (w radianach) dla stałych prędkości kół."""
+    # oblicz stałą prędkość kątową (ze wzoru)
+    omega = (1/r) * (up - ul)
+    return x0 + omega * time
+
+
+def plot_rotation(time, x3):
+    """Wykres kąta obrotu robota w czasie."""
+    fig = plt.figure(figsize=(8, 6))
+    plt.plot(time, x3)
+    plt.xlabel("Czas (s)")
+    plt.ylabel("Kąt obrotu x3 (rad)")
+    plt.title("Wykres kąta obrotu robota w czasie")
+    plt.grid(True)  # siatka dla lepszej czytelności
+    return fig
+
+
+def run_scenario(params):
+    """Uruchomienie bez pytań input() - parametry ze scenariusza (r, up, ul, opcjonalnie x0_deg, t_end)."""
+    time = np.linspace(0, params.get('t_end', 10), 100)
+    x3 = rotation_angle(time, params['r'], params['up'], params['ul'], np.deg2rad(params.get('x0_deg', 45)))
+    return {'final_angle_rad': float(x3[-1])}, [plot_rotation(time, x3)]
+
+
+def main():
+    # pobierz dane od użytkownika
+    r = float(input("Podaj rozstaw kół (r): "))
+    up = float(input("Podaj prędkość liniową prawego koła (up): "))
+    ul = float(input("Podaj prędkość liniową lewego koła (ul): "))
+
+    # zakres czasu (od 0 do 10 sekund)
+    time = np.linspace(0, 10, 100)
+
+    # kąt obrotu w czasie (zakładając kąt początkowy 0) w radianach
+    x0 = np.deg2rad(45)
+    x3 = rotation_angle(time, r, up, ul, x0)
+
+    # wyświetl wykres
+    plot_rotation(time, x3)
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,6 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-# pobranie danych od użytkownika
-T = float(input("Podaj wartość parametru T: "))
-k = float(input("Podaj wartość parametru k: "))
-
-if T == 0:
-    print("T nie może być równe 0")
-    exit()
-
-# zakres czasu
-time = np.linspace(0, 5 * T if T > 0 else 5, 500)
-
 
 # odpowiedź na pobudzenie jednostkowe
 def odpowiedz_jednostkowa(t, T, k):
@@ -23,27 +12,66 @@ def odpowiedz_diraca(t, T, k):
     return k * (1 - np.exp(-t / T)) * (t >= 0)  # mnożenie przez (t>=0) aby odpowiedź była zero dla t<0
 
 
-y_jedn = odpowiedz_jednostkowa(time, T, k)
-y_dirac = odpowiedz_diraca(time, T, k)
+def response_time(T):
+    """Zakres czasu wykresu - kilka stałych czasowych."""
+    return np.linspace(0, 5 * T if T > 0 else 5, 500)
+
+
+def plot_responses(time, y_jedn, y_dirac):
+    """Wykresy odpowiedzi na pobudzenie jednostkowe i deltę Diraca."""
+    fig = plt.figure(figsize=(12, 6))
+
+    # wykres odpowiedzi na pobudzenie jednostkowe
+    plt.subplot(1, 2, 1)
+    plt.plot(time, y_jedn)
+    plt.title('Odpowiedź na pobudzenie jednostkowe')
+    plt.xlabel('Czas')
+    plt.ylabel('y(t)')
+    plt.grid(True)
+
+    # wykres odpowiedzi na deltę Diraca
+    plt.subplot(1, 2, 2)
+    plt.plot(time, y_dirac)
+    plt.title('Odpowiedź na deltę Diraca')
+    plt.xlabel('Czas')
+    plt.ylabel('y(t)')
+    plt.grid(True)
+
+    plt.tight_layout()  # dopasowanie wykresów, żeby się nie nakładały
+    return fig
+
+
+def run_scenario(params):
+    """Uruchomienie bez pytań input() - parametry ze scenariusza (T, k)."""
+    T, k = params['T'], params['k']
+    if T == 0:
+        raise ValueError("T nie może być równe 0")
+    time = response_time(T)
+    y_jedn = odpowiedz_jednostkowa(time, T, k)
+    y_dirac = odpowiedz_diraca(time, T, k)
+    results = {'step_response_end': float(y_jedn[-1]), 'impulse_response_end': float(y_dirac[-1])}
+    return results, [plot_responses(time, y_jedn, y_dirac)]
+
+
+def main():
+    # pobranie danych od użytkownika
+    T = float(input("Podaj wartość parametru T: "))
+    k = float(input("Podaj wartość parametru k: "))
+
+    if T == 0:
+        print("T nie może być równe 0")
+        exit()
+
+    # zakres czasu
+    time = response_time(T)
 
-# wyświetlanie wykresów
-plt.figure(figsize=(12, 6))
+    y_jedn = odpowiedz_jednostkowa(time, T, k)
+    y_dirac = odpowiedz_diraca(time, T, k)
 
-# wykres odpowiedzi na pobudzenie jednostkowe
-plt.subplot(1, 2, 1)
-plt.plot(time, y_jedn)
-plt.title('Odpowiedź na pobudzenie jednostkowe')
-plt.xlabel('Czas')
-plt.ylabel('y(t)')
-plt.grid(True)
+    # wyświetlanie wykresów
+    plot_responses(time, y_jedn, y_dirac)
+    plt.show()
 
-# wykres odpowiedzi na deltę Diraca
-plt.subplot(1, 2, 2)
-plt.plot(time, y_dirac)
-plt.title('Odpowiedź na deltę Diraca')
-plt.xlabel('Czas')
-plt.ylabel('y(t)')
-plt.grid(True)
 
-plt.tight_layout()  # dopasowanie wykresów, żeby się nie nakładały
-plt.show()
+if __name__ == '__main__':
+    main()
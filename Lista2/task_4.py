@@ -1,62 +1,88 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-# pobranie danych od użytkownika
-T_half = float(input("Podaj okres połowicznego rozpadu pierwiastka (w latach): "))
-m0 = float(input("Podaj masę początkową pierwiastka (g): "))
 
-# stała rozpadu
-lambda_decay = np.log(2) / T_half
+def decay_curve(T_half, m0, n_points=500):
+    """Krzywa rozpadu m(t) = m₀ * e^(-λt) na przedziale kilku okresów połowicznego rozpadu."""
+    # stała rozpadu
+    lambda_decay = np.log(2) / T_half
 
-# zakres czasu - kilka okresów połowicznego rozpadu, aby zobaczyć wyraźny zanik
-t_max = 5 * T_half
-t = np.linspace(0, t_max, 500)
+    # zakres czasu - kilka okresów połowicznego rozpadu, aby zobaczyć wyraźny zanik
+    t_max = 5 * T_half
+    t = np.linspace(0, t_max, n_points)
 
-# masa z wyprowadzonego wzoru: m(t) = m₀ * e^(-λt)
-m = m0 * np.exp(-lambda_decay * t)
+    # masa z wyprowadzonego wzoru: m(t) = m₀ * e^(-λt)
+    m = m0 * np.exp(-lambda_decay * t)
+    return t, m, lambda_decay
 
-# tworzenie wykresu
-plt.figure(figsize=(10, 6))
-plt.plot(t, m, label=f'Rozpad (m₀={m0:.1f} g, T½={T_half} lat)')
 
-# maksymalna wielokrotność T½ mieszczącą się w t_max
-max_i = int(t_max / T_half)
+def plot_decay(t, m, T_half, m0):
+    """Wykres rozpadu z oznaczeniami kolejnych okresów połowicznego rozpadu."""
+    t_max = t[-1]
+    fig = plt.figure(figsize=(10, 6))
+    plt.plot(t, m, label=f'Rozpad (m₀={m0:.1f} g, T½={T_half} lat)')
 
-# oznaczenia dla okresów połowicznego rozpadu (dla lepszej wizualizacji)
-for i in range(1, max_i+1):
+    # maksymalna wielokrotność T½ mieszczącą się w t_max
+    max_i = int(t_max / T_half)
+
+    # oznaczenia dla okresów połowicznego rozpadu (dla lepszej wizualizacji) - wszystkie naraz
+    i = np.arange(1, max_i + 1)
     t_i_half = i * T_half  # czas, jaki upłynął po i okresach połowicznego rozpadu
-    m_i_half = m0 / (2**i)  # masa, jaka pozostała po i okresach połowicznego rozpadu
+    m_i_half = m0 / 2.0**i  # masa, jaka pozostała po i okresach połowicznego rozpadu
 
-    # linie pomocnicze
-    plt.axvline(x=t_i_half, color='gray', linestyle=':', linewidth=0.7, alpha=0.7)
-    plt.axhline(y=m_i_half, color='gray', linestyle=':', linewidth=0.7, alpha=0.7)
+    # linie pomocnicze (po jednej kolekcji linii pionowych i poziomych)
+    ax = plt.gca()
+    ax.vlines(t_i_half, 0, 1, transform=ax.get_xaxis_transform(), color='gray', linestyle=':', linewidth=0.7,
+              alpha=0.7)
+    ax.hlines(m_i_half, 0, 1, transform=ax.get_yaxis_transform(), color='gray', linestyle=':', linewidth=0.7,
+              alpha=0.7)
 
     # kropki w punktach (T½, m₀/2), (2T½, m₀/4) itd.
     plt.plot(t_i_half, m_i_half, 'ro', markersize=5)
 
-    # dynamiczne pozycjonowanie etykiety punktu
-    text_x = t_i_half + 0.015 * t_max
-    text_y = m_i_half + 0.02 * m0
-
-    # etykieta punktu
-    plt.text(text_x, text_y,f'{i}T½ ({m_i_half:.3f} g)',
-             verticalalignment='bottom',
-             horizontalalignment='left',
-             fontsize=9)
-
-plt.title('Wykres rozpadu promieniotwórczego')
-plt.xlabel('Czas (lata)')
-plt.ylabel('Pozostała masa (g)')
-plt.legend()
-plt.grid(True, linestyle='--', alpha=0.6)
-plt.ylim(bottom=0, top=m0 * 1.05)
-plt.xlim(left=0, right=t_max * 1.02)
-plt.tight_layout()
-
-plt.show()
-
-# wyświetlenie obliczonych parametrów
-print(f"Parametry rozpadu:")
-print(f"Okres połowicznego rozpadu (T½): {T_half} lat")
-print(f"Stała rozpadu (λ): {lambda_decay:.6f} lat⁻¹ ({lambda_decay:.2e} lat⁻¹)")
-print(f"Współczynnik proporcjonalności (-λ): {-lambda_decay:.6f} lat⁻¹ ({-lambda_decay:.2e} lat⁻¹)")
+    # etykiety punktów z dynamicznym pozycjonowaniem
+    for i_half, text_x, text_y, m_half in zip(i, t_i_half + 0.015 * t_max, m_i_half + 0.02 * m0, m_i_half):
+        plt.text(text_x, text_y, f'{i_half}T½ ({m_half:.3f} g)',
+                 verticalalignment='bottom',
+                 horizontalalignment='left',
+                 fontsize=9)
+
+    plt.title('Wykres rozpadu promieniotwórczego')
+    plt.xlabel('Czas (lata)')
+    plt.ylabel('Pozostała masa (g)')
+    plt.legend()
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.ylim(bottom=0, top=m0 * 1.05)
+    plt.xlim(left=0, right=t_max * 1.02)
+    plt.tight_layout()
+    return fig
+
+
+def run_scenario(params):
+    """Uruchomienie bez pytań input() - parametry ze scenariusza (T_half, m0)."""
+    T_half, m0 = params['T_half'], params['m0']
+    t, m, lambda_decay = decay_curve(T_half, m0)
+    results = {'lambda_per_year': float(lambda_decay), 'mass_at_t_max': float(m[-1])}
+    return results, [plot_decay(t, m, T_half, m0)]
+
+
+def main():
+    # pobranie danych od użytkownika
+    T_half = float(input("Podaj okres połowicznego rozpadu pierwiastka (w latach): "))
+    m0 = float(input("Podaj masę początkową pierwiastka (g): "))
+
+    t, m, lambda_decay = decay_curve(T_half, m0)
+
+    # tworzenie wykresu
+    plot_decay(t, m, T_half, m0)
+    plt.show()
+
+    # wyświetlenie obliczonych parametrów
+    print(f"Parametry rozpadu:")
+    print(f"Okres połowicznego rozpadu (T½): {T_half} lat")
+    print(f"Stała rozpadu (λ): {lambda_decay:.6f} lat⁻¹ ({lambda_decay:.2e} lat⁻¹)")
+    print(f"Współczynnik proporcjonalności (-λ): {-lambda_decay:.6f} lat⁻¹ ({-lambda_decay:.2e} lat⁻¹)")
+
+
+if __name__ == '__main__':
+    main()
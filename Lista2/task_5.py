@@ -1,56 +1,241 @@
-import math
 import numpy as np
 import matplotlib.pyplot as plt
 
-# wczytywanie parametrów od użytkownika
-print("Podaj parametry układu(mx'' + bx' + kx = F):")
-m = float(input("Masa m (>0): "))
-b = float(input("Współczynnik tłumienia b (>0): "))
-k = float(input("Stała sprężystości k (>0): "))
-F = float(input("Siła zewnętrzna F: "))
+UNDERDAMPED, CRITICALLY_DAMPED, OVERDAMPED = -1, 0, 1
+REGIME_NAMES = {UNDERDAMPED: 'tłumienie słabe, Δ < 0', CRITICALLY_DAMPED: 'tłumienie krytyczne, Δ = 0',
+                OVERDAMPED: 'tłumienie silne, Δ > 0'}
+CRITICAL_TOLERANCE = 1e-6  # względna różnica |β|/α, poniżej której układ traktowany jest jako krytycznie tłumiony
 
-# zakładam zerowe warunki początkowe
-x0 = 0
-v0 = 0
 
-# wyróżnik (delta) równania  mr² + br + k = 0
-delta = b**2 - 4 * m * k
+def oscillator_parameters(m, b, k):
+    """
+    Parametry równania mx'' + bx' + kx = F w postaci e'' + 2αe' + ω₀²e = 0 (e = x - F/k).
 
-# sprawdzenie warunku Δ > 0
-if delta > 0:
-    r1 = (-b + math.sqrt(delta)) / (2 * m)
-    r2 = (-b - math.sqrt(delta)) / (2 * m)
+    Returns:
+        tuple: (alpha, beta2, omega0_sq, regime) - α = b/2m, β² = α² - ω₀² = Δ/4m² oraz reżim tłumienia
+        (UNDERDAMPED, CRITICALLY_DAMPED, OVERDAMPED); wszystkie tablice o wspólnym, rozgłoszonym kształcie.
+    """
+    m, b, k = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (m, b, k)))
+    alpha = b / (2 * m)
+    omega0_sq = k / m
+    beta2 = alpha**2 - omega0_sq
+    regime = np.where(np.abs(beta2) <= (CRITICAL_TOLERANCE * alpha)**2, CRITICALLY_DAMPED,
+                      np.where(beta2 > 0, OVERDAMPED, UNDERDAMPED))
+    return alpha, beta2, omega0_sq, regime
 
-    # rozwiązanie szczególne (pozycja równowagi)
+
+def damped_basis(alpha, beta2, t):
+    """
+    Funkcje bazowe e^{-αt}·C(t) i e^{-αt}·S(t), gdzie C(0) = 1, C'(0) = 0, S(0) = 0, S'(0) = 1 i C'' = β²C. \n
+    Dla β² < 0: C = cos(ωt), S = sin(ωt)/ω; dla β² > 0: C = cosh(βt), S = sinh(βt)/β; dla β = 0: C = 1, S = t.
+    Postać z expm1 nie traci dokładności w pobliżu tłumienia krytycznego (β → 0).
+    """
+    beta = np.sqrt(np.abs(beta2))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # tłumienie słabe
+        decay = np.exp(-alpha * t)
+        C_under = decay * np.cos(beta * t)
+        S_under = decay * np.sin(beta * t) / beta
+
+        # tłumienie silne i krytyczne: e^{-αt}cosh(βt) = (e^{(β-α)t} + e^{-(α+β)t}) / 2
+        slow = np.exp((beta - alpha) * t)
+        fast = np.exp(-(alpha + beta) * t)
+        C_over = 0.5 * (slow + fast)
+        S_over = np.where(beta * t > 0.5, (slow - fast) / (2 * beta), fast * np.expm1(2 * beta * t) / (2 * beta))
+        S_over = np.where(beta > 0, S_over, t * decay)
+
+    under = beta2 < 0
+    return np.where(under, C_under, C_over), np.where(under, S_under, S_over)
+
+
+def oscillator_response(t, m, b, k, F, x0=0.0, v0=0.0):
+    """
+    Rozwiązanie analityczne mx'' + bx' + kx = F dla wszystkich reżimów tłumienia. \n
+    x(t) = x_p + e^{-αt}[e₀C(t) + (v₀ + αe₀)S(t)], x_p = F/k, e₀ = x₀ - x_p. \n
+    Parametry (m, b, k, F, x0, v0) mogą być tablicami (np. siatką z parameter_grid) - są rozgłaszane
+    względem siebie, a wynik ma kształt (*kształt parametrów, len(t)) dla wspólnego wektora czasu t.
+
+    Returns:
+        tuple: (x, v) - położenie i prędkość.
+    """
+    t = np.asarray(t, dtype=float)
+    m, b, k, F, x0, v0 = (np.asarray(value, dtype=float)[..., np.newaxis] for value in (m, b, k, F, x0, v0))
+    alpha, beta2, omega0_sq, _ = oscillator_parameters(m, b, k)
+    xp = F / k
+    e0 = x0 - xp
+    C, S = damped_basis(alpha, beta2, t)
+    x = xp + e0 * C + (v0 + alpha * e0) * S
+    v = v0 * C - (omega0_sq * e0 + alpha * v0) * S
+    return x, v
+
+
+def parameter_grid(m_values, b_values, k_values):
+    """Siatka wszystkich kombinacji (m, b, k) jako trzy tablice o kształcie (len(m), len(b), len(k))."""
+    return np.meshgrid(m_values, b_values, k_values, indexing='ij')
+
+
+def _settling_root(alpha, beta2, omega0_sq, e0, v0, log_band, lo, hi, iterations=40):
+    """
+    Chwila t z przedziału [lo, hi], w której |e(t)| = pasmo, gdy |e| maleje monotonicznie na tym przedziale. \n
+    Metoda Newtona dla ln|e(t)| (dla pojedynczej eksponenty zbieżna w jednym kroku) zabezpieczona bisekcją.
+    """
+    t = hi.copy()
+    for _ in range(iterations):
+        C, S = damped_basis(alpha, beta2, t)
+        e = e0 * C + (v0 + alpha * e0) * S
+        de = v0 * C - (omega0_sq * e0 + alpha * v0) * S
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f = np.log(np.abs(e)) - log_band
+            above = f > 0
+            lo = np.where(above, t, lo)
+            hi = np.where(above, hi, t)
+            newton = t - f / (de / e)
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        t = np.where(inside, newton, 0.5 * (lo + hi))
+    return t
+
+
+def response_metrics(m, b, k, F, x0=0.0, v0=0.0, tolerance=0.02):
+    """
+    Wskaźniki odpowiedzi w postaci zamkniętej (bez przeszukiwania próbek), tablicowo dla siatek parametrów.
+
+    Args:
+        m, b, k, F, x0, v0: Parametry układu i warunki początkowe (skalary lub tablice rozgłaszalne).
+        tolerance: Szerokość pasma ustalenia jako ułamek |x_p - x₀| (gdy x₀ = x_p: ułamek |v₀|/ω₀).
+
+    Returns:
+        dict: regime, steady_state, damping_ratio, natural_frequency, peak_time (pierwsze maksimum po drugiej
+        stronie stanu ustalonego, NaN gdy go nie ma), overshoot (względem |x_p - x₀|, 0 gdy brak przeregulowania)
+        i settling_time (dla tłumienia słabego - z obwiedni e^{-αt}, dla pozostałych - dokładny).
+    """
+    m, b, k, F, x0, v0 = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (m, b, k, F, x0, v0)))
+    alpha, beta2, omega0_sq, regime = oscillator_parameters(m, b, k)
+    omega0 = np.sqrt(omega0_sq)
+    beta = np.sqrt(np.abs(beta2))
     xp = F / k
+    e0 = x0 - xp
+    B0 = v0 + alpha * e0  # współczynnik przy S(t)
+    band = tolerance * np.where(e0 != 0, np.abs(e0), np.abs(v0) / omega0)
+    under = regime == UNDERDAMPED
+    critical = regime == CRITICALLY_DAMPED
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # --- tłumienie słabe: ekstrema co π/ω_d, pierwsze w θ/ω_d, tan θ = v₀ / (ω_d e₀ + α B₀/ω_d)
+        theta = np.mod(np.arctan2(v0, beta * e0 + alpha * B0 / beta), np.pi)
+        t_first = np.where(theta > 0, theta, np.pi) / beta
+        C, S = damped_basis(alpha, beta2, t_first)
+        same_side = np.sign(e0 * C + B0 * S) == np.sign(e0)
+        t_peak_under = np.where(same_side, t_first + np.pi / beta, t_first)
+        amplitude = np.hypot(e0, B0 / beta)
+        settling_under = np.maximum(0.0, np.log(amplitude / band) / alpha)
 
-    # obliczanie stałych C₁ i C₂ z warunków początkowych
-    C1 = (v0 - r2 * (x0 - xp)) / (r1 - r2)
-    C2 = (r1 * (x0 - xp) - v0) / (r1 - r2)
+        # --- tłumienie silne i krytyczne: e(t) = c₁e^{r₁t} + c₂e^{r₂t} lub (c₁ + c₂t)e^{-αt}
+        r1, r2 = -alpha + beta, -alpha - beta
+        c1 = (v0 - r2 * e0) / (r1 - r2)
+        c2 = e0 - c1
+        t_ext = np.where(critical, (B0 - alpha * e0) / (alpha * B0), np.log(-c2 * r2 / (c1 * r1)) / (r1 - r2))
+        t_cross = np.where(critical, -e0 / B0, np.log(-c2 / c1) / (r1 - r2))
+        has_ext = np.isfinite(t_ext) & (t_ext > 0)
+        t_ext = np.where(has_ext, t_ext, 0.0)
+        C, S = damped_basis(alpha, beta2, t_ext)
+        e_ext = e0 * C + B0 * S
+        crosses = has_ext & (np.sign(e_ext) != np.sign(e0)) & (e0 != 0)
+        t_peak_over = np.where(crosses, t_ext, np.nan)
 
-    time_constant = 1.0  # wartość domyślna
-    t_end = 100 * time_constant  # czas końcowy dla wykresu
+        # górne ograniczenie chwili ustalenia z obwiedni najwolniejszej eksponenty:
+        # |e| <= (|c₁| + |c₂|)e^{-(α-β)t}, a dla tłumienia krytycznego (t·e^{-αt/2} <= 2/(eα))
+        # |e| <= (|e₀| + 2|B₀|/(eα))e^{-αt/2}
+        envelope = np.where(critical, np.abs(e0) + 2 * np.abs(B0) / (np.e * alpha), np.abs(c1) + np.abs(c2))
+        rate = np.where(critical, 0.5 * alpha, alpha - beta)
+        t_upper = np.maximum(t_ext, np.log(envelope / band) / rate)
+        t_cross = np.where(np.isfinite(t_cross) & (t_cross > 0) & (t_cross < t_ext), t_cross, 0.0)
+        late = np.abs(e_ext) > band  # pasmo opuszczane ostatecznie po ekstremum
+        early = ~late & (np.abs(e0) > band)  # pasmo osiągane przed przejściem przez zero
+        lo = np.where(late, t_ext, 0.0)
+        hi = np.where(late, t_upper, np.where(early, t_cross, 0.0))
+        over = ~under & (late | early)
+        settling_over = np.zeros_like(alpha)
+        if np.any(over):
+            settling_over[over] = _settling_root(alpha[over], beta2[over], omega0_sq[over], e0[over], v0[over],
+                                                 np.log(band[over]), lo[over], hi[over])
 
-    # generowanie punktów
-    t_values = np.linspace(0, t_end, 500)
+        peak_time = np.where(under, t_peak_under, t_peak_over)
+        C, S = damped_basis(alpha, beta2, np.nan_to_num(peak_time))
+        overshoot = np.where(np.isfinite(peak_time) & (e0 != 0), np.abs(e0 * C + B0 * S) / np.abs(e0), 0.0)
+        settling_time = np.where(under, settling_under, settling_over)
 
-    # obliczanie wartości x(t) dla każdego punktu czasowego
-    x_values = C1 * np.exp(r1 * t_values) + C2 * np.exp(r2 * t_values) + xp
+    return {
+        'regime': regime,
+        'steady_state': xp,
+        'damping_ratio': alpha / omega0,
+        'natural_frequency': omega0,
+        'peak_time': peak_time,
+        'overshoot': overshoot,
+        'settling_time': settling_time,
+    }
 
-    # tworzenie wykresu
-    plt.figure(figsize=(10, 6))
+
+def plot_position(t_values, x_values, xp, regime=OVERDAMPED):
+    """Wykres pozycji x(t) z linią stanu ustalonego."""
+    fig = plt.figure(figsize=(10, 6))
     plt.plot(t_values, x_values, label='Pozycja x(t)')
 
     # dodanie linii dla stanu ustalonego
     plt.axhline(xp, color='red', linestyle='--', linewidth=0.7, label=f'Stan ustalony x = {xp:.4f}')
 
-    plt.title('Pozycja x(t) w czasie (tłumienie silne, Δ > 0)')
+    plt.title(f'Pozycja x(t) w czasie ({REGIME_NAMES[int(regime)]})')
     plt.xlabel('Czas t')
     plt.ylabel('Pozycja x(t)')
     plt.legend()
     plt.grid(True)
     plt.axhline(0, color='black', linewidth=0.5)
     plt.axvline(0, color='black', linewidth=0.5)
+    return fig
+
+
+def plot_horizon(metrics):
+    """Czas końcowy wykresu - kilka czasów ustalenia (dla układu nietłumionego kilka okresów drgań)."""
+    settling_time = float(metrics['settling_time'])
+    if np.isfinite(settling_time) and settling_time > 0:
+        return 1.5 * settling_time
+    return 10 * 2 * np.pi / float(metrics['natural_frequency'])
+
+
+def run_scenario(params):
+    """Uruchomienie bez pytań input() - parametry ze scenariusza (m, b, k, F, opcjonalnie x0, v0, t_end)."""
+    m, b, k, F = params['m'], params['b'], params['k'], params['F']
+    x0, v0 = params.get('x0', 0.0), params.get('v0', 0.0)
+    metrics = response_metrics(m, b, k, F, x0, v0)
+    t_values = np.linspace(0, params.get('t_end', plot_horizon(metrics)), 500)
+    x_values, _ = oscillator_response(t_values, m, b, k, F, x0, v0)
+    results = {name: float(value) for name, value in metrics.items()}
+    results['regime'] = REGIME_NAMES[int(metrics['regime'])]
+    return results, [plot_position(t_values, x_values, F / k, metrics['regime'])]
+
+
+def main():
+    # wczytywanie parametrów od użytkownika
+    print("Podaj parametry układu(mx'' + bx' + kx = F):")
+    m = float(input("Masa m (>0): "))
+    b = float(input("Współczynnik tłumienia b (>=0): "))
+    k = float(input("Stała sprężystości k (>0): "))
+    F = float(input("Siła zewnętrzna F: "))
+
+    # warunki początkowe (domyślnie zerowe)
+    x0 = float(input("Położenie początkowe x0 [domyślnie 0]: ") or 0)
+    v0 = float(input("Prędkość początkowa v0 [domyślnie 0]: ") or 0)
+
+    metrics = response_metrics(m, b, k, F, x0, v0)
+    print(f"Reżim: {REGIME_NAMES[int(metrics['regime'])]}, ζ = {float(metrics['damping_ratio']):.4f}")
+    print(f"Czas ustalenia (2%): {float(metrics['settling_time']):.4f}, czas szczytu: "
+          f"{float(metrics['peak_time']):.4f}, przeregulowanie: {100 * float(metrics['overshoot']):.2f}%")
+
+    # tworzenie wykresu (czas końcowy dopasowany do czasu ustalenia)
+    t_values = np.linspace(0, plot_horizon(metrics), 500)
+    x_values, _ = oscillator_response(t_values, m, b, k, F, x0, v0)
+    plot_position(t_values, x_values, F / k, metrics['regime'])
     plt.show()
-else:
-    print(f"Delta: {delta} nie jest większa od 0")
+
+
+if __name__ == '__main__':
+    main()
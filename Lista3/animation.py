@@ -0,0 +1,204 @@
+"""
+Animacja ruchu robota (lub floty robotów) na podstawie tablic trajektorii z task_5.py (run_simulation,
+run_ensemble_simulation po resample).
+
+Rysowanie z blittingiem: tło (osie, siatka, statyczne linie) renderowane jest raz, a w każdej klatce
+odświeżane są tylko artysty ruchome - znaczniki położenia, strzałki kierunku, ślad o ograniczonej długości
+(trail_points punktów z ostatnich trail_seconds sekund) i licznik czasu. Koszt klatki nie zależy od długości
+misji ani od kroku h: położenia w chwili klatki interpolowane są z tablic (wyszukiwanie binarne po czasie).
+
+Odtwarzanie w czasie rzeczywistym (play) wybiera chwilę symulacji według zegara - gdy rysowanie nie nadąża
+za fps, klatki są pomijane, a animacja nie zwalnia. Eksport bez okna (export_frames / export_animation)
+zapisuje kolejne klatki co 1/fps s czasu odtwarzania jako pliki PNG.
+"""
+import os
+import time
+
+import numpy as np
+from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+
+MOVE_EPSILON = 1e-9  # przesunięcie [m], poniżej którego kierunek ruchu nie jest aktualizowany (robot stoi)
+
+
+def resample(t_history, x1_history, x2_history, n_samples):
+    """
+    Trajektorie floty o osobnych osiach czasu (historie (K, N) z run_ensemble_simulation) na wspólnej
+    siatce n_samples chwil - wymaganej przez RobotAnimation. Roboty po zakończeniu ruchu stoją w miejscu.
+
+    Returns:
+        tuple: (t (n_samples,), x1 (n_samples, N), x2 (n_samples, N))
+    """
+    t_history = np.asarray(t_history)
+    t = np.linspace(t_history.min(), t_history.max(), n_samples)
+    x1 = np.column_stack([np.interp(t, t_history[:, r], x1_history[:, r]) for r in range(t_history.shape[1])])
+    x2 = np.column_stack([np.interp(t, t_history[:, r], x2_history[:, r]) for r in range(t_history.shape[1])])
+    return t, x1, x2
+
+
+class RobotAnimation:
+    """
+    Animacja trajektorii N robotów o wspólnej osi czasu.
+
+    Args:
+        ax: Osie matplotlib (zakres osi ustawiany jest na całą trajektorię).
+        t (np.array): Chwile próbek (K,), niemalejące.
+        x1, x2 (np.array): Położenia (K,) dla jednego robota lub (K, N) dla floty.
+        heading (np.array): Kąt x₃ [rad] w chwilach t (jak x1); domyślnie kierunek ostatniego przesunięcia
+            (podczas obrotu w miejscu strzałka zachowuje wtedy ostatni kierunek).
+        speed (float): Sekundy symulacji na sekundę odtwarzania.
+        fps (int): Docelowa liczba klatek na sekundę.
+        trail_seconds (float): Długość śladu w sekundach symulacji.
+        trail_points (int): Liczba punktów śladu (ogranicza koszt klatki niezależnie od h i trail_seconds).
+        color: Kolor robotów i śladów.
+        arrow_length (float): Długość strzałki kierunku [m]; domyślnie 3% rozpiętości trajektorii.
+    """
+
+    def __init__(self, ax, t, x1, x2, heading=None, speed=1.0, fps=60, trail_seconds=5.0, trail_points=50,
+                 color='tab:blue', arrow_length=None):
+        self.ax = ax
+        self.t = np.asarray(t, dtype=float)
+        self.x1 = np.asarray(x1, dtype=float).reshape(len(self.t), -1)
+        self.x2 = np.asarray(x2, dtype=float).reshape(len(self.t), -1)
+        self.heading = None if heading is None else np.asarray(heading, dtype=float).reshape(len(self.t), -1)
+        self.speed = speed
+        self.fps = fps
+        self.trail_offsets = np.linspace(trail_seconds, 0.0, max(2, trail_points))  # od najstarszego punktu
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+        self._last_heading = np.zeros(self.x1.shape[1])
+        self._clock_start = None
+        self._last_frame = -1
+        self.animation = None
+
+        # zakres osi na całą trajektorię (stały - tło renderowane raz)
+        x_min, x_max = np.nanmin(self.x1), np.nanmax(self.x1)
+        y_min, y_max = np.nanmin(self.x2), np.nanmax(self.x2)
+        span = max(x_max - x_min, y_max - y_min, 1e-3)
+        margin = 0.05 * span
+        ax.set_xlim(x_min - margin, x_max + margin)
+        ax.set_ylim(y_min - margin, y_max + margin)
+        ax.set_aspect('equal', adjustable='box')
+        self.arrow_length = 0.03 * span if arrow_length is None else arrow_length
+
+        # artysty ruchome (animated=True - pomijane przy renderowaniu tła)
+        self.trail = LineCollection([], colors=color, linewidths=1.0, alpha=0.6, animated=True)
+        ax.add_collection(self.trail)
+        (self.markers,) = ax.plot([], [], 'o', color=color, markersize=5, animated=True)
+        n_robots = self.x1.shape[1]
+        self.arrows = ax.quiver(np.zeros(n_robots), np.zeros(n_robots), np.zeros(n_robots), np.zeros(n_robots),
+                                angles='xy', scale_units='xy', scale=1, color=color, width=0.004,
+                                animated=True)
+        self.clock = ax.text(0.02, 0.97, '', transform=ax.transAxes, va='top', animated=True)
+        self.artists = [self.trail, self.markers, self.arrows, self.clock]
+
+    @property
+    def duration(self):
+        """Czas odtwarzania [s] całej trajektorii."""
+        return (self.t[-1] - self.t[0]) / self.speed
+
+    def positions_at(self, times):
+        """Położenia (len(times), N, 2) w podanych chwilach - interpolacja liniowa między próbkami."""
+        times = np.clip(times, self.t[0], self.t[-1])
+        i = np.clip(np.searchsorted(self.t, times, side='right') - 1, 0, max(0, len(self.t) - 2))
+        j = np.minimum(i + 1, len(self.t) - 1)
+        dt = self.t[j] - self.t[i]
+        weight = np.divide(times - self.t[i], dt, out=np.zeros_like(times), where=dt > 0)[:, np.newaxis]
+        x1 = self.x1[i] + (self.x1[j] - self.x1[i]) * weight
+        x2 = self.x2[i] + (self.x2[j] - self.x2[i]) * weight
+        return np.stack((x1, x2), axis=-1)
+
+    def _heading_at(self, sim_time, trail):
+        if self.heading is not None:
+            i = min(max(np.searchsorted(self.t, sim_time, side='right') - 1, 0), len(self.t) - 1)
+            return self.heading[i]
+        # kierunek ostatniego przesunięcia (dwa najnowsze punkty śladu); stojące roboty zachowują poprzedni
+        delta = trail[:, -1] - trail[:, -2]
+        moving = np.hypot(delta[:, 0], delta[:, 1]) > MOVE_EPSILON
+        self._last_heading[moving] = np.arctan2(delta[moving, 1], delta[moving, 0])
+        return self._last_heading
+
+    def draw_frame(self, sim_time):
+        """Aktualizuje artysty ruchome dla chwili sim_time symulacji; zwraca listę artystów do przerysowania."""
+        trail = self.positions_at(sim_time - self.trail_offsets).transpose(1, 0, 2)  # (N, trail_points, 2)
+        position = trail[:, -1]
+        heading = self._heading_at(sim_time, trail)
+        self.trail.set_segments(trail)
+        self.markers.set_data(position[:, 0], position[:, 1])
+        self.arrows.set_offsets(position)
+        self.arrows.set_UVC(self.arrow_length * np.cos(heading), self.arrow_length * np.sin(heading))
+        self.clock.set_text(f't = {sim_time:.2f} s')
+        self.frames_drawn += 1
+        return self.artists
+
+    def _realtime_frame(self, _):
+        """Klatka odtwarzania: chwila symulacji z zegara, pominięte klatki są tylko zliczane."""
+        now = time.perf_counter()
+        if self._clock_start is None:
+            self._clock_start = now
+        elapsed = now - self._clock_start
+        frame = int(elapsed * self.fps)
+        self.frames_skipped += max(0, frame - self._last_frame - 1)
+        self._last_frame = frame
+        sim_time = min(self.t[0] + elapsed * self.speed, self.t[-1])
+        if sim_time >= self.t[-1] and self.animation is not None:
+            self.animation.event_source.stop()
+        return self.draw_frame(sim_time)
+
+    def play(self):
+        """
+        Odtwarzanie w czasie rzeczywistym (FuncAnimation z blittingiem). Zwrócony obiekt trzeba przechowywać
+        do zamknięcia okna (plt.show()).
+        """
+        self._clock_start = None
+        self._last_frame = -1
+        self.animation = FuncAnimation(self.ax.figure, self._realtime_frame, init_func=lambda: self.artists,
+                                       interval=1000 / self.fps, blit=True, cache_frame_data=False)
+        return self.animation
+
+    def export_frames(self, directory, max_frames=None, prefix='frame'):
+        """
+        Zapis klatek co 1/fps s czasu odtwarzania jako PNG (directory/prefix_00000.png, ...) - bez okna,
+        z blittingiem na płótnie Agg: tło renderowane jest raz, klatka to tylko artysty ruchome.
+
+        Returns:
+            int: Liczba zapisanych klatek.
+        """
+        canvas = self.ax.figure.canvas
+        if not hasattr(canvas, 'copy_from_bbox'):
+            raise ValueError("Eksport klatek wymaga płótna z blittingiem (np. FigureCanvasAgg)")
+        os.makedirs(directory, exist_ok=True)
+        canvas.draw()
+        background = canvas.copy_from_bbox(self.ax.figure.bbox)
+        n_frames = int(np.floor(self.duration * self.fps)) + 1
+        if max_frames is not None:
+            n_frames = min(n_frames, max_frames)
+        for frame in range(n_frames):
+            canvas.restore_region(background)
+            for artist in self.draw_frame(self.t[0] + frame * self.speed / self.fps):
+                self.ax.draw_artist(artist)
+            imsave(os.path.join(directory, f'{prefix}_{frame:05d}.png'), np.asarray(canvas.buffer_rgba()))
+        return n_frames
+
+
+def export_animation(directory, t, x1, x2, figsize=(8, 8), dpi=100, max_frames=None, title=None, **kwargs):
+    """
+    Eksport animacji do katalogu klatek PNG bez okna i bez pyplot (Figure + FigureCanvasAgg). \n
+    Dodatkowe argumenty trafiają do RobotAnimation (heading, speed, fps, trail_seconds, ...); klatki można
+    złożyć w film np. poleceniem ffmpeg -framerate 60 -i frame_%05d.png film.mp4.
+
+    Returns:
+        int: Liczba zapisanych klatek.
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.grid(True)
+    ax.set_xlabel('x1 [m]')
+    ax.set_ylabel('x2 [m]')
+    if title:
+        ax.set_title(title)
+    return RobotAnimation(ax, t, x1, x2, **kwargs).export_frames(directory, max_frames)
@@ -0,0 +1,117 @@
+"""
+Równoległy przegląd kroków h dla jawnej metody Eulera z zadania 1 (człon inercyjny) oraz metod niejawnych
+z implicit.py (--methods).
+
+Każda konfiguracja (metoda, h, typ pobudzenia, T, k) jest liczona w osobnym procesie i porównywana z rozwiązaniem
+analitycznym. Wynikiem jest tabela błędów (max, RMS), obserwowanego rzędu zbieżności i czasu obliczeń,
+zapisywana do CSV i/lub JSON.
+
+Przykład:
+    python euler_sweep.py --h-min 0.001 --h-max 2.8 --n-h 200 --T 1 0.5 --k 1 2 --csv sweep.csv --json sweep.json
+    python euler_sweep.py --methods euler backward_euler trapezoidal sdirk2 --h-max 200
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from implicit import METHOD_NAMES
+from task_1 import euler_simulation, analytical_response
+
+MIN_STEPS = 10  # najmniejsza liczba kroków w jednej konfiguracji
+REPORT_COLUMNS = ['method', 'input_type', 'T', 'k', 'h', 'n_steps', 'max_error', 'rms_error', 'order', 'wall_time_s']
+
+
+def run_case(case):
+    """Jedna symulacja (metoda Eulera lub niejawna) i jej błędy względem rozwiązania analitycznego."""
+    method, h, input_type, T, k = case
+    # horyzont 5T, ale co najmniej MIN_STEPS kroków - duże h (np. 100x granica stabilności jawnego Eulera,
+    # h = 200T) też daje przebieg do porównania, a nie sam stan początkowy
+    start = time.perf_counter()
+    _, y = euler_simulation(h, input_type, T=T, k=k, y0=0.0, t_end=max(5 * T, MIN_STEPS * h), method=method)
+    wall_time = time.perf_counter() - start
+
+    # y[n] przybliża odpowiedź w chwili n*h (kroki Eulera mają długość h)
+    t_n = np.arange(len(y)) * h
+    error = y - analytical_response(t_n, input_type, T, k)
+    if input_type == 'impulse':
+        error = error[1:]  # y[0] = 0 to stan przed impulsem, analitycznie y(0⁺) = k/T
+
+    return {
+        'method': method, 'input_type': input_type, 'T': T, 'k': k, 'h': h, 'n_steps': len(y) - 1,
+        'max_error': float(np.max(np.abs(error))) if error.size else float('nan'),
+        'rms_error': float(np.sqrt(np.mean(error**2))) if error.size else float('nan'),
+        'wall_time_s': wall_time,
+    }
+
+
+def add_convergence_orders(rows):
+    """Obserwowany rząd zbieżności p = log(e₁/e₂) / log(h₁/h₂) dla kolejnych h w ramach tej samej konfiguracji."""
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['method'], row['input_type'], row['T'], row['k']), []).append(row)
+    for group in groups.values():
+        group.sort(key=lambda row: row['h'], reverse=True)
+        group[0]['order'] = float('nan')
+        for coarse, fine in zip(group, group[1:]):
+            if coarse['max_error'] > 0 and fine['max_error'] > 0:
+                fine['order'] = float(np.log(coarse['max_error'] / fine['max_error'])
+                                      / np.log(coarse['h'] / fine['h']))
+            else:
+                fine['order'] = float('nan')
+    return rows
+
+
+def run_sweep(h_values, input_types, T_values, k_values, workers=None, methods=('euler',)):
+    """Uruchamia wszystkie konfiguracje na puli procesów i zwraca wiersze raportu."""
+    cases = [(method, h * T, input_type, T, k) for method in methods
+             for input_type in input_types for T in T_values for k in k_values for h in h_values]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rows = list(pool.map(run_case, cases, chunksize=max(1, len(cases) // (4 * (workers or os.cpu_count())))))
+    return add_convergence_orders(rows)
+
+
+def write_report(rows, csv_path=None, json_path=None):
+    """Zapisuje raport w formacie CSV i/lub JSON."""
+    if csv_path:
+        with open(csv_path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=REPORT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+    if json_path:
+        with open(json_path, 'w') as file:
+            json.dump(rows, file, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Przegląd kroków h dla metody Eulera i metod niejawnych (zadanie 1).')
+    parser.add_argument('--h-min', type=float, default=1e-3, help='najmniejszy krok (w jednostkach T)')
+    parser.add_argument('--h-max', type=float, default=2.8, help='największy krok (w jednostkach T)')
+    parser.add_argument('--n-h', type=int, default=100, help='liczba kroków (rozłożonych logarytmicznie)')
+    parser.add_argument('--T', type=float, nargs='+', default=[1.0], help='stałe czasowe')
+    parser.add_argument('--k', type=float, nargs='+', default=[1.0], help='wzmocnienia statyczne')
+    parser.add_argument('--inputs', nargs='+', default=['step', 'impulse'], choices=['step', 'impulse'])
+    parser.add_argument('--methods', nargs='+', default=['euler'], choices=list(METHOD_NAMES),
+                        help='metody całkowania (jawny Euler i metody niejawne z implicit.py)')
+    parser.add_argument('--workers', type=int, default=None, help='liczba procesów (domyślnie liczba rdzeni)')
+    parser.add_argument('--csv', help='ścieżka raportu CSV')
+    parser.add_argument('--json', help='ścieżka raportu JSON')
+    args = parser.parse_args()
+
+    h_values = np.geomspace(args.h_max, args.h_min, args.n_h)
+    rows = run_sweep(h_values, args.inputs, args.T, args.k, args.workers, args.methods)
+    write_report(rows, args.csv, args.json)
+
+    print(f"{'metoda':>14} {'pobudzenie':>10} {'T':>6} {'k':>6} {'h':>10} "
+          f"{'max błąd':>11} {'RMS':>11} {'rząd':>6} {'czas [s]':>9}")
+    for row in rows:
+        print(f"{row['method']:>14} {row['input_type']:>10} {row['T']:>6.3g} {row['k']:>6.3g} {row['h']:>10.4g} "
+              f"{row['max_error']:>11.3e} {row['rms_error']:>11.3e} {row['order']:>6.2f} {row['wall_time_s']:>9.4f}")
+
+
+if __name__ == '__main__':
+    main()
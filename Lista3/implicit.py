@@ -0,0 +1,140 @@
+"""
+Metody niejawne (sztywno stabilne) dla członów z zadań 1 i 2: niejawna metoda Eulera, metoda trapezów
+(Cranka–Nicolson) i dwuetapowa metoda SDIRK (Alexander, γ = 1 - 1/√2).
+
+Wszystkie trzy to metody diagonalnie niejawne (DIRK): etap i wymaga rozwiązania
+Yᵢ = xₙ + h Σⱼ<ᵢ aᵢⱼ f(Yⱼ) + h aᵢᵢ f(Yᵢ), a x_{n+1} = xₙ + h Σ bᵢ f(Yᵢ). Pobudzenie jest trzymane przez cały
+krok (u = uₙ na [tₙ, tₙ₊₁)), tak jak w jawnej metodzie Eulera z zadań.
+- Dla członów liniowych x' = Ax + Bu krok jest odwzorowaniem liniowym x_{n+1} = P xₙ + G uₙ; macierze P i G
+  liczone są raz dla danego h (linear_step_matrices), a krok to jedno mnożenie macierz-wektor.
+- Dla prawych stron nieliniowych każdy etap rozwiązywany jest metodą Newtona (NewtonStepper) z jakobianem
+  liczonym różnicami skończonymi i używanym ponownie w kolejnych krokach - odświeżanym tylko wtedy,
+  gdy iteracje przestają zbiegać.
+
+Niejawny Euler i SDIRK2 są L-stabilne (szybkie mody są tłumione dla każdego h), metoda trapezów jest A-stabilna
+(stabilna dla każdego h, ale szybkie mody przy dużym h zanikają powoli, zmieniając znak co krok).
+"""
+import numpy as np
+
+SDIRK_GAMMA = 1 - 1 / np.sqrt(2)
+
+# tablice Butchera (a, b, c) metod DIRK; metoda trapezów ma pierwszy etap jawny (a₁₁ = 0)
+IMPLICIT_METHODS = {
+    'backward_euler': (np.array([[1.0]]), np.array([1.0]), np.array([1.0])),
+    'trapezoidal': (np.array([[0.0, 0.0], [0.5, 0.5]]), np.array([0.5, 0.5]), np.array([0.0, 1.0])),
+    'sdirk2': (np.array([[SDIRK_GAMMA, 0.0], [1 - SDIRK_GAMMA, SDIRK_GAMMA]]),
+               np.array([1 - SDIRK_GAMMA, SDIRK_GAMMA]), np.array([SDIRK_GAMMA, 1.0])),
+}
+METHOD_NAMES = {'euler': 'jawna metoda Eulera', 'backward_euler': 'niejawna metoda Eulera',
+                'trapezoidal': 'metoda trapezów', 'sdirk2': 'SDIRK2'}
+
+
+def check_method(method):
+    """Sprawdza nazwę metody ('euler' albo klucz IMPLICIT_METHODS)."""
+    if method != 'euler' and method not in IMPLICIT_METHODS:
+        raise ValueError(f"Nieznana metoda {method!r} (dostępne: {', '.join(METHOD_NAMES)})")
+
+
+def linear_step_matrices(A, B, h, method):
+    """
+    Macierze kroku metody DIRK dla układu liniowego x' = Ax + Bu przy pobudzeniu trzymanym przez krok:
+    x_{n+1} = P xₙ + G uₙ. \n
+    Krok jest liniowy względem (xₙ, uₙ), więc P i G to wynik kroku zastosowanego jednocześnie do wszystkich
+    wektorów bazowych (kolumny [I | 0] z u = 0 oraz kolumna 0 z u = 1); równanie etapu
+    (I - h aᵢᵢ A) Yᵢ = ... rozwiązywane jest raz dla wszystkich kolumn.
+
+    Returns:
+        tuple: (P (n, n), G (n,))
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    B = np.asarray(B, dtype=float).reshape(-1)
+    n = A.shape[0]
+    a, b, _ = IMPLICIT_METHODS[method]
+    X = np.hstack((np.eye(n), np.zeros((n, 1))))
+    U = np.concatenate((np.zeros(n), [1.0]))
+    derivatives = []
+    for i in range(len(b)):
+        known = X + h * sum(a[i, j] * derivatives[j] for j in range(i)) + h * a[i, i] * np.outer(B, U)
+        Y = np.linalg.solve(np.eye(n) - h * a[i, i] * A, known)
+        derivatives.append(A @ Y + np.outer(B, U))
+    step = X + h * sum(b_i * derivative for b_i, derivative in zip(b, derivatives))
+    return step[:, :n], step[:, n]
+
+
+def finite_difference_jacobian(f, x, fx=None, eps=1e-7):
+    """Jakobian ∂f/∂x różnicami skończonymi w przód (kolumna po kolumnie)."""
+    x = np.asarray(x, dtype=float)
+    fx = f(x) if fx is None else fx
+    J = np.empty((len(fx), len(x)))
+    for j in range(len(x)):
+        dx = eps * max(1.0, abs(x[j]))
+        shifted = x.copy()
+        shifted[j] += dx
+        J[:, j] = (f(shifted) - fx) / dx
+    return J
+
+
+class NewtonStepper:
+    """
+    Kroki metody DIRK dla prawej strony nieliniowej rhs(x, t, u) - etapy rozwiązywane metodą Newtona
+    z jakobianem używanym ponownie przez wiele kroków.
+
+    Args:
+        rhs (callable): Prawa strona rhs(x, t, u) -> dx/dt.
+        method (str): Klucz IMPLICIT_METHODS.
+        tol (float): Tolerancja poprawki Newtona (względem max(1, |Y|)).
+        max_iterations (int): Limit iteracji; po jego przekroczeniu jakobian jest liczony ponownie.
+    """
+
+    def __init__(self, rhs, method, tol=1e-10, max_iterations=8):
+        self.rhs = rhs
+        self.a, self.b, self.c = IMPLICIT_METHODS[method]
+        self.tol = tol
+        self.max_iterations = max_iterations
+        self.jacobian = None
+        self._inverse = {}  # (h, aᵢᵢ) -> (I - h aᵢᵢ J)⁻¹ dla bieżącego jakobianu
+        self.n_rhs = 0
+        self.n_jacobians = 0
+
+    def _f(self, x, t, u):
+        self.n_rhs += 1
+        return np.asarray(self.rhs(x, t, u), dtype=float)
+
+    def _refresh_jacobian(self, x, t, u):
+        self.jacobian = finite_difference_jacobian(lambda y: self._f(y, t, u), x)
+        self.n_jacobians += 1
+        self._inverse.clear()
+
+    def _solve_stage(self, known, h, diagonal, t, u, guess):
+        """Rozwiązuje Y = known + h·aᵢᵢ·f(Y) (uproszczona metoda Newtona ze stałą macierzą I - h aᵢᵢ J)."""
+        Y = guess.copy()
+        for attempt in range(2):
+            key = (h, diagonal)
+            if key not in self._inverse:
+                self._inverse[key] = np.linalg.inv(np.eye(len(Y)) - h * diagonal * self.jacobian)
+            inverse = self._inverse[key]
+            for _ in range(self.max_iterations):
+                correction = inverse @ (Y - known - h * diagonal * self._f(Y, t, u))
+                Y = Y - correction
+                if np.max(np.abs(correction)) <= self.tol * max(1.0, np.max(np.abs(Y))):
+                    return Y
+            # brak zbieżności - jakobian nieaktualny, liczony ponownie w bieżącym punkcie
+            self._refresh_jacobian(Y if np.all(np.isfinite(Y)) else guess, t, u)
+            Y = guess.copy()
+        raise RuntimeError(f"Metoda Newtona nie zbiega w chwili t={t} (h={h})")
+
+    def step(self, x, t, u, h):
+        """Jeden krok x(t) -> x(t + h) przy pobudzeniu u trzymanym przez krok."""
+        x = np.asarray(x, dtype=float)
+        if self.jacobian is None:
+            self._refresh_jacobian(x, t, u)
+        derivatives = []
+        for i in range(len(self.b)):
+            t_stage = t + self.c[i] * h
+            known = x + h * sum(self.a[i, j] * derivatives[j] for j in range(i))
+            if self.a[i, i] == 0:
+                derivatives.append(self._f(known, t_stage, u))
+            else:
+                Y = self._solve_stage(known, h, self.a[i, i], t_stage, u, x)
+                derivatives.append((Y - known) / (h * self.a[i, i]))  # f(Y) z równania etapu, bez wywołania rhs
+        return x + h * sum(b_i * derivative for b_i, derivative in zip(self.b, derivatives))
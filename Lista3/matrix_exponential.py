@@ -0,0 +1,30 @@
+"""
+Eksponenta macierzy - wspólna dla dyskretyzacji ZOH członów liniowych (task_2.py) i propagacji sieci rozpadu
+(Lista2/decay_chain.py).
+"""
+import numpy as np
+
+
+def expm(M):
+    """Eksponenta macierzy e^M - aproksymacja Padé (6, 6) z metodą skalowania i potęgowania (Golub, Van Loan)."""
+    M = np.asarray(M, dtype=float)
+    identity = np.eye(M.shape[0])
+    norm = np.linalg.norm(M, np.inf)
+    n_squarings = max(0, int(np.ceil(np.log2(norm / 0.5)))) if norm > 0 else 0
+    X = M / 2.0**n_squarings
+
+    q = 6
+    c = 0.5
+    X_power = X
+    numerator = identity + c * X
+    denominator = identity - c * X
+    for j in range(2, q + 1):
+        c = c * (q - j + 1) / (j * (2 * q - j + 1))
+        X_power = X @ X_power
+        numerator = numerator + c * X_power
+        denominator = denominator + (-1)**j * c * X_power
+
+    E = np.linalg.solve(denominator, numerator)
+    for _ in range(n_squarings):
+        E = E @ E
+    return E
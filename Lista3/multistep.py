@@ -0,0 +1,122 @@
+"""
+Metoda wielokrokowa Adamsa-Bashfortha-Moultona rzędu 4 (predyktor-korektor) dla prawych stron
+rhs_into(x, w, out=...) z robot_model.py.
+
+Predyktor (Adams-Bashforth, 4 kroki) i korektor (Adams-Moulton, 3 kroki) używają pochodnych z poprzednich
+kroków, więc krok kosztuje 2 wywołania prawej strony (PECE: predykcja, ewaluacja, korekcja, ewaluacja)
+albo 1 (PEC - pochodna z punktu przewidzianego trafia do historii) zamiast 4 dla RK-4:
+x* = xₙ + h/24 (55fₙ - 59fₙ₋₁ + 37fₙ₋₂ - 9fₙ₋₃) \n
+x_{n+1} = xₙ + h/24 (9f(x*) + 19fₙ - 5fₙ₋₁ + fₙ₋₂)
+
+Historia wymaga równych kroków i gładkiej prawej strony: pierwsze trzy kroki (start oraz każda zmiana h lub
+reset() na granicy fazy, gdzie skaczą sterowania) liczone są metodą RK-4.
+"""
+import numpy as np
+
+from runge_kutta import ExplicitRungeKutta
+
+AB4 = (55 / 24, -59 / 24, 37 / 24, -9 / 24)  # współczynniki przy fₙ, fₙ₋₁, fₙ₋₂, fₙ₋₃
+AM4 = (9 / 24, 19 / 24, -5 / 24, 1 / 24)  # współczynniki przy f(x*), fₙ, fₙ₋₁, fₙ₋₂
+MODES = ('PECE', 'PEC')
+
+
+def _linear_combination(vectors, coefficients, out, scratch):
+    """out = Σ cⱼ vⱼ - tylko działania w miejscu na buforach."""
+    np.multiply(vectors[0], coefficients[0], out=out)
+    for vector, coefficient in zip(vectors[1:], coefficients[1:]):
+        np.multiply(vector, coefficient, out=scratch)
+        np.add(out, scratch, out=out)
+    return out
+
+
+class AdamsBashforthMoulton:
+    """
+    Krok ABM-4 step(x, w, h) o tej samej postaci co kroki z robot_model.py - ale z pamięcią: kolejne wywołania
+    muszą kontynuować tę samą trajektorię (stan x to wynik poprzedniego kroku). Przed nową trajektorią
+    lub po zmianie sterowań należy wywołać reset() (simulation_steps z task_5.py robi to na początku każdej
+    fazy). Tryb zespołowy (h jako tablica) nie jest obsługiwany.
+
+    Args:
+        rhs_into (callable): Prawa strona rhs_into(x, w, out=bufor).
+        mode (str): 'PECE' (2 wywołania prawej strony na krok) lub 'PEC' (1 wywołanie, mniejszy obszar
+            stabilności).
+    """
+
+    def __init__(self, rhs_into, mode='PECE'):
+        if mode not in MODES:
+            raise ValueError(f"Nieznany tryb {mode!r} (dostępne: {', '.join(MODES)})")
+        self.rhs_into = rhs_into
+        self.mode = mode
+        self.bootstrap = ExplicitRungeKutta(rhs_into, 'rk4')
+        self._shape = None
+        self._n_own_rhs = 0
+        self.reset()
+
+    def reset(self):
+        """Zapomina historię pochodnych - kolejne kroki startują od nowa metodą RK-4."""
+        self._n_history = 0
+        self._h = None
+
+    @property
+    def n_rhs(self):
+        """Liczba wywołań prawej strony (razem z krokami startowymi RK-4)."""
+        return self._n_own_rhs + self.bootstrap.n_rhs
+
+    def _allocate(self, shape):
+        # 5 buforów pochodnych: fₙ, ..., fₙ₋₃ (od najnowszej) i wolny na f_{n+1}; rotacja listy bez kopiowania
+        self._history = list(np.empty((5,) + shape))
+        self._predicted = np.empty(shape)
+        self._scratch = np.empty(shape)
+        self._shape = shape
+        self.reset()
+
+    def _evaluate(self, x, w, out):
+        self.rhs_into(x, w, out=out)
+        self._n_own_rhs += 1
+
+    def step_into(self, x, w, h, out):
+        """
+        Jeden krok zapisany do out (może to być samo x). Trzy pierwsze kroki po starcie, reset() lub zmianie h
+        to kroki RK-4 budujące historię pochodnych.
+
+        Returns:
+            np.array: out
+        """
+        if isinstance(h, np.ndarray):
+            raise ValueError("Metoda wielokrokowa nie obsługuje trybu zespołowego (osobnego h dla każdego robota)")
+        if x.shape != self._shape:
+            self._allocate(x.shape)
+        if h != self._h:
+            self._n_history = 0
+            self._h = h
+            self._ab = tuple(coefficient * h for coefficient in AB4)
+            self._am = tuple(coefficient * h for coefficient in AM4)
+        history = self._history
+        if self._n_history == 0:
+            self._evaluate(x, w, out=history[0])
+            self._n_history = 1
+
+        if self._n_history < 4:
+            # start: krok RK-4 i pochodna w nowym punkcie do historii
+            self.bootstrap.step_into(x, w, h, out=out)
+            history.insert(0, history.pop())
+            self._evaluate(out, w, out=history[0])
+            self._n_history += 1
+            return out
+
+        derivative = history[4]  # wolny bufor na f_{n+1}
+        # P: predyktor Adamsa-Bashfortha, E: pochodna w punkcie przewidzianym
+        np.add(x, _linear_combination(history[:4], self._ab, self._predicted, self._scratch), out=self._predicted)
+        self._evaluate(self._predicted, w, out=derivative)
+        # C: korektor Adamsa-Moultona
+        correction = _linear_combination((derivative, *history[:3]), self._am, self._predicted, self._scratch)
+        np.add(x, correction, out=out)
+        history.insert(0, history.pop())
+        if self.mode == 'PECE':
+            self._evaluate(out, w, out=history[0])  # E: pochodna w punkcie skorygowanym
+        return out
+
+    def __call__(self, x, w, h):
+        """Jeden krok zwracający nowy stan (x pozostaje bez zmian)."""
+        x = np.asarray(x, dtype=float)
+        return self.step_into(x, w, h, out=np.empty_like(x))
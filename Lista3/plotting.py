@@ -0,0 +1,132 @@
+import numpy as np
+
+
+def minmax_decimate(x, y, n_buckets):
+    """
+    Indeksy próbek zachowywanych przy decymacji min/max. \n
+    Próbki dzielone są na n_buckets kolejnych kubełków; z każdego zostaje pierwsza, ostatnia, najmniejsza
+    i największa wartość y (a dla krzywych parametrycznych, gdzie x nie rośnie, także skrajne x),
+    więc wąskie piki nie znikają z wykresu.
+    """
+    n = len(y)
+    bucket = int(np.ceil(n / max(1, n_buckets)))
+    if bucket <= 4:
+        return np.arange(n)
+
+    n_full = n // bucket
+    offsets = np.arange(n_full) * bucket
+    keep = [offsets, offsets + bucket - 1, [n - 1]]
+    series = [y] if is_monotonic(x) else [x, y]
+    for values in series:
+        blocks = np.asarray(values[:n_full * bucket]).reshape(n_full, bucket)
+        keep += [offsets + np.argmin(blocks, axis=1), offsets + np.argmax(blocks, axis=1)]
+        rest = np.asarray(values[n_full * bucket:])
+        if rest.size:
+            keep += [[n_full * bucket + np.argmin(rest), n_full * bucket + np.argmax(rest)]]
+    return np.unique(np.concatenate(keep).astype(int))
+
+
+def is_monotonic(x):
+    """Czy x jest niemalejące (np. oś czasu)."""
+    return len(x) < 2 or bool(np.all(x[1:] >= x[:-1]))
+
+
+class DecimatedLine:
+    """
+    Linia na wykresie, która przekazuje do matplotlib tylko tyle punktów, ile ma sens przy rozdzielczości osi
+    (ok. jeden kubełek min/max na piksel). Po przybliżeniu lub przesunięciu widoku decymacja jest liczona
+    ponownie dla widocznego fragmentu, więc szczegóły pojawiają się przy powiększeniu.
+    """
+
+    def __init__(self, ax, x, y, fmt='-', **kwargs):
+        self.ax = ax
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.monotonic = is_monotonic(self.x)
+        index = minmax_decimate(self.x, self.y, self._n_buckets())
+        (self.line,) = ax.plot(self.x[index], self.y[index], fmt, **kwargs)
+        # funkcje (a nie metody) są przechowywane przez matplotlib jako silne referencje
+        ax.callbacks.connect('xlim_changed', lambda _: self.update())
+        if not self.monotonic:
+            ax.callbacks.connect('ylim_changed', lambda _: self.update())
+
+    def _n_buckets(self):
+        return max(100, int(self.ax.bbox.width))
+
+    def update(self):
+        """Decymacja widocznego fragmentu danych (wywoływana przy zmianie zakresu osi)."""
+        x_min, x_max = self.ax.get_xlim()
+        if self.monotonic:
+            # widoczny przedział plus po jednej próbce z każdej strony, by linia dochodziła do krawędzi
+            i0 = max(0, np.searchsorted(self.x, x_min) - 1)
+            i1 = min(len(self.x), np.searchsorted(self.x, x_max, side='right') + 1)
+            index = i0 + minmax_decimate(self.x[i0:i1], self.y[i0:i1], self._n_buckets())
+            self.line.set_data(self.x[index], self.y[index])
+            return
+
+        # krzywa parametryczna - punkty w oknie widoku (z sąsiadami, by odcinki wychodziły poza krawędź)
+        y_min, y_max = self.ax.get_ylim()
+        inside = ((self.x >= min(x_min, x_max)) & (self.x <= max(x_min, x_max))
+                  & (self.y >= min(y_min, y_max)) & (self.y <= max(y_min, y_max)))
+        inside[:-1] |= inside[1:]
+        inside[1:] |= inside[:-1].copy()
+        selected = np.flatnonzero(inside)
+        if selected.size == 0:
+            self.line.set_data([], [])
+            return
+        kept = selected[minmax_decimate(self.x[selected], self.y[selected], self._n_buckets())]
+        # przerwy (NaN) między fragmentami trajektorii, które opuszczają widok i do niego wracają
+        run = np.cumsum(np.diff(selected, prepend=selected[0]) > 1)[np.searchsorted(selected, kept)]
+        gaps = np.flatnonzero(np.diff(run)) + 1
+        self.line.set_data(np.insert(self.x[kept].astype(float), gaps, np.nan),
+                           np.insert(self.y[kept].astype(float), gaps, np.nan))
+
+
+def plot_decimated(ax, x, y, fmt='-', **kwargs):
+    """Odpowiednik ax.plot(x, y, fmt, **kwargs) z decymacją min/max do rozdzielczości ekranu."""
+    return DecimatedLine(ax, x, y, fmt, **kwargs)
+
+
+def direction_arrows(x1, x2, arrow_step, start_index=None):
+    """
+    Położenia i kierunki strzałek wzdłuż trajektorii, co arrow_step próbek (domyślnie z pominięciem początku),
+    liczone tablicowo. Pomija odcinki o zerowej długości (robot stoi).
+
+    Returns:
+        tuple: (x, y, dx, dy) - tablice początków strzałek i wektorów przesunięcia.
+    """
+    x1 = np.asarray(x1)
+    x2 = np.asarray(x2)
+    index = np.arange(arrow_step if start_index is None else start_index, len(x1) - 1, arrow_step)
+    dx = x1[index + 1] - x1[index]
+    dy = x2[index + 1] - x2[index]
+    moving = (np.abs(dx) > 1e-6) | (np.abs(dy) > 1e-6)
+    return x1[index][moving], x2[index][moving], dx[moving], dy[moving]
+
+
+def draw_direction_arrows(ax, x1, x2, arrow_step, color='blue', arrow_length=0.1, start_index=None):
+    """Rysuje wszystkie strzałki kierunku ruchu jedną kolekcją (ax.quiver) zamiast osobnego plt.arrow na strzałkę."""
+    x, y, dx, dy = direction_arrows(x1, x2, arrow_step, start_index)
+    length = np.hypot(dx, dy)
+    return ax.quiver(x, y, dx / length * arrow_length, dy / length * arrow_length,
+                     angles='xy', scale_units='xy', scale=1, color=color,
+                     width=0.003, headwidth=5, headlength=6, headaxislength=5)
+
+
+def draw_trajectory(ax, x1, x2, fmt='-', color=None, label=None, arrow_step=None, arrow_length=0.1,
+                    start_marker=None, start_label=None, end_marker=None, end_label=None, marker_size=10,
+                    **line_kwargs):
+    """
+    Rysuje trajektorię robota: linię (z decymacją), opcjonalne strzałki kierunku co arrow_step próbek
+    oraz znaczniki punktu startowego i końcowego (np. start_marker='go', end_marker='ro').
+    """
+    if color is not None:
+        line_kwargs['color'] = color
+    line = plot_decimated(ax, x1, x2, fmt, label=label, **line_kwargs)
+    if arrow_step:
+        draw_direction_arrows(ax, x1, x2, arrow_step, color=line.line.get_color(), arrow_length=arrow_length)
+    if start_marker:
+        ax.plot(x1[0], x2[0], start_marker, markersize=marker_size, label=start_label)
+    if end_marker:
+        ax.plot(x1[-1], x2[-1], end_marker, markersize=marker_size, label=end_label)
+    return line
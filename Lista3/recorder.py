@@ -0,0 +1,111 @@
+import numpy as np
+
+
+class TrajectoryRecorder:
+    """
+    Zapis trajektorii do prealokowanych buforów float64 (jedna kolumna na zmienną, np. t, x1, x2). \n
+    Bufor rośnie dwukrotnie, gdy się zapełni, więc dopisanie próbki ma zamortyzowany koszt O(1)
+    i nie tworzy osobnego obiektu Pythona dla każdej liczby (jak lista np.float64).
+    """
+
+    def __init__(self, n_columns=3, capacity=1024):
+        self._buffer = np.empty((n_columns, max(1, capacity)))
+        self._size = 0
+        self.n_samples = 0  # liczba wszystkich przekazanych próbek (także tych pominiętych przez decymację)
+
+    def append(self, *values):
+        """Dopisuje jedną próbkę (po jednej wartości na kolumnę)."""
+        if self._size == self._buffer.shape[1]:
+            self._grow()
+        self._buffer[:, self._size] = values
+        self._size += 1
+        self.n_samples += 1
+
+    def _grow(self):
+        grown = np.empty((self._buffer.shape[0], 2 * self._buffer.shape[1]))
+        grown[:, :self._size] = self._buffer[:, :self._size]
+        self._buffer = grown
+
+    def __len__(self):
+        return self._size
+
+    def columns(self):
+        """Zapisane kolumny jako ciągłe tablice numpy (widoki bufora, bez kopiowania)."""
+        return tuple(self._buffer[:, :self._size])
+
+    def stored_indices(self, indices):
+        """Indeksy w zapisanych kolumnach dla indeksów próbek przekazanych do append (tu bez zmian)."""
+        return list(indices)
+
+    def finish(self, **metadata):
+        """Wywoływane po zakończeniu symulacji (metadane wykorzystują zapisy na dysk)."""
+
+
+class DecimatingRecorder(TrajectoryRecorder):
+    """Zapisuje co k-tą próbkę (every=k); ostatnia próbka jest zawsze dołączana do wyniku."""
+
+    def __init__(self, n_columns=3, every=10, capacity=1024):
+        super().__init__(n_columns, capacity)
+        self.every = every
+        self._last = None
+
+    def append(self, *values):
+        if self.n_samples % self.every == 0:
+            super().append(*values)
+            self._last = None
+        else:
+            self.n_samples += 1
+            self._last = values
+
+    def stored_indices(self, indices):
+        """
+        Indeksy w zapisanych (zdecymowanych) kolumnach dla indeksów próbek przekazanych do append - każda próbka
+        wskazuje pierwszą zachowaną próbkę nie wcześniejszą od niej (np. początek fazy - pierwszą próbkę fazy).
+        """
+        n_stored = len(self) + (self._last is not None)
+        return [min(-(-index // self.every), n_stored - 1) for index in indices]
+
+    def columns(self):
+        if self._last is None:
+            return super().columns()
+        return tuple(np.append(column, value) for column, value in zip(super().columns(), self._last))
+
+
+class ChunkRecorder:
+    """
+    Zapis w blokach o stałym rozmiarze. Każdy pełny blok (chunk_size, n_columns) jest przekazywany
+    do funkcji on_chunk, więc w pamięci przebywa tylko jeden blok niezależnie od długości symulacji.
+    """
+
+    def __init__(self, on_chunk, n_columns=3, chunk_size=65536):
+        self.on_chunk = on_chunk
+        self._block = np.empty((chunk_size, n_columns))
+        self._size = 0
+        self.n_samples = 0
+
+    def append(self, *values):
+        self._block[self._size] = values
+        self._size += 1
+        self.n_samples += 1
+        if self._size == len(self._block):
+            self.flush()
+
+    def flush(self):
+        """Przekazuje niepełny blok (jeśli jest) do on_chunk."""
+        if self._size:
+            self.on_chunk(self._block[:self._size].copy())
+            self._size = 0
+
+    def __len__(self):
+        return self.n_samples
+
+    def stored_indices(self, indices):
+        """Indeksy próbek w strumieniu bloków przekazanych do on_chunk (bez zmian)."""
+        return list(indices)
+
+    def columns(self):
+        """Puste kolumny - wszystkie dane zostały już przekazane do on_chunk."""
+        return tuple(np.empty((self._block.shape[1], 0)))
+
+    def finish(self, **metadata):
+        self.flush()
@@ -0,0 +1,98 @@
+"""
+Model robota mobilnego z zadań 3 i 5: prawa strona (zwykła i zapisująca do bufora), kroki jawnych metod RK
+z runge_kutta.py oraz dokładne przejście przy stałych sterowaniach.
+"""
+import math
+
+import numpy as np
+
+from multistep import AdamsBashforthMoulton
+from runge_kutta import TABLEAUS, ExplicitRungeKutta
+
+
+def robot_dynamics(x, w):
+    """
+    Oblicza pochodne stanu [dx1/dt, dx2/dt, dx3/dt] dla danego stanu x i sterowań w.
+
+    Działa również dla całej floty robotów - wtedy x ma wymiar (N, 3), a w (N, 2) lub (2,).
+
+    Args:
+        x (np.array): Aktualny wektor stanu [x1, x2, x3 (rad)] lub macierz stanów (N, 3).
+        w (np.array): Aktualny wektor sterowań [w1 (m/s), w2 (rad/s)] lub macierz sterowań (N, 2).
+
+    Returns:
+        np.array: Wektor (lub macierz (N, 3)) pochodnych stanu.
+    """
+    x3 = x[..., 2]
+    w1 = w[..., 0]
+    w2 = w[..., 1]
+    dx1_dt = np.cos(x3) * w1
+    dx2_dt = np.sin(x3) * w1
+    dx3_dt = np.broadcast_to(w2, dx1_dt.shape)
+    return np.stack([dx1_dt, dx2_dt, dx3_dt], axis=-1)
+
+
+def robot_dynamics_into(x, w, out):
+    """
+    robot_dynamics zapisujące pochodne do bufora out (kształt x) - bez tworzenia nowych tablic. \n
+    Przekroje x[..., k] są widokami, więc ta sama funkcja działa dla pojedynczego robota i dla floty (N, 3).
+    """
+    if x.ndim == 1:
+        # pojedynczy robot - działania na skalarach numpy są tańsze od ufunc na widokach 0-wymiarowych,
+        # a dają bit w bit ten sam wynik co te same funkcje na kolumnach floty
+        x3, w1 = x[2], w[0]
+        out[0] = np.cos(x3) * w1
+        out[1] = np.sin(x3) * w1
+        out[2] = w[1]
+        return out
+    x3 = x[..., 2]
+    w1 = w[..., 0]
+    dx1_dt, dx2_dt = out[..., 0], out[..., 1]
+    np.cos(x3, out=dx1_dt)
+    np.multiply(dx1_dt, w1, out=dx1_dt)
+    np.sin(x3, out=dx2_dt)
+    np.multiply(dx2_dt, w1, out=dx2_dt)
+    out[..., 2] = w[..., 1]
+    return out
+
+
+def robot_dynamics_scalar(x, w):
+    """
+    robot_dynamics pojedynczego robota na liczbach Pythona (x, w - listy) - szybka ścieżka ExplicitRungeKutta.
+    math.cos/math.sin dają tu te same wartości co np.cos/np.sin na kolumnach floty.
+    """
+    x3, w1 = x[2], w[0]
+    return math.cos(x3) * w1, math.sin(x3) * w1, w[1]
+
+
+# kroki step(x, w, h) dla wszystkich tablic Butchera (np. RK_STEPS['rk38']); dawne funkcje kroku z task_5.py:
+# euler_step - Euler, rk2_step - punkt środkowy (k₂ = h f(xₙ + k₁/2)), rk4_step - klasyczna RK-4
+RK_STEPS = {method: ExplicitRungeKutta(robot_dynamics_into, method, robot_dynamics_scalar) for method in TABLEAUS}
+euler_step = RK_STEPS['euler']
+rk2_step = RK_STEPS['midpoint']
+rk4_step = RK_STEPS['rk4']
+# metody wielokrokowe ABM-4 (pamiętają pochodne z poprzednich kroków - zob. multistep.py)
+MULTISTEP_STEPS = {'abm4': AdamsBashforthMoulton(robot_dynamics_into, 'PECE'),
+                   'abm4_pec': AdamsBashforthMoulton(robot_dynamics_into, 'PEC')}
+abm4_step = MULTISTEP_STEPS['abm4']
+
+
+def exact_step(x, w, h):
+    """Dokładne (analityczne) przejście o czas h przy stałych sterowaniach - ruch po łuku okręgu lub odcinku. \n
+    x₃(t+h) = x₃ + w₂h \n
+    x₁(t+h) = x₁ + w₁h · sinc(w₂h/2) · cos(x₃ + w₂h/2) \n
+    x₂(t+h) = x₂ + w₁h · sinc(w₂h/2) · sin(x₃ + w₂h/2) \n
+    gdzie sinc(z) = sin(z)/z, sinc(0) = 1 - wzór nie dzieli przez w₂, więc jest poprawny także w granicy
+    w₂ → 0 (ruch prostoliniowy). Koszt nie zależy od h, więc całą fazę można pokonać jednym krokiem.
+    """
+    if np.ndim(h) == np.ndim(x) and np.ndim(x) > 1:
+        h = np.asarray(h)[..., 0]  # krok (N, 1) z trybu zespołowego
+    x3 = x[..., 2]
+    w1 = w[..., 0]
+    w2 = w[..., 1]
+    dx3 = w2 * h
+    chord = w1 * h * np.sinc(dx3 / (2 * np.pi))  # np.sinc(z) = sin(πz)/(πz)
+    x3_mid = x3 + 0.5 * dx3
+    return np.stack([x[..., 0] + chord * np.cos(x3_mid),
+                     x[..., 1] + chord * np.sin(x3_mid),
+                     x3 + dx3], axis=-1)
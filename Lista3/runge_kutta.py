@@ -0,0 +1,148 @@
+"""
+Jawne metody Rungego-Kutty opisane tablicami Butchera - jeden silnik zamiast osobno pisanych kroków
+Eulera, RK-2 i RK-4.
+
+Krok metody s-etapowej (a, b, c):
+Kᵢ = f(xₙ + h Σⱼ<ᵢ aᵢⱼ Kⱼ), x_{n+1} = xₙ + h Σ bᵢ Kᵢ.
+Prawa strona ma postać rhs_into(x, *args, out=...) i zapisuje pochodne do podanego bufora etapu, a bufory
+etapów i stanu pośredniego (przestrzeń robocza) tworzone są raz dla danego kształtu stanu i używane przez
+cały przebieg - krok ze skalarnym h nie tworzy nowych tablic (step_into z out=x aktualizuje stan w miejscu).
+Dla pojedynczego stanu o kilku składowych obsługa buforów numpy kosztuje więcej niż same działania, więc
+z opcjonalną prawą stroną rhs_scalar (na listach liczb Pythona) krok liczony jest bez numpy.
+Dodanie metody to dopisanie jej tablicy do TABLEAUS.
+"""
+import numpy as np
+
+# tablice Butchera (a, b, c) jawnych metod RK (a ściśle dolnotrójkątna)
+TABLEAUS = {
+    'euler': (np.array([[0.0]]), np.array([1.0]), np.array([0.0])),
+    'heun': (np.array([[0.0, 0.0], [1.0, 0.0]]), np.array([0.5, 0.5]), np.array([0.0, 1.0])),
+    'midpoint': (np.array([[0.0, 0.0], [0.5, 0.0]]), np.array([0.0, 1.0]), np.array([0.0, 0.5])),
+    'rk4': (np.array([[0.0, 0.0, 0.0, 0.0], [0.5, 0.0, 0.0, 0.0], [0.0, 0.5, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]]),
+            np.array([1 / 6, 1 / 3, 1 / 3, 1 / 6]), np.array([0.0, 0.5, 0.5, 1.0])),
+    'rk38': (np.array([[0.0, 0.0, 0.0, 0.0], [1 / 3, 0.0, 0.0, 0.0], [-1 / 3, 1.0, 0.0, 0.0],
+                       [1.0, -1.0, 1.0, 0.0]]),
+             np.array([1 / 8, 3 / 8, 3 / 8, 1 / 8]), np.array([0.0, 1 / 3, 2 / 3, 1.0])),
+    'ssprk3': (np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.25, 0.25, 0.0]]),
+               np.array([1 / 6, 1 / 6, 2 / 3]), np.array([0.0, 1.0, 0.5])),
+}
+TABLEAU_NAMES = {'euler': 'jawna metoda Eulera', 'heun': 'metoda Heuna (RK-2)',
+                 'midpoint': 'metoda punktu środkowego (RK-2)', 'rk4': 'klasyczna metoda RK-4',
+                 'rk38': 'metoda RK-4 (reguła 3/8)', 'ssprk3': 'SSP-RK3 (Shu-Osher)'}
+
+
+def _combine(stages, terms, out, scratch):
+    """out = Σ (cⱼh) Kⱼ dla par (j, cⱼh) z terms - tylko działania w miejscu na buforach."""
+    j, coefficient = terms[0]
+    np.multiply(stages[j], coefficient, out=out)
+    for j, coefficient in terms[1:]:
+        np.multiply(stages[j], coefficient, out=scratch)
+        np.add(out, scratch, out=out)
+    return out
+
+
+def _combine_scalar(x, stages, terms):
+    """x + Σ (cⱼh) Kⱼ na listach liczb - kolejność działań jak w _combine, więc wynik jest bit w bit ten sam."""
+    j, coefficient = terms[0]
+    if len(terms) == 1:  # etapy RK-4, punktu środkowego i Eulera
+        return [x_i + k * coefficient for x_i, k in zip(x, stages[j])]
+    total = [k * coefficient for k in stages[j]]
+    for j, coefficient in terms[1:]:
+        total = [t + k * coefficient for t, k in zip(total, stages[j])]
+    return [x_i + t for x_i, t in zip(x, total)]
+
+
+class ExplicitRungeKutta:
+    """
+    Krok jawnej metody RK o tablicy Butchera z TABLEAUS; wywołanie step(x, *args, h) ma tę samą postać co
+    funkcje kroku z task_5.py (step(x, w, h)), więc obiekt może je zastąpić.
+
+    Args:
+        rhs_into (callable): Prawa strona rhs_into(x, *args, out=bufor) zapisująca dx/dt do bufora.
+        method (str): Klucz TABLEAUS.
+        rhs_scalar (callable): Opcjonalna prawa strona rhs_scalar(x, *args) dla pojedynczego stanu - x i args
+            jako listy liczb Pythona, wynik to sekwencja pochodnych; używana przez step_into dla stanu 1-D
+            i skalarnego h.
+
+    Attributes:
+        n_rhs (int): Liczba wywołań prawej strony od utworzenia obiektu.
+    """
+
+    def __init__(self, rhs_into, method, rhs_scalar=None):
+        if method not in TABLEAUS:
+            raise ValueError(f"Nieznana metoda {method!r} (dostępne: {', '.join(TABLEAUS)})")
+        a, b, _ = TABLEAUS[method]
+        self.rhs_into = rhs_into
+        self.rhs_scalar = rhs_scalar
+        self.method = method
+        # niezerowe współczynniki wierszy a (etapy 2..s) i wag b jako pary (j, cⱼ) - kombinacje pomijają zera
+        # tablicy; pierwszy etap metody jawnej to zawsze f(xₙ)
+        self._terms = [[(j, float(a[i, j])) for j in range(i) if a[i, j] != 0] for i in range(1, len(b))]
+        self._terms.append([(i, float(b_i)) for i, b_i in enumerate(b) if b_i != 0])
+        self._h = None
+        self._scaled_terms = None  # pary (j, cⱼ·h) dla ostatniego skalarnego kroku h
+        self._workspaces = {}  # kształt stanu -> (bufory etapów, stan etapu, bufor pomocniczy)
+        self.n_rhs = 0
+
+    @property
+    def n_stages(self):
+        return len(self._terms)
+
+    def _workspace(self, shape):
+        workspace = self._workspaces[shape] = (list(np.empty((self.n_stages,) + shape)), np.empty(shape),
+                                               np.empty(shape))
+        return workspace
+
+    def _scale(self, h):
+        return [[(j, coefficient * h) for j, coefficient in terms] for terms in self._terms]
+
+    def step_into(self, x, *args, out):
+        """
+        Jeden krok zapisany do out (może to być samo x - stan jest wtedy aktualizowany w miejscu). \n
+        Ostatni z args to krok h (skalar albo tablica rozgłaszana na kształt stanu, np. (N, 1) dla floty).
+        Działania są te same dla obu postaci h i wykonywane element po elemencie, więc robot floty dostaje
+        bit w bit ten sam wynik co w osobnej symulacji.
+
+        Returns:
+            np.array: out
+        """
+        h = args[-1]
+        args = args[:-1]
+        if self.rhs_scalar is not None and x.ndim == 1 and not isinstance(h, np.ndarray):
+            return self._step_scalar(x, args, h, out)
+        stages, state, scratch = self._workspaces.get(x.shape) or self._workspace(x.shape)
+        if isinstance(h, np.ndarray):  # krok osobny dla każdego robota floty (np.ndim jest tu za wolne)
+            scaled_terms = self._scale(h)
+        elif h == self._h:
+            scaled_terms = self._scaled_terms
+        else:
+            self._h, self._scaled_terms = h, self._scale(h)
+            scaled_terms = self._scaled_terms
+
+        rhs_into = self.rhs_into
+        rhs_into(x, *args, out=stages[0])
+        for i in range(1, len(stages)):
+            np.add(x, _combine(stages, scaled_terms[i - 1], state, scratch), out=state)
+            rhs_into(state, *args, out=stages[i])
+        self.n_rhs += len(stages)
+        return np.add(x, _combine(stages, scaled_terms[-1], state, scratch), out=out)
+
+    def _step_scalar(self, x, args, h, out):
+        """Krok step_into pojedynczego stanu na liczbach Pythona (rhs_scalar) - te same działania, ta sama kolejność."""
+        if h != self._h:
+            self._h, self._scaled_terms = h, self._scale(h)
+        scaled_terms = self._scaled_terms
+        rhs_scalar = self.rhs_scalar
+        x_list = x.tolist()
+        args = [arg.tolist() if isinstance(arg, np.ndarray) else arg for arg in args]
+        stages = [rhs_scalar(x_list, *args)]
+        for terms in scaled_terms[:-1]:
+            stages.append(rhs_scalar(_combine_scalar(x_list, stages, terms), *args))
+        self.n_rhs += len(stages)
+        out[:] = tuple(_combine_scalar(x_list, stages, scaled_terms[-1]))
+        return out
+
+    def __call__(self, x, *args):
+        """Jeden krok step(x, *args, h) zwracający nowy stan (x pozostaje bez zmian)."""
+        x = np.asarray(x, dtype=float)
+        return self.step_into(x, *args, out=np.empty_like(x))
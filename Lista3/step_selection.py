@@ -0,0 +1,137 @@
+"""
+Automatyczny dobór kroku h do zadanej tolerancji (tryb "auto-h") - ekstrapolacja Richardsona.
+
+Dla metody rzędu p błąd wyniku zachowuje się jak E(h) ≈ C·hᵖ, więc różnica wyników dla kroków h i h/2
+wynosi y(h) - y(h/2) ≈ C·hᵖ·(1 - 2⁻ᵖ). Trzy symulacje (h₀, h₀/2, h₀/4) dają:
+- zaobserwowany rząd p = log₂(|y(h₀) - y(h₀/2)| / |y(h₀/2) - y(h₀/4)|),
+- stałą C, a z niej największy krok h spełniający C·hᵖ ≤ tolerancja.
+Wybrany krok jest sprawdzany parą (h, h/2) - gdy oszacowany błąd przekracza tolerancję, h jest zmniejszane.
+Para (h, h/2) daje też wynik ekstrapolowany y(h/2) + (y(h/2) - y(h)) / (2ᵖ - 1) - rząd wyższy niż metody.
+
+Wyniki porównywane są na siatce czasu grubszej symulacji (wartości drobniejszej interpolowane liniowo -
+przy krokach h i h/2 zaczynających się na granicach faz chwile siatki grubej leżą na siatce drobnej),
+a błąd to maksimum normy euklidesowej różnicy po wszystkich chwilach.
+"""
+import numpy as np
+
+ERROR_FLOOR = 1e-14  # różnice poniżej tego poziomu to błędy zaokrągleń, nie błąd metody
+TARGETS = ('end', 'trajectory')  # tolerancja położenia końcowego albo całej trajektorii
+
+
+def _on_grid(t, run):
+    """Wartości symulacji run = (t, y) w chwilach t (interpolacja liniowa każdej kolumny y)."""
+    t_run, y_run = run
+    return np.column_stack([np.interp(t, t_run, column) for column in np.asarray(y_run).T])
+
+
+def difference(coarse, fine):
+    """Maksymalna norma różnicy wyników grubszej i drobniejszej symulacji na siatce grubszej."""
+    t, y = coarse
+    return float(np.max(np.linalg.norm(np.asarray(y) - _on_grid(t, fine), axis=-1)))
+
+
+def observed_order(runs, ratio=2.0):
+    """Zaobserwowany rząd zbieżności z trzech wyników dla kroków h, h/ratio, h/ratio² (nan, gdy nieokreślony)."""
+    coarse, fine, finest = runs
+    d_coarse, d_fine = difference(coarse, fine), difference(fine, finest)
+    if d_coarse <= ERROR_FLOOR or d_fine <= ERROR_FLOOR:
+        return np.nan
+    return float(np.log(d_coarse / d_fine) / np.log(ratio))
+
+
+def extrapolate(coarse, fine, order, ratio=2.0):
+    """Ekstrapolacja Richardsona na siatce grubszej: y_f + (y_f - y_c) / (ratioᵖ - 1)."""
+    t, y = coarse
+    y_fine = _on_grid(t, fine)
+    return t, y_fine + (y_fine - np.asarray(y)) / (ratio ** order - 1)
+
+
+def select_step(simulate, tolerance, order, h_start, h_max=None, h_min=None, safety=0.8, max_iterations=8):
+    """
+    Największy krok h, dla którego oszacowany błąd symulacji nie przekracza tolerance. \n
+    Zaobserwowany rząd jest przycinany do [p/2, 3p/2] nominalnego rzędu metody (poza obszarem asymptotycznym
+    bywa przypadkowy); gdy różnice są na poziomie zaokrągleń (metoda dokładna dla danego ruchu), wybierane jest h_max.
+
+    Args:
+        simulate (callable): simulate(h) -> (t, y) - chwile (K,) i wyniki (K, d), np. położenie końcowe
+            (K = 1) albo cała trajektoria położenia.
+        tolerance (float): Dopuszczalny błąd (w jednostkach y).
+        order (float): Nominalny rząd metody.
+        h_start (float): Krok pierwszej symulacji szacującej rząd i stałą błędu.
+        h_max (float): Największy dopuszczalny krok (domyślnie h_start).
+        h_min (float): Najmniejszy dopuszczalny krok - gdy tolerancja wymaga mniejszego, zgłaszany jest
+            ValueError (zamiast wielominutowej symulacji); domyślnie bez ograniczenia.
+        safety (float): Współczynnik bezpieczeństwa mnożący krok wyznaczony z modelu błędu.
+        max_iterations (int): Limit prób sprawdzających wybrany krok.
+
+    Returns:
+        dict: h, error (oszacowany błąd wyniku dla h), order (użyty rząd), observed_order, t, y (wynik dla h),
+        extrapolated (wynik ekstrapolowany na siatce t), converged, n_simulations.
+    """
+    if tolerance <= 0:
+        raise ValueError("Tolerancja musi być dodatnia")
+    h_max = h_start if h_max is None else h_max
+    runs = {}
+
+    def run(h):
+        if h not in runs:
+            runs[h] = simulate(h)
+        return runs[h]
+
+    # rząd i stała błędu z trzech symulacji h₀, h₀/2, h₀/4
+    h_start = min(h_start, h_max)
+    coarse, fine, finest = run(h_start), run(h_start / 2), run(h_start / 4)
+    measured = observed_order((coarse, fine, finest))
+    p = order if not np.isfinite(measured) else float(np.clip(measured, 0.5 * order, 1.5 * order))
+    d_fine = difference(fine, finest)
+    if d_fine <= ERROR_FLOOR:
+        h = h_max
+    else:
+        constant = d_fine / ((h_start / 2) ** p * (1 - 2.0 ** -p))
+        h = min(h_max, safety * (tolerance / constant) ** (1 / p))
+
+    # sprawdzenie parą (h, h/2) i ewentualne zmniejszanie kroku
+    converged = False
+    for iteration in range(max_iterations):
+        if h_min is not None and h < h_min:
+            raise ValueError(f"Tolerancja {tolerance:g} wymaga kroku h={h:.3g} < {h_min:.3g} - wybierz większą "
+                             f"tolerancję lub metodę wyższego rzędu")
+        coarse, fine = run(h), run(h / 2)
+        error = difference(coarse, fine) / (1 - 2.0 ** -p)
+        if error <= tolerance:
+            converged = True
+            break
+        if iteration < max_iterations - 1:  # wynik ostatniej próby zwracany jest z jej krokiem
+            h *= max(0.2, safety * (tolerance / error) ** (1 / p))
+
+    t, extrapolated = extrapolate(coarse, fine, p)
+    return {'h': h, 'error': error, 'order': p, 'observed_order': measured, 't': t,
+            'y': np.asarray(coarse[1]), 'extrapolated': extrapolated, 'converged': converged,
+            'n_simulations': len(runs)}
+
+
+def positions_target(t_history, x1_history, x2_history, target):
+    """Wynik symulacji robota dla select_step: położenie końcowe ('end') lub cała trajektoria ('trajectory')."""
+    if target not in TARGETS:
+        raise ValueError(f"Nieznany cel tolerancji {target!r} (dostępne: {', '.join(TARGETS)})")
+    if target == 'end':
+        return np.asarray(t_history)[-1:], np.array([[x1_history[-1], x2_history[-1]]])
+    return np.asarray(t_history), np.column_stack((x1_history, x2_history))
+
+
+def selection_summary(selection):
+    """Słownik wyników auto-h do raportu scenariusza (bez tablic trajektorii poza punktem końcowym)."""
+    return {'h': selection['h'], 'estimated_error': selection['error'], 'order': selection['order'],
+            'observed_order': selection['observed_order'], 'converged': selection['converged'],
+            'n_simulations': selection['n_simulations'],
+            'extrapolated_end_position': selection['extrapolated'][-1].tolist()}
+
+
+def print_selection(selection):
+    """Wypisuje wybrany krok, oszacowanie błędu i wynik ekstrapolowany (położenie końcowe)."""
+    x1_end, x2_end = selection['extrapolated'][-1]
+    status = '' if selection['converged'] else ' (NIE osiągnięto tolerancji w limicie prób)'
+    print(f"Auto-h: h = {selection['h']:.4g} s, szacowany błąd {selection['error']:.2e} m, rząd "
+          f"{selection['order']:.2f}, {selection['n_simulations']} symulacji próbnych{status}")
+    print(f"Wynik ekstrapolowany (Richardson, rząd wyższy niż metody): położenie końcowe "
+          f"({x1_end:.6f}, {x2_end:.6f})")
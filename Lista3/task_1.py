@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from implicit import IMPLICIT_METHODS, METHOD_NAMES, check_method, linear_step_matrices
+
 # parametry symulacji i obiektu
 T = 1.0      # stała czasowa
 k = 1.0      # wzmocnienie statyczne
@@ -14,20 +16,35 @@ h_values = [2.8 * T, 1.5 * T, 0.5 * T, 0.1 * T]
 
 # funkcje pobudzeń
 def step_input(t):
-    """Pobudzenie skokowe jednostkowe."""
-    return 1.0 if t >= 0 else 0.0
+    """Pobudzenie skokowe jednostkowe (t może być całym wektorem czasu)."""
+    return np.where(t >= 0, 1.0, 0.0)
 
 
 def impulse_input(t, h):
-    """Przybliżone pobudzenie impulsowe (delta Diraca)."""
-    return 1.0 / h if 0 <= t < h else 0.0
+    """Przybliżone pobudzenie impulsowe (delta Diraca) (t może być całym wektorem czasu)."""
+    return np.where((0 <= t) & (t < h), 1.0 / h, 0.0)
 
 
-# symulacja metodą Eulera
-def euler_simulation(h, input_type):
-    """Wykonuje symulację jawną metodą Eulera dla danego h i typu pobudzenia."""
-    n_steps = int(t_end / h)
-    t = np.linspace(t_start, t_end, n_steps + 1)
+# rozwiązania analityczne (wzory z poprzedniej listy, zadanie 2)
+def analytical_response(t, input_type, T=T, k=k):
+    """Odpowiedź analityczna członu inercyjnego na skok jednostkowy lub deltę Diraca."""
+    if input_type == 'step':
+        return k * (1 - np.exp(-t / T))
+    return (k / T) * np.exp(-t / T)
+
+
+# symulacja metodą Eulera (lub metodą niejawną)
+def euler_simulation(h, input_type, T=T, k=k, y0=y0, t_end=t_end, method='euler'):
+    """
+    Wykonuje symulację jawną metodą Eulera dla danego h i typu pobudzenia (domyślnie parametry z góry pliku). \n
+    method: 'euler' (jawna metoda Eulera) albo metoda niejawna z implicit.py - 'backward_euler', 'trapezoidal'
+    lub 'sdirk2'; metody niejawne są stabilne dla każdego h (także h > 2T, gdzie jawny Euler oscyluje i rośnie).
+    """
+    check_method(method)
+    # przy h większym niż przedział jeden krok obejmuje cały przedział (jak w zoh_simulation z zadania 2)
+    h = min(h, t_end - t_start)
+    n_steps = max(1, int((t_end - t_start) / h))
+    t = t_start + np.arange(n_steps + 1) * h  # y[n] to przybliżenie w chwili t_start + n*h
     y = np.zeros(n_steps + 1)
     u = np.zeros(n_steps + 1)
 
@@ -35,13 +52,21 @@ def euler_simulation(h, input_type):
 
     # generowanie sygnału wejściowego (w zależności od typu impulsu)
     if input_type == 'step':
-        for i in range(n_steps + 1):
-            u[i] = step_input(t[i])
+        u[:] = step_input(t)
     elif input_type == 'impulse':
         # impuls niezerowy tylko na początku
         if n_steps > 0:
             u[0] = 1.0 / h  # impuls o całce 1
 
+    if method in IMPLICIT_METHODS:
+        # człon liniowy y' = -y/T + (k/T)u - krok metody niejawnej to y[n+1] = P y[n] + G u[n],
+        # współczynniki liczone raz (pobudzenie trzymane przez krok, jak w metodzie jawnej)
+        P, G = linear_step_matrices([[-1.0 / T]], [k / T], h, method)
+        P, G = P.item(), G.item()
+        for n in range(n_steps):
+            y[n+1] = P * y[n] + G * u[n]
+        return t, y
+
     # pętla symulacji - jawna metoda Eulera
     for n in range(n_steps):
         dy_dt = (k * u[n] - y[n]) / T  # przekształcenie wzoru: T * dy/dt + y = ku (człon inercyjny)
@@ -50,46 +75,61 @@ def euler_simulation(h, input_type):
     return t, y
 
 
-# 1. Wykres odpowiedzi na skok jednostkowy
-plt.figure(figsize=(10, 6))
-plt.title(f'Odpowiedź skokowa członu inercyjnego (T={T}, k={k})\njawna metoda Eulera')
-
-# rozwiązanie analityczne dla skoku jednostkowego (dla porównania)
-t_analytical = np.linspace(t_start, t_end, 200)
-y_analytical_step = k * (1 - np.exp(-t_analytical / T))  # wzór z poprzedniej listy (zadanie 2)
-plt.plot(t_analytical, y_analytical_step, 'k--', label='rozwiązanie analityczne', linewidth=2)
-
-# symulacje dla różnych h
-for h in h_values:
-    t_sim, y_sim = euler_simulation(h, 'step')
-    plt.plot(t_sim, y_sim, '-', label=f'jawny Euler, h={h:.2f} s', markersize=3, linewidth=1)
-
-plt.xlabel('Czas [s]')
-plt.ylabel('Odpowiedź y(t)')
-plt.legend()
-plt.grid(True)
-plt.ylim(bottom=min(y0, 0)-0.1, top=k*1.1)  # dostosowanie zakresu osi y
-plt.show()
-
-# 2. Wykres odpowiedzi na impuls jednostkowy
-plt.figure(figsize=(10, 6))
-plt.title(f'Odpowiedź impulsowa członu inercyjnego (T={T}, k={k})\njawna metoda Eulera (przybliżona delta Diraca)')
-
-# rozwiązanie analityczne dla impulsu jednostkowego (delta Diraca)
-y_analytical_impulse = (k / T) * np.exp(-t_analytical / T)  # wzór z poprzedniej listy (zadanie 2)
-plt.plot(t_analytical, y_analytical_impulse, 'k--', label='rozwiązanie analityczne', linewidth=2)
-
-# symulacje dla różnych h
-for h in h_values:
-    t_sim, y_sim = euler_simulation(h, 'impulse')
-    if h >= 2*T:
-        # jeśli wartości są bardzo duże, ograniczamy oś Y dla czytelności
-        if np.any(np.abs(y_sim) > 10 * (k/T)):
-            plt.ylim(top=10*(k/T), bottom=min(0,-0.1*(k/T)))
-    plt.plot(t_sim, y_sim, '-', label=f'jawny Euler, h={h:.2f} s', markersize=3, linewidth=1)
-
-plt.xlabel('Czas [s]')
-plt.ylabel('Odpowiedź y(t)')
-plt.legend()
-plt.grid(True)
-plt.show()
+if __name__ == '__main__':
+    # 1. Wykres odpowiedzi na skok jednostkowy
+    plt.figure(figsize=(10, 6))
+    plt.title(f'Odpowiedź skokowa członu inercyjnego (T={T}, k={k})\njawna metoda Eulera')
+
+    # rozwiązanie analityczne dla skoku jednostkowego (dla porównania)
+    t_analytical = np.linspace(t_start, t_end, 200)
+    y_analytical_step = analytical_response(t_analytical, 'step')  # wzór z poprzedniej listy (zadanie 2)
+    plt.plot(t_analytical, y_analytical_step, 'k--', label='rozwiązanie analityczne', linewidth=2)
+
+    # symulacje dla różnych h
+    for h in h_values:
+        t_sim, y_sim = euler_simulation(h, 'step')
+        plt.plot(t_sim, y_sim, '-', label=f'jawny Euler, h={h:.2f} s', markersize=3, linewidth=1)
+
+    plt.xlabel('Czas [s]')
+    plt.ylabel('Odpowiedź y(t)')
+    plt.legend()
+    plt.grid(True)
+    plt.ylim(bottom=min(y0, 0)-0.1, top=k*1.1)  # dostosowanie zakresu osi y
+    plt.show()
+
+    # 2. Wykres odpowiedzi na impuls jednostkowy
+    plt.figure(figsize=(10, 6))
+    plt.title(f'Odpowiedź impulsowa członu inercyjnego (T={T}, k={k})\njawna metoda Eulera (przybliżona delta Diraca)')
+
+    # rozwiązanie analityczne dla impulsu jednostkowego (delta Diraca)
+    y_analytical_impulse = analytical_response(t_analytical, 'impulse')  # wzór z poprzedniej listy (zadanie 2)
+    plt.plot(t_analytical, y_analytical_impulse, 'k--', label='rozwiązanie analityczne', linewidth=2)
+
+    # symulacje dla różnych h
+    for h in h_values:
+        t_sim, y_sim = euler_simulation(h, 'impulse')
+        if h >= 2*T:
+            # jeśli wartości są bardzo duże, ograniczamy oś Y dla czytelności
+            if np.any(np.abs(y_sim) > 10 * (k/T)):
+                plt.ylim(top=10*(k/T), bottom=min(0,-0.1*(k/T)))
+        plt.plot(t_sim, y_sim, '-', label=f'jawny Euler, h={h:.2f} s', markersize=3, linewidth=1)
+
+    plt.xlabel('Czas [s]')
+    plt.ylabel('Odpowiedź y(t)')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+
+    # 3. Metody niejawne przy kroku, przy którym jawny Euler oscyluje (h = 2.8T > 2T)
+    plt.figure(figsize=(10, 6))
+    h = h_values[0]
+    plt.title(f'Odpowiedź skokowa członu inercyjnego (T={T}, k={k}), h={h:.2f} s\nmetody jawne i niejawne')
+    plt.plot(t_analytical, y_analytical_step, 'k--', label='rozwiązanie analityczne', linewidth=2)
+    for method, method_name in METHOD_NAMES.items():
+        t_sim, y_sim = euler_simulation(h, 'step', method=method)
+        plt.plot(t_sim, y_sim, 'o-', label=method_name, markersize=4, linewidth=1)
+    plt.xlabel('Czas [s]')
+    plt.ylabel('Odpowiedź y(t)')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
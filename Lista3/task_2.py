@@ -1,6 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from implicit import IMPLICIT_METHODS, NewtonStepper, check_method, linear_step_matrices
+from matrix_exponential import expm
+from plotting import plot_decimated
+from signals import Signal, PulseTrain
+
 
 def inertial_2nd_order(x, t, u, k, T, zeta):
     """
@@ -37,171 +42,506 @@ def sinusoidal_input(t, amplitude, frequency):
 def periodic_impulse_input(t, h, impulse_strength, period):
     """
     Okresowe pobudzenie impulsowe. \n
-    Impuls o całce 'impulse_strength' co okres 'period' realizowany jako prostokąt o wymiarach 'h' x 'strength/h'.
+    Impuls o całce 'impulse_strength' co okres 'period' realizowany jako prostokąt o wymiarach 'h' x 'strength/h'. \n
+    Działa zarówno dla pojedynczej chwili t, jak i dla całego wektora czasu.
     """
     time_within_period = t % period
-    if 0 <= time_within_period < h:
-        # sprawdzenie czy t jest bliskie wielokrotności period (z powodu błędów numerycznych)
-        if abs(t - round(t / period) * period) < h / 2.0:
-            return impulse_strength / h
-        else:
-            return 0.0  # przypadek np. t=1.99999, period=2, h=0.1 -> time_within_period=1.9999, ale to nie start
+    # sprawdzenie czy t jest bliskie wielokrotności period (z powodu błędów numerycznych),
+    # np. t=1.99999, period=2, h=0.1 -> time_within_period=1.9999, ale to nie start
+    near_period_start = np.abs(t - np.round(t / period) * period) < h / 2.0
+    return np.where((0 <= time_within_period) & (time_within_period < h) & near_period_start,
+                    impulse_strength / h, 0.0)
+
+
+def sample_input(input_func, input_params, t_vec, h):
+    """Sygnał wejściowy liczony jednym wywołaniem dla całego wektora czasu."""
+    if isinstance(input_func, Signal):
+        return input_func(t_vec)
+    elif input_func == periodic_impulse_input:  # specjalna obsługa dla impulsu okresowego - podajemy h
+        return input_func(t_vec, h, *input_params)
     else:
-        return 0.0
+        return input_func(t_vec, *input_params)
 
 
-def euler_simulation(system_func, system_params, input_func, input_params, t_span, h, x0):
+def euler_simulation(system_func, system_params, input_func, input_params, t_span, h, x0, sink=None,
+                     method='euler'):
     """
-    Wykonuje symulację metodą Eulera.
+    Wykonuje symulację metodą Eulera (lub metodą niejawną).
 
     Args:
         system_func: Funkcja obliczająca pochodne stanu.
         system_params: Słownik lub krotka z parametrami systemu (k, T, zeta lub k, T).
-        input_func: Funkcja generująca sygnał wejściowy.
-        input_params: Słownik lub krotka z parametrami sygnału wejściowego.
+        input_func: Funkcja generująca sygnał wejściowy (wektorowo) lub obiekt Signal.
+        input_params: Słownik lub krotka z parametrami sygnału wejściowego (pomijane dla Signal).
         t_span: Krotka (t_start, t_end) określająca czas symulacji.
         h: Krok dyskretyzacji.
         x0: Wektor stanu początkowego.
+        sink: Opcjonalny TrajectoryStore z kolumnami (t, x1, ..., xn, u) - wyniki są wtedy zapisywane
+            na dysk blokami po sink.chunk_size próbek zamiast trzymania całych wektorów w pamięci.
+        method: 'euler' (jawna metoda Eulera) albo metoda niejawna z implicit.py - 'backward_euler',
+            'trapezoidal' lub 'sdirk2'. Dla członów z STATE_SPACE_MODELS krok niejawny to jedno mnożenie
+            przez macierze liczone raz, dla innych prawych stron - metoda Newtona z jakobianem używanym ponownie.
 
     Returns:
         t_vec: Wektor czasu.
         y_vec: Wektor odpowiedzi systemu (pierwszy element stanu).
         u_vec: Wektor użytego sygnału wejściowego.
+        (przy zapisie do sink - kolumny odczytane z dysku jako np.memmap)
     """
+    check_method(method)
     t_start, t_end = t_span
-    n_steps = int((t_end - t_start) / h)
-    t_vec = np.linspace(t_start, t_end, n_steps + 1)
+    # przy h większym niż przedział jeden krok obejmuje cały przedział (jak w zoh_simulation)
+    h = min(h, t_end - t_start)
+    stepper = None
+    if method in IMPLICIT_METHODS:
+        if system_func in STATE_SPACE_MODELS:
+            A, B, _ = STATE_SPACE_MODELS[system_func](*system_params)
+            P, G = linear_step_matrices(A, B, h, method)
+        else:
+            stepper = NewtonStepper(lambda x, t, u: system_func(x, t, u, *system_params), method)
+
+    n_steps = max(1, int((t_end - t_start) / h))
+    t_step = (t_end - t_start) / n_steps
 
     num_states = len(x0)
-    x_vec = np.zeros((num_states, n_steps + 1))
-    u_vec = np.zeros(n_steps + 1)
+    x_n = np.array(x0, dtype=float)
+    chunk_size = n_steps + 1 if sink is None else sink.chunk_size
+
+    for i0 in range(0, n_steps + 1, chunk_size):
+        i1 = min(i0 + chunk_size, n_steps + 1)
+        # fragment wektora czasu - te same wartości co np.linspace(t_start, t_end, n_steps + 1)[i0:i1]
+        t_vec = t_start + np.arange(i0, i1) * t_step
+        if i1 == n_steps + 1:
+            t_vec[-1] = t_end
+        x_vec = np.zeros((num_states, i1 - i0))
+        u_vec = np.zeros(i1 - i0)
+
+        u_vec[:] = sample_input(input_func, input_params, t_vec, h)
+
+        # pętla symulacji - jawna metoda Eulera (albo krok metody niejawnej)
+        for j in range(i1 - i0):
+            x_vec[:, j] = x_n
+            if i0 + j == n_steps:
+                break
+            t_n = t_vec[j]
+            u_n = u_vec[j]  # pobudzenie w chwili t_n
+
+            if method in IMPLICIT_METHODS:
+                # krok metody niejawnej (pobudzenie u_n trzymane przez cały krok)
+                x_n = P @ x_n + G * u_n if stepper is None else stepper.step(x_n, t_n, u_n, h)
+                continue
+
+            # obliczenie pochodnych w punkcie (t_n, x_n, u_n)
+            if system_func == inertial_2nd_order:
+                dx_dt = system_func(x_n, t_n, u_n, *system_params)  # k, T, zeta
+            elif system_func == integrating_inertial:
+                dx_dt = system_func(x_n, t_n, u_n, *system_params)  # k, T
+
+            # krok Eulera
+            x_n = x_n + h * dx_dt
+
+        if sink is not None:
+            sink.write_block(np.column_stack((t_vec, x_vec.T, u_vec)))
+
+    if sink is not None:
+        sink.finish(method=method, h=h, t_span=list(t_span), x0=list(map(float, x0)),
+                    system=system_func.__name__, system_params=list(system_params))
+        t_vec, *x_columns, u_vec = sink.columns()
+        return t_vec, x_columns[0], u_vec
 
-    x_vec[:, 0] = x0
+    y_vec = x_vec[0, :]  # odpowiedź y(t) to pierwszy element stanu x1
+    return t_vec, y_vec, u_vec
 
-    # specjalna obsługa dla impulsu okresowego - podajemy h
-    if input_func == periodic_impulse_input:
-        for i, t in enumerate(t_vec):
-            u_vec[i] = input_func(t, h, *input_params)
-    else:
-         for i, t in enumerate(t_vec):
-            u_vec[i] = input_func(t, *input_params)
 
-    # pętla symulacji - jawna metoda Eulera
-    for n in range(n_steps):
-        t_n = t_vec[n]
-        x_n = x_vec[:, n]
-        u_n = u_vec[n]  # pobudzenie w chwili t_n
+def inertial_2nd_order_state_space(k, T, zeta):
+    """
+    Macierze modelu w przestrzeni stanów dla członu inercyjnego II rzędu. \n
+    ẋ = Ax + Bu, y = Cx, x = [y, dy/dt]
+    """
+    A = np.array([[0.0, 1.0],
+                  [-1.0 / T**2, -2.0 * zeta / T]])
+    B = np.array([0.0, k / T**2])
+    C = np.array([1.0, 0.0])
+    return A, B, C
 
-        # obliczenie pochodnych w punkcie (t_n, x_n, u_n)
-        if system_func == inertial_2nd_order:
-            dx_dt = system_func(x_n, t_n, u_n, *system_params)  # k, T, zeta
-        elif system_func == integrating_inertial:
-            dx_dt = system_func(x_n, t_n, u_n, *system_params)  # k, T
 
-        # krok Eulera
-        x_vec[:, n+1] = x_n + h * dx_dt
+def integrating_inertial_state_space(k, T):
+    """
+    Macierze modelu w przestrzeni stanów dla członu całkującego z inercją. \n
+    ẋ = Ax + Bu, y = Cx, x = [y, dy/dt]
+    """
+    A = np.array([[0.0, 1.0],
+                  [0.0, -1.0 / T]])
+    B = np.array([0.0, k / T])
+    C = np.array([1.0, 0.0])
+    return A, B, C
 
-    y_vec = x_vec[0, :]  # odpowiedź y(t) to pierwszy element stanu x1
+
+# człony liniowe, dla których znamy postać w przestrzeni stanów
+STATE_SPACE_MODELS = {
+    inertial_2nd_order: inertial_2nd_order_state_space,
+    integrating_inertial: integrating_inertial_state_space,
+}
+
+
+def zoh_discretize(A, B, h):
+    """
+    Dokładna dyskretyzacja z ekstrapolatorem zerowego rzędu (ZOH). \n
+    x[n+1] = Φx[n] + Γu[n], Φ = e^{Ah}, Γ = ∫₀ʰ e^{Aτ} dτ B \n
+    Obie macierze wyznaczane jednym wywołaniem expm dla macierzy rozszerzonej [[A, B], [0, 0]]·h.
+    """
+    n = A.shape[0]
+    M = np.zeros((n + 1, n + 1))
+    M[:n, :n] = A
+    M[:n, n] = B
+    E = expm(M * h)
+    return E[:n, :n], E[:n, n]
+
+
+def zoh_jump(Phi, Gamma, x0, u, n):
+    """
+    Stan po n krokach przy stałym pobudzeniu u, w O(log n) mnożeniach macierzy (potęgowanie przez podnoszenie
+    do kwadratu). \n
+    x[n] = Φⁿx[0] + (I + Φ + ... + Φⁿ⁻¹)Γu
+    """
+    # (P, S) = (Φᵐ, I + Φ + ... + Φᵐ⁻¹) dla bieżącego bloku m kroków; złożenie bloków: (P₁P₂, S₁ + P₁S₂)
+    block_P, block_S = Phi, np.eye(Phi.shape[0])
+    total_P, total_S = np.eye(Phi.shape[0]), np.zeros_like(Phi)
+    while n > 0:
+        if n & 1:
+            total_S = total_S + total_P @ block_S
+            total_P = total_P @ block_P
+        block_S = block_S + block_P @ block_S
+        block_P = block_P @ block_P
+        n >>= 1
+    return total_P @ x0 + total_S @ (Gamma * u)
+
+
+def zoh_state_at(system_func, system_params, u, t, h, x0):
+    """
+    Stan członu liniowego w chwili t (start w chwili 0 ze stanu x0) przy stałym pobudzeniu u, bez liczenia
+    stanów pośrednich: t // h kroków h przez zoh_jump i jeden krok dokładny o pozostałą część t.
+    """
+    A, B, _ = STATE_SPACE_MODELS[system_func](*system_params)
+    n_steps = int(t // h)
+    x = zoh_jump(*zoh_discretize(A, B, h), np.asarray(x0, dtype=float), u, n_steps)
+    rest = t - n_steps * h
+    if rest > 0:
+        Phi, Gamma = zoh_discretize(A, B, rest)
+        x = Phi @ x + Gamma * u
+    return x
+
+
+def zoh_simulation(system_func, system_params, input_func, input_params, t_span, h, x0):
+    """
+    Wykonuje symulację członu liniowego dokładną dyskretyzacją ZOH (argumenty jak w euler_simulation). \n
+    Macierze Φ, Γ liczone są raz, a każdy krok to jedno mnożenie macierz-wektor. Dla pobudzenia stałego
+    w każdym kroku wynik jest dokładny i stabilny dla dowolnie dużego h (brak granicy stabilności Eulera).
+
+    Returns:
+        t_vec: Wektor czasu.
+        y_vec: Wektor odpowiedzi systemu.
+        u_vec: Wektor użytego sygnału wejściowego (trzymanego przez cały krok).
+    """
+    t_start, t_end = t_span
+    # co najmniej jeden krok - przy h większym niż przedział jeden dokładny krok ZOH obejmuje cały przedział
+    n_steps = max(1, int((t_end - t_start) / h))
+    t_vec = np.linspace(t_start, t_end, n_steps + 1)
+
+    # dyskretyzujemy z rzeczywistym odstępem siatki t_vec (gdy t_span nie jest wielokrotnością h); z tym samym
+    # odstępem liczony jest impuls, więc jego całka (szerokość x wysokość) pozostaje równa impulse_strength
+    h_grid = (t_end - t_start) / n_steps
+    A, B, C = STATE_SPACE_MODELS[system_func](*system_params)
+    Phi, Gamma = zoh_discretize(A, B, h_grid)
+    u_vec = np.zeros(n_steps + 1)
+    u_vec[:] = sample_input(input_func, input_params, t_vec, h_grid)
+
+    x_vec = np.zeros((n_steps + 1, len(x0)))
+    x_vec[0] = x0
+    for n in range(n_steps):
+        x_vec[n + 1] = Phi @ x_vec[n] + Gamma * u_vec[n]
+
+    y_vec = x_vec @ C
     return t_vec, y_vec, u_vec
 
 
-# parametry członów
-k = 1.0          # wzmocnienie statyczne
-T = 1.0          # stała czasowa [s]
-zeta = 0.5       # współczynnik tłumienia (dla inercyjnego II rzędu)
-
-# parametry pobudzeń
-sin_amplitude = 1.0
-sin_frequency = 0.5     # w Hz
-impulse_strength = 1.0  # całka impulsu
-impulse_period = 5.0    # okres impulsów [s]
-
-# parametry symulacji
-t_start = 0.0
-t_end = 20.0                # całkowity czas symulacji [s]
-x0 = np.array([0.0, 0.0])   # stan początkowy [y(0), dy/dt(0)]
-h = 0.1                     # krok dyskretyzacji [s]
-
-print(f"Używany krok dyskretyzacji: h = {h} s")
-
-# symulacje
-
-# 1. Człon inercyjny II rzędu
-# pobudzenie sinusoidalne
-params_inertial2 = (k, T, zeta)
-t1_sin, y1_sin, u1_sin = euler_simulation(
-    inertial_2nd_order, params_inertial2,
-    sinusoidal_input, (sin_amplitude, sin_frequency),
-    (t_start, t_end), h, x0)
-
-# pobudzenie impulsowe (okresowe)
-t1_imp, y1_imp, u1_imp = euler_simulation(
-    inertial_2nd_order, params_inertial2,
-    periodic_impulse_input, (impulse_strength, impulse_period),
-    (t_start, t_end), h, x0)
-
-# 2. Człon całkujący z inercją
-# pobudzenie sinusoidalne
-params_integr_inertial = (k, T)
-t2_sin, y2_sin, u2_sin = euler_simulation(
-    integrating_inertial, params_integr_inertial,
-    sinusoidal_input, (sin_amplitude, sin_frequency),
-    (t_start, t_end), h, x0)
-
-# pobudzenie impulsowe (okresowe)
-t2_imp, y2_imp, u2_imp = euler_simulation(
-    integrating_inertial, params_integr_inertial,
-    periodic_impulse_input, (impulse_strength, impulse_period),
-    (t_start, t_end), h, x0)
-
-plt.style.use('seaborn-v0_8-whitegrid')  # lepszy wygląd wykresów
-
-# wykresy dla członu inercyjnego II rzędu
-fig1, axs1 = plt.subplots(2, 1, figsize=(10, 8))
-fig1.suptitle(f'Człon inercyjny II rzędu (T={T}, ζ={zeta}, k={k}) - jawna metoda Eulera (h={h})', fontsize=14)
-
-# pobudzenie sinusoidalne
-axs1[0].plot(t1_sin, u1_sin, 'r--', label='Pobudzenie u(t)', alpha=0.7)
-axs1[0].plot(t1_sin, y1_sin, 'b-', label='Odpowiedź y(t)')
-axs1[0].set_title('Odpowiedź na pobudzenie sinusoidalne')
-axs1[0].set_xlabel('Czas [s]')
-axs1[0].set_ylabel('Amplituda')
-axs1[0].legend()
-axs1[0].grid(True)
-
-# pobudzenie impulsowe (okresowe)
-axs1[1].plot(t1_imp, u1_imp, 'r--', label='Pobudzenie u(t)', alpha=0.7)
-axs1[1].plot(t1_imp, y1_imp, 'b-', label='Odpowiedź y(t)')
-axs1[1].set_title(f'Odpowiedź na pobudzenie impulsowe (siła={impulse_strength}, okres={impulse_period}s)')
-axs1[1].set_xlabel('Czas [s]')
-axs1[1].set_ylabel('Amplituda')
-axs1[1].legend()
-axs1[1].grid(True)
-
-plt.tight_layout(rect=[0, 0.03, 1, 0.95])  # miejsce na tytuł główny
-plt.show()
-
-# wykresy dla członu całkującego z inercją
-fig2, axs2 = plt.subplots(2, 1, figsize=(10, 8))
-fig2.suptitle(f'Człon całkujący z inercją (T={T}, k={k}) - jawna metoda Eulera (h={h})', fontsize=14)
-
-# pobudzenie sinusoidalne
-axs2[0].plot(t2_sin, u2_sin, 'r--', label='Pobudzenie u(t)', alpha=0.7)
-axs2[0].plot(t2_sin, y2_sin, 'g-', label='Odpowiedź y(t)')
-axs2[0].set_title('Odpowiedź na pobudzenie sinusoidalne')
-axs2[0].set_xlabel('Czas [s]')
-axs2[0].set_ylabel('Amplituda')
-axs2[0].legend()
-axs2[0].grid(True)
-
-# pobudzenie impulsowe (okresowe)
-axs2[1].plot(t2_imp, u2_imp, 'r--', label='Pobudzenie u(t)', alpha=0.7)
-axs2[1].plot(t2_imp, y2_imp, 'g-', label='Odpowiedź y(t)')
-axs2[1].set_title(f'Odpowiedź na pobudzenie impulsowe (siła={impulse_strength}, okres={impulse_period}s)')
-axs2[1].set_xlabel('Czas [s]')
-axs2[1].set_ylabel('Amplituda')
-axs2[1].legend()
-axs2[1].grid(True)
-
-plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-plt.show()
+# współczynniki metody Dormanda–Prince'a (RK45): węzły c, macierz A, wagi rzędu 5 (b) i błąd (E = b - b*)
+DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+DP_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+DP_E = DP_B - np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+# współczynniki interpolacji gęstej (dense output) 4. rzędu: x(t + θh) = x + h * (K^T P) [θ, θ², θ³, θ⁴]
+DP_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+
+def dormand_prince_simulation(system_func, system_params, input_func, input_params, t_span, x0,
+                              rtol=1e-6, atol=1e-9, h_init=None, h_max=np.inf,
+                              pulse_width=None, breakpoints=(), t_eval=None):
+    """
+    Wykonuje symulację adaptacyjną metodą Dormanda–Prince'a (RK45) z doborem kroku.
+
+    Krok jest dobierany tak, by szacowany błąd lokalny mieścił się w tolerancji rtol/atol. Nieciągłości
+    pobudzenia (np. zbocza impulsów co 'period') są rejestrowane jako punkty przerwania - solver
+    kończy na nich krok dokładnie i startuje od nowa, więc nie całkuje "przez" skok sygnału.
+
+    Args:
+        system_func: Funkcja obliczająca pochodne stanu.
+        system_params: Krotka z parametrami systemu (k, T, zeta lub k, T).
+        input_func: Funkcja generująca sygnał wejściowy lub obiekt Signal (jego nieciągłości są
+            rejestrowane automatycznie).
+        input_params: Krotka z parametrami sygnału wejściowego (pomijane dla Signal).
+        t_span: Krotka (t_start, t_end) określająca czas symulacji.
+        x0: Wektor stanu początkowego.
+        rtol: Względna tolerancja błędu lokalnego.
+        atol: Bezwzględna tolerancja błędu lokalnego.
+        h_init: Krok początkowy (domyślnie dobierany automatycznie).
+        h_max: Maksymalny krok.
+        pulse_width: Szerokość prostokąta dla periodic_impulse_input (odpowiednik 'h' z metody Eulera).
+        breakpoints: Dodatkowe chwile nieciągłości pobudzenia.
+        t_eval: Chwile, w których zwracane jest rozwiązanie (interpolacja gęsta). Domyślnie - chwile
+            zaakceptowanych kroków.
+
+    Returns:
+        t_vec: Wektor czasu.
+        y_vec: Wektor odpowiedzi systemu (pierwszy element stanu).
+        u_vec: Wektor sygnału wejściowego w chwilach t_vec.
+        stats: Słownik z liczbą wywołań prawych stron ('n_rhs') oraz kroków przyjętych/odrzuconych.
+    """
+    t_start, t_end = t_span
+    breakpoints = list(breakpoints)
+
+    if input_func == periodic_impulse_input:
+        if pulse_width is None:
+            raise ValueError("Dla pobudzenia impulsowego należy podać szerokość impulsu 'pulse_width'.")
+        # prostokąt o polu 'impulse_strength' na początku każdego okresu (wersja ciągła w czasie)
+        impulse_strength, period = input_params
+        input_func = PulseTrain(strength=impulse_strength, width=pulse_width, period=period)
+
+    if isinstance(input_func, Signal):
+        breakpoints.extend(input_func.breakpoints(t_start, t_end))
+        u_func = input_func
+    else:
+        def u_func(t):
+            return input_func(t, *input_params)
+
+    # granice segmentów, wewnątrz których pobudzenie jest gładkie
+    segment_ends = sorted({float(b) for b in breakpoints if t_start < b < t_end} | {float(t_end)})
+
+    stats = {'n_rhs': 0, 'n_accepted': 0, 'n_rejected': 0}
+
+    def rhs(t, x, seg_start, seg_end):
+        # pobudzenie liczone wewnątrz segmentu - na prawym końcu bierzemy granicę lewostronną
+        t_u = min(max(t, seg_start), np.nextafter(seg_end, seg_start))
+        stats['n_rhs'] += 1
+        return system_func(x, t, float(u_func(t_u)), *system_params)
+
+    x = np.array(x0, dtype=float)
+    t = t_start
+    t_out = [t_start] if t_eval is None else []
+    x_out = [x.copy()] if t_eval is None else []
+    if t_eval is not None:
+        t_eval = np.asarray(t_eval, dtype=float)
+        eval_index = np.searchsorted(t_eval, t_start, side='right')
+        t_out = list(t_eval[:eval_index])
+        x_out = [x.copy()] * eval_index
+
+    K = np.zeros((7, len(x)))
+    h = h_init
+    for seg_end in segment_ends:
+        seg_start = t
+        K[0] = rhs(t, x, seg_start, seg_end)  # po nieciągłości nie korzystamy z FSAL
+        if h is None:
+            # prosta heurystyka kroku początkowego (Hairer, Nørsett, Wanner)
+            scale = atol + rtol * np.abs(x)
+            d0 = np.sqrt(np.mean((x / scale) ** 2))
+            d1 = np.sqrt(np.mean((K[0] / scale) ** 2))
+            h = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h = min(h, h_max)
+
+        while t < seg_end:
+            h_step = min(h, seg_end - t)
+            last_step = h_step == seg_end - t
+            for i in range(1, 7):
+                x_stage = x + h_step * (np.dot(DP_A[i], K[:i]))
+                K[i] = rhs(t + DP_C[i] * h_step, x_stage, seg_start, seg_end)
+            x_new = x + h_step * np.dot(DP_B, K)
+
+            # oszacowanie błędu lokalnego (różnica rozwiązań rzędu 5 i 4)
+            scale = atol + rtol * np.maximum(np.abs(x), np.abs(x_new))
+            error = np.sqrt(np.mean((h_step * np.dot(DP_E, K) / scale) ** 2))
+
+            if error <= 1.0:
+                t_new = seg_end if last_step else t + h_step
+                if t_eval is None:
+                    t_out.append(t_new)
+                    x_out.append(x_new.copy())
+                else:
+                    # interpolacja gęsta w chwilach t_eval należących do (t, t_new]
+                    next_index = np.searchsorted(t_eval, t_new, side='right')
+                    if next_index > eval_index:
+                        theta = (t_eval[eval_index:next_index] - t) / h_step
+                        Q = K.T @ DP_P
+                        powers = np.cumprod(np.tile(theta, (4, 1)), axis=0)
+                        x_out.extend((x[:, np.newaxis] + h_step * Q @ powers).T)
+                        t_out.extend(t_eval[eval_index:next_index])
+                        eval_index = next_index
+                t = t_new
+                x = x_new
+                K[0] = K[6]  # FSAL - ostatni etap jest pierwszym etapem kolejnego kroku
+                stats['n_accepted'] += 1
+                factor = 10.0 if error == 0 else min(10.0, 0.9 * error ** -0.2)
+            else:
+                stats['n_rejected'] += 1
+                factor = max(0.2, 0.9 * error ** -0.2)
+            if not last_step or error > 1.0:
+                h = min(h_step * factor, h_max)
+
+    t_vec = np.array(t_out)
+    y_vec = np.array(x_out).reshape(len(t_out), -1)[:, 0]
+    u_vec = np.broadcast_to(u_func(t_vec), t_vec.shape).astype(float)
+    return t_vec, y_vec, u_vec, stats
+
+
+def main():
+    # parametry członów
+    k = 1.0          # wzmocnienie statyczne
+    T = 1.0          # stała czasowa [s]
+    zeta = 0.5       # współczynnik tłumienia (dla inercyjnego II rzędu)
+
+    # parametry pobudzeń
+    sin_amplitude = 1.0
+    sin_frequency = 0.5     # w Hz
+    impulse_strength = 1.0  # całka impulsu
+    impulse_period = 5.0    # okres impulsów [s]
+
+    # parametry symulacji
+    t_start = 0.0
+    t_end = 20.0                # całkowity czas symulacji [s]
+    x0 = np.array([0.0, 0.0])   # stan początkowy [y(0), dy/dt(0)]
+    h = 0.1                     # krok dyskretyzacji [s]
+
+    print(f"Używany krok dyskretyzacji: h = {h} s")
+
+    # symulacje
+
+    # 1. Człon inercyjny II rzędu
+    # pobudzenie sinusoidalne
+    params_inertial2 = (k, T, zeta)
+    t1_sin, y1_sin, u1_sin = euler_simulation(
+        inertial_2nd_order, params_inertial2,
+        sinusoidal_input, (sin_amplitude, sin_frequency),
+        (t_start, t_end), h, x0)
+
+    # pobudzenie sinusoidalne - dokładna dyskretyzacja ZOH (stabilna także dla dużego h)
+    t1_zoh, y1_zoh, _ = zoh_simulation(
+        inertial_2nd_order, params_inertial2,
+        sinusoidal_input, (sin_amplitude, sin_frequency),
+        (t_start, t_end), h, x0)
+
+    # skok ZOH do odległej chwili w O(log n) mnożeniach - stan ustalony przy u = 1 to [k, 0]
+    x_far = zoh_state_at(inertial_2nd_order, params_inertial2, 1.0, 1e6, h, x0)
+    print(f"Stan członu inercyjnego II rzędu w chwili t = 1e6 s przy u = 1 (skok ZOH): {x_far}, oczekiwany [{k}, 0]")
+
+    # pobudzenie impulsowe (okresowe)
+    t1_imp, y1_imp, u1_imp = euler_simulation(
+        inertial_2nd_order, params_inertial2,
+        periodic_impulse_input, (impulse_strength, impulse_period),
+        (t_start, t_end), h, x0)
+
+    # pobudzenie impulsowe - adaptacyjny RK45 z punktami przerwania na zboczach impulsów
+    # (impuls tej samej szerokości h)
+    t1_rk45, y1_rk45, _, rk45_stats = dormand_prince_simulation(
+        inertial_2nd_order, params_inertial2,
+        periodic_impulse_input, (impulse_strength, impulse_period),
+        (t_start, t_end), x0, rtol=1e-6, atol=1e-9, pulse_width=h)
+    print(f"Adaptacyjny RK45: {rk45_stats['n_rhs']} wywołań prawych stron "
+          f"({rk45_stats['n_accepted']} kroków przyjętych, {rk45_stats['n_rejected']} odrzuconych), "
+          f"jawny Euler: {len(t1_imp) - 1}")
+
+    # 2. Człon całkujący z inercją
+    # pobudzenie sinusoidalne
+    params_integr_inertial = (k, T)
+    t2_sin, y2_sin, u2_sin = euler_simulation(
+        integrating_inertial, params_integr_inertial,
+        sinusoidal_input, (sin_amplitude, sin_frequency),
+        (t_start, t_end), h, x0)
+
+    # pobudzenie impulsowe (okresowe)
+    t2_imp, y2_imp, u2_imp = euler_simulation(
+        integrating_inertial, params_integr_inertial,
+        periodic_impulse_input, (impulse_strength, impulse_period),
+        (t_start, t_end), h, x0)
+
+    plt.style.use('seaborn-v0_8-whitegrid')  # lepszy wygląd wykresów
+
+    # wykresy dla członu inercyjnego II rzędu (serie decymowane min/max do rozdzielczości ekranu)
+    fig1, axs1 = plt.subplots(2, 1, figsize=(10, 8))
+    fig1.suptitle(f'Człon inercyjny II rzędu (T={T}, ζ={zeta}, k={k}) - jawna metoda Eulera (h={h})', fontsize=14)
+
+    # pobudzenie sinusoidalne
+    plot_decimated(axs1[0], t1_sin, u1_sin, 'r--', label='Pobudzenie u(t)', alpha=0.7)
+    plot_decimated(axs1[0], t1_sin, y1_sin, 'b-', label='Odpowiedź y(t)')
+    plot_decimated(axs1[0], t1_zoh, y1_zoh, 'k:', label='Odpowiedź y(t) - dyskretyzacja ZOH')
+    axs1[0].set_title('Odpowiedź na pobudzenie sinusoidalne')
+    axs1[0].set_xlabel('Czas [s]')
+    axs1[0].set_ylabel('Amplituda')
+    axs1[0].legend()
+    axs1[0].grid(True)
+
+    # pobudzenie impulsowe (okresowe)
+    plot_decimated(axs1[1], t1_imp, u1_imp, 'r--', label='Pobudzenie u(t)', alpha=0.7)
+    plot_decimated(axs1[1], t1_imp, y1_imp, 'b-', label='Odpowiedź y(t)')
+    plot_decimated(axs1[1], t1_rk45, y1_rk45, 'k:', label='Odpowiedź y(t) - RK45 (adaptacyjny)')
+    axs1[1].set_title(f'Odpowiedź na pobudzenie impulsowe (siła={impulse_strength}, okres={impulse_period}s)')
+    axs1[1].set_xlabel('Czas [s]')
+    axs1[1].set_ylabel('Amplituda')
+    axs1[1].legend()
+    axs1[1].grid(True)
+
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])  # miejsce na tytuł główny
+    plt.show()
+
+    # wykresy dla członu całkującego z inercją
+    fig2, axs2 = plt.subplots(2, 1, figsize=(10, 8))
+    fig2.suptitle(f'Człon całkujący z inercją (T={T}, k={k}) - jawna metoda Eulera (h={h})', fontsize=14)
+
+    # pobudzenie sinusoidalne
+    plot_decimated(axs2[0], t2_sin, u2_sin, 'r--', label='Pobudzenie u(t)', alpha=0.7)
+    plot_decimated(axs2[0], t2_sin, y2_sin, 'g-', label='Odpowiedź y(t)')
+    axs2[0].set_title('Odpowiedź na pobudzenie sinusoidalne')
+    axs2[0].set_xlabel('Czas [s]')
+    axs2[0].set_ylabel('Amplituda')
+    axs2[0].legend()
+    axs2[0].grid(True)
+
+    # pobudzenie impulsowe (okresowe)
+    plot_decimated(axs2[1], t2_imp, u2_imp, 'r--', label='Pobudzenie u(t)', alpha=0.7)
+    plot_decimated(axs2[1], t2_imp, y2_imp, 'g-', label='Odpowiedź y(t)')
+    axs2[1].set_title(f'Odpowiedź na pobudzenie impulsowe (siła={impulse_strength}, okres={impulse_period}s)')
+    axs2[1].set_xlabel('Czas [s]')
+    axs2[1].set_ylabel('Amplituda')
+    axs2[1].legend()
+    axs2[1].grid(True)
+
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
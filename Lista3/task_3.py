@@ -1,129 +1,200 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from plotting import draw_trajectory
+from recorder import TrajectoryRecorder
+# krok Eulera (silnik tablic Butchera z runge_kutta.py) i dokładne przejście - wspólne z task_5.py
+from robot_model import euler_step, exact_step
+from step_selection import positions_target, print_selection, select_step, selection_summary
 
-def euler_step(x, w, h):
+
+def simulate_robot(x_initial, phases, h):
     """
-    Wykonuje jeden krok jawnej metody Eulera dla modelu robota.
+    Symulacja robota jawną metodą Eulera, faza po fazie (ostatni krok fazy jest skracany do jej końca).
 
     Args:
-        x (np.array): Aktualny wektor stanu [x1, x2, x3].
-        w (np.array): Aktualny wektor sterowań [w1, w2].
+        x_initial (np.array): Stan początkowy [x1, x2, x3] (x3 w radianach).
+        phases (list): Lista faz {'w1', 'w2' [rad/s], 'duration'}.
         h (float): Krok czasowy.
 
     Returns:
-        np.array: Wektor stanu w następnym kroku czasowym.
+        tuple: (t_history, x1_history, x2_history, x_final, total_steps)
+    """
+    x_current = np.array(x_initial, dtype=float)
+    t_current = 0.0
+
+    # historie stanu do wykresu (kolumny t, x1, x2 w prealokowanym buforze)
+    recorder = TrajectoryRecorder(3)
+    recorder.append(t_current, x_current[0], x_current[1])
+
+    # pętla symulacji
+    total_steps = 0
+    for i, phase in enumerate(phases):
+        w_phase = np.array([phase['w1'], phase['w2']])
+        # iterujemy dopóki czas fazy nie minie
+        t_phase_start = recorder.columns()[0][-1]  # czas na początku tej fazy
+        t_phase_end = t_phase_start + phase['duration']
+
+        # mała tolerancja, by uniknąć problemów z precyzją floata
+        epsilon = h / 100.0
+        while t_current < t_phase_end - epsilon:
+            # sprawdzenie czy następny krok nie przekroczy czasu fazy
+            time_to_end_phase = t_phase_end - t_current
+            current_h = min(h, time_to_end_phase)
+
+            if current_h <= epsilon:  # unikanie bardzo małych kroków na końcu
+                break
+
+            # ẋ₁ = cos(x₃)·w₁, ẋ₂ = sin(x₃)·w₁, ẋ₃ = w₂; x[n+1] = x[n] + h·f(x[n]) zapisywane w miejscu
+            euler_step.step_into(x_current, w_phase, current_h, out=x_current)
+            t_current += current_h
+
+            # zapis pozycji
+            recorder.append(t_current, x_current[0], x_current[1])
+            total_steps += 1
+
+        t_current = t_phase_end
+
+    t_history, x1_history, x2_history = recorder.columns()
+    return t_history, x1_history, x2_history, x_current, total_steps
+
+
+def exact_final_state(x_initial, phases):
+    """Rozwiązanie dokładne - jeden krok na fazę (referencja o zerowym błędzie metody)."""
+    x_exact = np.array(x_initial, dtype=float)
+    for phase in phases:
+        x_exact = exact_step(x_exact, np.array([phase['w1'], phase['w2']]), phase['duration'])
+    return x_exact
+
+
+def auto_step(x_initial, phases, tolerance, target='end'):
+    """
+    Tryb auto-h: największy krok Eulera, dla którego błąd położenia końcowego (target='end') lub całej
+    trajektorii (target='trajectory') nie przekracza tolerance [m] - oszacowany ekstrapolacją Richardsona
+    (step_selection.py). Krok nie przekracza 1/20 czasu ruchu.
+
+    Returns:
+        dict: wynik select_step (h, error, extrapolated, ...).
+    """
+    total_time = sum(phase['duration'] for phase in phases)
+    if total_time <= 0:
+        raise ValueError("Dobór kroku wymaga ruchu o dodatnim czasie trwania")
+
+    def simulate(h):
+        t_history, x1_history, x2_history, _, _ = simulate_robot(x_initial, phases, h)
+        return positions_target(t_history, x1_history, x2_history, target)
+
+    h_max = total_time / 20
+    return select_step(simulate, tolerance, order=1, h_start=h_max, h_max=h_max, h_min=total_time * 1e-7)
+
+
+def plot_robot_trajectory(x1_history, x2_history, h):
+    """Wykres pozycji robota (x1, x2) ze strzałkami kierunku ruchu."""
+    fig = plt.figure(figsize=(10, 8))
+    ax = plt.gca()
+
+    # strzałki wskazujące kierunek ruchu
+    arrow_interval_time = 1  # czas [s] pomiędzy rysowaniem kolejnych strzałek
+    arrow_step = max(1, int(arrow_interval_time / h))  # liczba kroków symulacji pomiędzy strzałkami
+
+    # linia trajektorii, strzałki (jedna kolekcja) oraz punkt startowy i końcowy
+    draw_trajectory(ax, x1_history, x2_history, '-', color='tab:blue', label=f'Pozycja robota (Euler, h={h:.4g} s)',
+                    linewidth=1, arrow_step=arrow_step,
+                    start_marker='go', start_label='Pozycja początkowa', end_marker='ro', end_label='Pozycja końcowa')
+
+    plt.title(f'Pozycja robota (x1, x2) - jawna metoda Eulera (h={h:.4g})')
+    plt.xlabel('x1 [m]')
+    plt.ylabel('x2 [m]')
+    plt.legend()
+    plt.grid(True)
+    plt.axis('equal')  # równe proporcje osi, aby dobrze zwizualizować ruch po okręgu i kąty
+    return fig
+
+
+def scenario_phases(params):
+    """Fazy ruchu ze scenariusza (w2_deg w stopniach/s) w postaci używanej przez symulację (w2 w rad/s)."""
+    return [{'w1': phase['w1'], 'w2': np.radians(phase['w2_deg']), 'duration': phase['duration']}
+            for phase in params['phases']]
+
+
+def run_scenario(params):
+    """
+    Uruchomienie bez pytań input() - parametry ze scenariusza (x1_0, x2_0, x3_0_deg, h, phases). \n
+    h = "auto" wybiera krok do tolerancji 'tolerance' [m] położenia końcowego lub całej trajektorii
+    ('tolerance_target': "end" / "trajectory").
     """
-    x1, x2, x3 = x
-    w1, w2 = w
-
-    # Układ równań różniczkowych opisujących robota (wymnożenie macierzy):
-    # ẋ₁(t) = cos(x₃(t)) * w₁(t)
-    # ẋ₂(t) = sin(x₃(t)) * w₁(t)
-    # ẋ₃(t) = w₂(t)
-
-    x1_next = x1 + h * np.cos(x3) * w1  # wzory zgodne z metodą Eulera: (x₁[n+1] - x₁[n]) / h = cos(x₃[n]) * w₁[n]
-    x2_next = x2 + h * np.sin(x3) * w1
-    x3_next = x3 + h * w2  # x3 jest w radianach
-
-    return np.array([x1_next, x2_next, x3_next])
-
-
-# parametry początkowe
-x1_0 = float(input("Podaj początkową pozycję x₁ [m]: "))
-x2_0 = float(input("Podaj początkową pozycję x₂ [m]: "))
-x3_0_deg = float(input("Podaj początkowy kąt obrotu x₃ [stopnie]: "))
-x3_0 = np.radians(x3_0_deg)  # konwersja na radiany dla obliczeń
-
-h = float(input("Podaj krok dyskretyzacji h [s] (np. 0.1): "))
-
-phases = []
-num_phases = int(input("Podaj liczbę faz ruchu (segmentów trajektorii): "))
-
-x_initial = np.array([x1_0, x2_0, x3_0])
-
-total_simulation_time = 0
-for i in range(num_phases):
-    print(f"\n--- Definicja Fazy {i + 1} ---")
-    print("Podaj parametry ruchu dla tej fazy:")
-    w1 = float(input(" Prędkość liniowa w₁ [m/s]: "))
-    w2_deg = float(input(" Prędkość kątowa w₂ [stopnie/s]: "))
-    w2 = np.radians(w2_deg)  # konwersja na radiany/s dla obliczeń
-    duration = float(input(" Czas trwania fazy [s]: "))
-    phases.append({'w1': w1, 'w2': w2, 'duration': duration})
-    total_simulation_time += duration
-
-print(f"\nCałkowity czas symulacji: {total_simulation_time:.2f} s")
-print(f"Krok czasowy h: {h} s")
-
-x_current = x_initial.copy()
-t_current = 0.0
-
-# historie stanu do wykresu
-t_history = [t_current]
-x1_history = [x_current[0]]
-x2_history = [x_current[1]]
-# x3_history = [x_current[2]]
-
-# pętla symulacji
-total_steps = 0
-for i, phase in enumerate(phases):
-    w_phase = np.array([phase['w1'], phase['w2']])
-    # iterujemy dopóki czas fazy nie minie
-    t_phase_start = t_history[-1]  # czas na początku tej fazy
-    t_phase_end = t_phase_start + phase['duration']
-
-    # mała tolerancja, by uniknąć problemów z precyzją floata
-    epsilon = h / 100.0
-    while t_current < t_phase_end - epsilon:
-        # sprawdzenie czy następny krok nie przekroczy czasu fazy
-        time_to_end_phase = t_phase_end - t_current
-        current_h = min(h, time_to_end_phase)
-
-        if current_h <= epsilon:  # unikanie bardzo małych kroków na końcu
-            break
-
-        x_next = euler_step(x_current, w_phase, current_h)
-        t_current += current_h
-        x_current = x_next
-
-        # zapis pozycji
-        t_history.append(t_current)
-        x1_history.append(x_current[0])
-        x2_history.append(x_current[1])
-        # x3_history.append(x_current[2])
-        total_steps += 1
-
-    t_current = t_phase_end
-
-print(f"\nSymulacja zakończona. Wykonano {total_steps} kroków Eulera.")
-
-# wykres pozycji robota
-plt.figure(figsize=(10, 8))
-# linia łącząca punkty i markery w każdym punkcie
-plt.plot(x1_history, x2_history, '-', label=f'Pozycja robota (Euler, h={h} s)', markersize=4, linewidth=1)
-
-# punkt startowy i końcowy
-plt.plot(x1_history[0], x2_history[0], 'go', markersize=12, label='Pozycja początkowa')
-plt.plot(x1_history[-1], x2_history[-1], 'ro', markersize=10, label='Pozycja końcowa')
-
-# strzałki wskazujące kierunek ruchu
-arrow_interval_time = 1  # czas [s] pomiędzy rysowaniem kolejnych strzałek
-arrow_step = max(1, int(arrow_interval_time / h))  # liczba kroków symulacji pomiędzy strzałkami
-start_arrow_index = arrow_step  # indeks, od którego zacząć rysować strzałki (pomijamy początek)
-for i in range(start_arrow_index, len(x1_history) - 1, arrow_step):
-    # wektor przesunięcia (do określenia kierunku i długości strzałki)
-    dx = x1_history[i+1] - x1_history[i]
-    dy = x2_history[i+1] - x2_history[i]
-    # nie rysuj strzałek o zerowej długości
-    if abs(dx) > 1e-6 or abs(dy) > 1e-6:
-        plt.arrow(x1_history[i], x2_history[i], dx, dy, head_width=0.05, head_length=0.1,
-                  fc='blue', ec='blue', length_includes_head=True)
-
-plt.title(f'Pozycja robota (x1, x2) - jawna metoda Eulera (h={h})')
-plt.xlabel('x1 [m]')
-plt.ylabel('x2 [m]')
-plt.legend()
-plt.grid(True)
-plt.axis('equal')  # równe proporcje osi, aby dobrze zwizualizować ruch po okręgu i kąty
-plt.show()
+    x_initial = np.array([params['x1_0'], params['x2_0'], np.radians(params['x3_0_deg'])])
+    phases = scenario_phases(params)
+    h = params['h']
+    selection = None
+    if h == 'auto':
+        selection = auto_step(x_initial, phases, params['tolerance'], params.get('tolerance_target', 'end'))
+        h = selection['h']
+
+    t_history, x1_history, x2_history, x_final, total_steps = simulate_robot(x_initial, phases, h)
+    x_exact = exact_final_state(x_initial, phases)
+    results = {
+        'total_steps': total_steps,
+        'final_state': x_final.tolist(),
+        'exact_final_state': x_exact.tolist(),
+        'end_error': float(np.hypot(x_final[0] - x_exact[0], x_final[1] - x_exact[1])),
+    }
+    if selection is not None:
+        results['auto_h'] = selection_summary(selection)
+    return results, [plot_robot_trajectory(x1_history, x2_history, h)]
+
+
+def main():
+    # parametry początkowe
+    x1_0 = float(input("Podaj początkową pozycję x₁ [m]: "))
+    x2_0 = float(input("Podaj początkową pozycję x₂ [m]: "))
+    x3_0_deg = float(input("Podaj początkowy kąt obrotu x₃ [stopnie]: "))
+    x3_0 = np.radians(x3_0_deg)  # konwersja na radiany dla obliczeń
+
+    h_text = input("Podaj krok dyskretyzacji h [s] (np. 0.1) lub 'auto' (dobór h do zadanej tolerancji): ")
+    tolerance = target = None
+    if h_text.strip().lower() == 'auto':
+        tolerance = float(input("Podaj dopuszczalny błąd położenia [m] (np. 1e-3): "))
+        target_text = input("Tolerancja dla położenia (k)ońcowego czy całej (t)rajektorii? [k/t]: ")
+        target = 'trajectory' if target_text.strip().lower().startswith('t') else 'end'
+    else:
+        h = float(h_text)
+
+    phases = []
+    num_phases = int(input("Podaj liczbę faz ruchu (segmentów trajektorii): "))
+
+    x_initial = np.array([x1_0, x2_0, x3_0])
+
+    total_simulation_time = 0
+    for i in range(num_phases):
+        print(f"\n--- Definicja Fazy {i + 1} ---")
+        print("Podaj parametry ruchu dla tej fazy:")
+        w1 = float(input(" Prędkość liniowa w₁ [m/s]: "))
+        w2_deg = float(input(" Prędkość kątowa w₂ [stopnie/s]: "))
+        w2 = np.radians(w2_deg)  # konwersja na radiany/s dla obliczeń
+        duration = float(input(" Czas trwania fazy [s]: "))
+        phases.append({'w1': w1, 'w2': w2, 'duration': duration})
+        total_simulation_time += duration
+
+    print(f"\nCałkowity czas symulacji: {total_simulation_time:.2f} s")
+    if tolerance is not None:
+        selection = auto_step(x_initial, phases, tolerance, target)
+        print_selection(selection)
+        h = selection['h']
+    print(f"Krok czasowy h: {h:.4g} s")
+
+    t_history, x1_history, x2_history, x_current, total_steps = simulate_robot(x_initial, phases, h)
+
+    print(f"\nSymulacja zakończona. Wykonano {total_steps} kroków Eulera.")
+
+    x_exact = exact_final_state(x_initial, phases)
+    end_error = np.hypot(x_current[0] - x_exact[0], x_current[1] - x_exact[1])
+    print(f"Dokładna pozycja końcowa: ({x_exact[0]:.4f}, {x_exact[1]:.4f}), błąd metody Eulera: {end_error:.3e} m")
+
+    # wykres pozycji robota
+    plot_robot_trajectory(x1_history, x2_history, h)
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,6 @@
+import functools
+import heapq
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -17,84 +20,372 @@ def get_float_sequence(prompt, length):
     return np.array(sequence)
 
 
-# pobieranie parametrów od użytkownika
-H = int(input("Podaj horyzont czasowy H (liczba dni): "))
-x0 = float(input("Podaj początkowe saldo konta x(0) [PLN]: "))
-y0 = float(input("Podaj początkowy stan pszenicy y(0) [t] (> 0): "))
-r_daily = float(input("Podaj dzienną stopę zysku na koncie r (np. 0.0001 dla 0.01% dziennie): "))
-h_daily = float(input("Podaj dzienny koszt składowania tony pszenicy h [PLN/(t*dzień)]: "))
-
-# pobieranie ciągów v(t) i p(t)
-v_daily = get_float_sequence(f"Podaj prędkość skupu/sprzedaży v(t) [t/dzień] dla kolejnych {H} dni (<0 to sprzedaż):",
-                             H)
-p_daily = get_float_sequence(f"Podaj cenę tony pszenicy p(t) [PLN/t] dla kolejnych {H} dni:", H)
-
-t = np.arange(H + 1)  # wektor czasu (dni), od 0 do H włącznie
-x_history = np.zeros(H + 1)
-y_history = np.zeros(H + 1)
-
-# warunki początkowe
-x_history[0] = x0
-y_history[0] = y0
-
-# pętla symulacji - jawna metoda Eulera (dla Δt = 1 dzień)
-# (x[n+1] - x[n]) / Δt = r * x[n] - h * y[n] - p[n] * v[n]
-# (y[n+1] - y[n]) / Δt = v[n]
-
-for n in range(H):  # pętla od dnia 0 do H-1
-    # pobranie wartości v i p dla dnia n (indeks n w tablicach v_daily, p_daily)
-    vn = v_daily[n]
-    pn = p_daily[n]
-
-    # odczyt stanu na początku dnia n (koniec dnia n-1)
-    xn = x_history[n]
-    yn = y_history[n]
-
-    # stan na koniec dnia n (początek dnia n+1) - indeks n+1 w historii
-    x_history[n + 1] = xn + r_daily * xn - h_daily * yn - pn * vn  # podstawienie do wzoru Δt = 1
-    y_history[n + 1] = vn + yn
-
-    # sprawdzenie czy stan pszenicy nie spadł poniżej zera
-    if y_history[n + 1] < -1e-9:  # mała tolerancja dla błędów
-        print(f"Ostrzeżenie: W dniu {n + 1} obliczony stan pszenicy ({y_history[n + 1]:.2f}) jest ujemny.")
-
-# przygotowanie danych v(t) i p(t) do wykresu typu step
-v_plot = np.append(v_daily, v_daily[-1])  # powtórz ostatnią wartość dla pełnego przedziału H
-p_plot = np.append(p_daily, p_daily[-1])
-
-# wykresy
-fig, axs = plt.subplots(4, 1, figsize=(10, 12))
-fig.suptitle('Symulacja modelu sprzedaży i skupu pszenicy (jawna metoda Eulera)', fontsize=16)
-
-# 1. Saldo konta x(t)
-axs[0].plot(t, x_history, 'b-o', markersize=4, label='Saldo konta x(t)')
-axs[0].set_xlabel('Czas [dni]')
-axs[0].set_ylabel('Saldo [PLN]')
-axs[0].grid(True)
-axs[0].legend()
-
-# 2. Składowana pszenica y(t)
-axs[1].plot(t, y_history, 'g-o', markersize=4, label='Składowana pszenica y(t)')
-axs[1].set_xlabel('Czas [dni]')
-axs[1].set_ylabel('Pszenica [t]')
-axs[1].grid(True)
-axs[1].legend()
-axs[1].axhline(0, color='gray', linestyle='--', linewidth=0.8)  # linia y=0 dla odniesienia
-
-# 3. Prędkość skupu/sprzedaży v(t)
-axs[2].step(t, v_plot, 'r-', where='post', label='Prędkość skupu v(t)')
-axs[2].set_xlabel('Czas [dni]')
-axs[2].set_ylabel('Skup/Sprzedaż [t/dzień]')
-axs[2].grid(True)
-axs[2].legend()
-axs[2].axhline(0, color='gray', linestyle='--', linewidth=0.8)  # linia v=0 dla odniesienia
-
-# 4. Cena pszenicy p(t)
-axs[3].step(t, p_plot, 'm-', where='post', label='Cena p(t)')
-axs[3].set_xlabel('Czas [dni]')
-axs[3].set_ylabel('Cena [PLN/t]')
-axs[3].grid(True)
-axs[3].legend()
-
-plt.tight_layout(rect=[0, 0.03, 1, 0.96])  # miejsce na suptitle
-plt.show()
+def simulate_wheat(x0, y0, r_daily, h_daily, v_daily, p_daily, sink=None):
+    """
+    Symulacja modelu konta i magazynu pszenicy jawną metodą Eulera (Δt = 1 dzień). \n
+    (x[n+1] - x[n]) / Δt = r * x[n] - h * y[n] - p[n] * v[n] \n
+    (y[n+1] - y[n]) / Δt = v[n]
+
+    Args:
+        x0, y0: Początkowe saldo konta i stan pszenicy.
+        r_daily: Dzienna stopa zysku na koncie.
+        h_daily: Dzienny koszt składowania tony pszenicy.
+        v_daily: Prędkość skupu/sprzedaży dla kolejnych dni (<0 to sprzedaż).
+        p_daily: Cena tony pszenicy dla kolejnych dni.
+        sink: Opcjonalny TrajectoryStore z kolumnami (day, x, y) - historia zapisywana na dysk blokami
+            po sink.chunk_size dni zamiast trzymania jej w pamięci.
+
+    Returns:
+        x_history, y_history: Saldo konta i stan pszenicy dla dni 0..H
+        (przy zapisie do sink - kolumny odczytane z dysku jako np.memmap).
+    """
+    H = len(v_daily)
+    chunk_size = H + 1 if sink is None else sink.chunk_size
+    xn, yn = x0, y0
+
+    for d0 in range(0, H + 1, chunk_size):
+        d1 = min(d0 + chunk_size, H + 1)
+        x_history = np.zeros(d1 - d0)
+        y_history = np.zeros(d1 - d0)
+
+        for n in range(d0, d1):  # pętla po dniach bieżącego bloku
+            # stan na początku dnia n (koniec dnia n-1)
+            x_history[n - d0] = xn
+            y_history[n - d0] = yn
+            if n == H:
+                break
+
+            # pobranie wartości v i p dla dnia n (indeks n w tablicach v_daily, p_daily)
+            vn = v_daily[n]
+            pn = p_daily[n]
+
+            # stan na koniec dnia n (początek dnia n+1)
+            xn, yn = xn + r_daily * xn - h_daily * yn - pn * vn, vn + yn  # podstawienie do wzoru Δt = 1
+
+            # sprawdzenie czy stan pszenicy nie spadł poniżej zera
+            if yn < -1e-9:  # mała tolerancja dla błędów
+                print(f"Ostrzeżenie: W dniu {n + 1} obliczony stan pszenicy ({yn:.2f}) jest ujemny.")
+
+        if sink is not None:
+            sink.write_block(np.column_stack((np.arange(d0, d1), x_history, y_history)))
+
+    if sink is not None:
+        sink.finish(method='euler', h=1.0, x0=x0, y0=y0, r_daily=r_daily, h_daily=h_daily)
+        _, x_history, y_history = sink.columns()
+    return x_history, y_history
+
+
+def final_balance_weights(r_daily, H):
+    """
+    Wagi rozwiązania jawnego rekurencji x[n+1] = (1 + r) * x[n] - h * y[n] - p[n] * v[n]: \n
+    x[H] = (1 + r)^H * x0 - Σ (1 + r)^(H-1-n) * (h * y[n] + p[n] * v[n]),  n = 0..H-1.
+
+    Returns:
+        tuple: (growth, weights) - (1 + r)^H oraz wektor (1 + r)^(H-1-n) długości H.
+    """
+    weights = (1 + r_daily) ** np.arange(H - 1, -1, -1, dtype=float)
+    return (1 + r_daily) ** H, weights
+
+
+def gbm_price_paths(rng, n_paths, H, p0, mu, sigma):
+    """
+    Ścieżki cen w geometrycznym ruchu Browna (dzienny dryf mu i zmienność sigma logarytmu ceny). \n
+    Zwraca macierz (n_paths, H) - cenę p[n] dla dni n = 0..H-1, p[0] = p0.
+    """
+    increments = rng.standard_normal((n_paths, H - 1)) * sigma + (mu - 0.5 * sigma**2)
+    log_prices = np.zeros((n_paths, H))
+    np.cumsum(increments, axis=1, out=log_prices[:, 1:])
+    return p0 * np.exp(log_prices)
+
+
+def bootstrap_price_paths(rng, n_paths, H, historical_prices, p0=None):
+    """
+    Ścieżki cen z bootstrapu dziennych logarytmicznych stóp zwrotu historycznych cen (losowanie ze zwracaniem). \n
+    Zwraca macierz (n_paths, H); domyślnie ścieżki startują od ostatniej ceny historycznej.
+    """
+    historical_prices = np.asarray(historical_prices, dtype=float)
+    log_returns = np.diff(np.log(historical_prices))
+    p0 = historical_prices[-1] if p0 is None else p0
+    log_prices = np.zeros((n_paths, H))
+    np.cumsum(log_returns[rng.integers(0, len(log_returns), (n_paths, H - 1))], axis=1, out=log_prices[:, 1:])
+    return p0 * np.exp(log_prices)
+
+
+def monte_carlo_wheat(x0, y0, r_daily, h_daily, v_daily, price_paths, n_paths, chunk_size=20000, seed=None,
+                      quantiles=(0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99), alpha=0.05):
+    """
+    Rozkład salda końcowego x[H] modelu pszenicy dla wielu losowych ścieżek cen. \n
+    Zamiast pętli po dniach saldo końcowe liczone jest z rozwiązania jawnego (final_balance_weights),
+    czyli jednym iloczynem macierz-wektor dla całego bloku ścieżek. Ścieżki generowane są blokami
+    po chunk_size, więc zużycie pamięci nie zależy od n_paths (w pamięci zostają tylko salda końcowe).
+
+    Args:
+        x0, y0, r_daily, h_daily: Jak w simulate_wheat.
+        v_daily: Prędkości skupu/sprzedaży - wektor (H,) wspólny dla wszystkich ścieżek albo funkcja
+            v_daily(rng, n) zwracająca macierz (n, H) (np. strategia losowa lub zależna od ceny).
+        price_paths: Funkcja price_paths(rng, n) zwracająca macierz cen (n, H),
+            np. functools.partial(gbm_price_paths, H=H, p0=900, mu=0, sigma=0.02).
+        n_paths: Liczba ścieżek.
+        chunk_size: Liczba ścieżek liczonych jednocześnie.
+        seed: Ziarno generatora (powtarzalne wyniki).
+        quantiles: Kwantyle salda końcowego do raportu.
+        alpha: Poziom dla VaR i CVaR (strata = x0 - x[H]).
+
+    Returns:
+        dict: Statystyki (mean, std, quantiles, var, cvar, prob_negative_stock, prob_negative_balance)
+        oraz tablica final_balance (n_paths,).
+    """
+    rng = np.random.default_rng(seed)
+    final_balance = np.empty(n_paths)
+    negative_stock = 0
+
+    if not callable(v_daily):
+        v_daily = np.asarray(v_daily, dtype=float)
+        H = len(v_daily)
+        y_before = y0 + np.concatenate(([0.0], np.cumsum(v_daily)[:-1]))  # y[n] dla n = 0..H-1
+        fixed_negative = bool(np.any(y0 + np.cumsum(v_daily) < -1e-9))
+    growth, weights, storage_cost = None, None, None
+
+    for start in range(0, n_paths, chunk_size):
+        n = min(chunk_size, n_paths - start)
+        prices = price_paths(rng, n)
+        if weights is None:
+            growth, weights = final_balance_weights(r_daily, prices.shape[1])
+        if callable(v_daily):
+            volumes = v_daily(rng, n)
+            stock = y0 + np.cumsum(volumes, axis=1)  # y[n+1] dla n = 0..H-1
+            negative_stock += int(np.count_nonzero(np.any(stock < -1e-9, axis=1)))
+            y_before = np.concatenate((np.full((n, 1), float(y0)), stock[:, :-1]), axis=1)
+            cashflow = (h_daily * y_before + prices * volumes) @ weights
+        else:
+            if storage_cost is None:
+                storage_cost = h_daily * (y_before @ weights)
+            negative_stock += n if fixed_negative else 0
+            cashflow = storage_cost + prices @ (v_daily * weights)
+        final_balance[start:start + n] = growth * x0 - cashflow
+
+    loss = x0 - final_balance
+    var = float(np.quantile(loss, 1 - alpha))
+    return {
+        'n_paths': n_paths,
+        'mean': float(np.mean(final_balance)),
+        'std': float(np.std(final_balance)),
+        'quantiles': {q: float(value) for q, value in zip(quantiles, np.quantile(final_balance, quantiles))},
+        'alpha': alpha,
+        'var': var,
+        'cvar': float(np.mean(loss[loss >= var])),
+        'prob_negative_stock': negative_stock / n_paths,
+        'prob_negative_balance': float(np.mean(final_balance < 0)),
+        'final_balance': final_balance,
+    }
+
+
+_INITIAL, _BUY, _REGRET = 0, 1, 2  # rodzaje źródeł pszenicy w kopcu WheatScheduleOptimizer
+
+
+class WheatScheduleOptimizer:
+    """
+    Optymalny plan skupu/sprzedaży v(t) maksymalizujący saldo końcowe x[H] przy prognozie cen p(t),
+    ograniczeniach v_min[n] <= v[n] <= v_max[n] (v_min <= 0 <= v_max) i y >= 0. \n
+    Z rozwiązania jawnego (final_balance_weights) saldo końcowe jest liniowe w v:
+    x[H] = const - Σ c[n] * v[n], gdzie c[n] = (1 + r)^(H-1-n) * p[n] + h * Σ_{k>n} (1 + r)^(H-1-k)
+    to zdyskontowany koszt tony kupionej w dniu n i składowanej do końca horyzontu. Program liniowy
+    jest przepływem o minimalnym koszcie na osi czasu, więc rozwiązuje go zachłanne przejście dzień po dniu
+    z kopcem najtańszych źródeł pszenicy (zapas początkowy, zakupy, cofnięcia wcześniejszych sprzedaży)
+    w czasie O(H log H). Stan przejścia jest zapamiętywany co checkpoint_every dni, więc po zmianie ceny
+    jednego dnia (update_price) obliczenia są wznawiane od najbliższego wcześniejszego punktu kontrolnego.
+    """
+
+    def __init__(self, p_daily, r_daily, h_daily, y0, v_min, v_max, terminal_price=0.0, checkpoint_every=None):
+        self.p_daily = np.array(p_daily, dtype=float)
+        H = len(self.p_daily)
+        self.r_daily = r_daily
+        self.h_daily = h_daily
+        self.y0 = y0
+        self.v_min = np.broadcast_to(np.asarray(v_min, dtype=float), (H,)).copy()
+        self.v_max = np.broadcast_to(np.asarray(v_max, dtype=float), (H,)).copy()
+        if np.any(self.v_min > 0) or np.any(self.v_max < 0):
+            raise ValueError("Wymagane v_min <= 0 <= v_max (brak wymuszonego skupu lub sprzedaży)")
+        self.terminal_price = terminal_price  # wartość tony pozostałej w magazynie po dniu H
+        self.checkpoint_every = checkpoint_every or max(1, int(np.sqrt(H)))
+
+        self.growth, self.weights = final_balance_weights(r_daily, H)
+        storage_after = np.concatenate((np.cumsum(self.weights[::-1])[::-1][1:], [0.0]))  # Σ_{k>n} wagi
+        self._storage_cost = h_daily * storage_after
+        self.cost = self.weights * self.p_daily + self._storage_cost - terminal_price
+        self._checkpoints = {}
+        self.v_daily = None
+
+    def solve(self):
+        """Wyznacza optymalny plan od początku horyzontu; zwraca v (H,)."""
+        H = len(self.p_daily)
+        self._checkpoints = {}
+        return self._sweep(0, [(0.0, -1, _INITIAL, float(self.y0))] if self.y0 > 0 else [], np.zeros(H), np.zeros(H))
+
+    def update_price(self, day, price):
+        """Zmienia cenę z jednego dnia i wyznacza plan ponownie od ostatniego punktu kontrolnego przed tym dniem."""
+        self.p_daily[day] = price
+        self.cost[day] = self.weights[day] * price + self._storage_cost[day] - self.terminal_price
+        if not self._checkpoints:
+            return self.solve()
+        start = max(d for d in self._checkpoints if d <= day)
+        heap, bought, sold = self._checkpoints[start]
+        self._checkpoints = {d: state for d, state in self._checkpoints.items() if d < start}
+        return self._sweep(start, list(heap), bought.copy(), sold.copy())
+
+    def _sweep(self, start, heap, bought, sold):
+        eps = 1e-12
+        for j in range(start, len(self.p_daily)):
+            if j % self.checkpoint_every == 0:
+                self._checkpoints[j] = (list(heap), bought.copy(), sold.copy())
+            c = self.cost[j]
+
+            # sprzedaż w dniu j pszenicy z najtańszych źródeł, o ile się opłaca
+            capacity = -self.v_min[j]
+            while capacity > eps and heap and heap[0][0] < c:
+                source_cost, day, kind, quantity = heapq.heappop(heap)
+                take = min(quantity, capacity)
+                if kind == _BUY:
+                    bought[day] += take
+                elif kind == _REGRET:
+                    sold[day] -= take  # tona sprzedana wcześniej zostaje w magazynie do dnia j
+                sold[j] += take
+                capacity -= take
+                if quantity - take > eps:
+                    heapq.heappush(heap, (source_cost, day, kind, quantity - take))
+
+            # sprzedaż z dnia j można później cofnąć, a w dniu j można dokupić do v_max
+            if sold[j] > eps:
+                heapq.heappush(heap, (c, j, _REGRET, sold[j]))
+            if self.v_max[j] > eps:
+                heapq.heappush(heap, (c, j, _BUY, self.v_max[j]))
+
+        # koniec horyzontu: pozostawienie w magazynie (koszt c = 0) zamiast sprzedaży poniżej wartości końcowej
+        while heap and heap[0][0] < 0:
+            _, day, kind, quantity = heapq.heappop(heap)
+            if kind == _BUY:
+                bought[day] += quantity
+            elif kind == _REGRET:
+                sold[day] -= quantity
+
+        self.v_daily = bought - sold
+        return self.v_daily
+
+    def final_balance(self, x0, v_daily=None):
+        """Saldo końcowe x[H] dla planu v (domyślnie ostatnio wyznaczonego) z rozwiązania jawnego."""
+        v_daily = self.v_daily if v_daily is None else np.asarray(v_daily, dtype=float)
+        y_before = self.y0 + np.concatenate(([0.0], np.cumsum(v_daily)[:-1]))
+        return self.growth * x0 - self.weights @ (self.h_daily * y_before + self.p_daily * v_daily)
+
+
+def optimal_schedule(p_daily, r_daily, h_daily, y0, v_min, v_max, terminal_price=0.0):
+    """Optymalny plan skupu/sprzedaży v(t) (patrz WheatScheduleOptimizer)."""
+    return WheatScheduleOptimizer(p_daily, r_daily, h_daily, y0, v_min, v_max, terminal_price).solve()
+
+
+def plot_wheat(v_daily, p_daily, x_history, y_history):
+    """Wykresy salda konta, stanu pszenicy, prędkości skupu/sprzedaży i ceny."""
+    t = np.arange(len(v_daily) + 1)  # wektor czasu (dni), od 0 do H włącznie
+
+    # przygotowanie danych v(t) i p(t) do wykresu typu step
+    v_plot = np.append(v_daily, v_daily[-1])  # powtórz ostatnią wartość dla pełnego przedziału H
+    p_plot = np.append(p_daily, p_daily[-1])
+
+    # wykresy
+    fig, axs = plt.subplots(4, 1, figsize=(10, 12))
+    fig.suptitle('Symulacja modelu sprzedaży i skupu pszenicy (jawna metoda Eulera)', fontsize=16)
+
+    # 1. Saldo konta x(t)
+    axs[0].plot(t, x_history, 'b-o', markersize=4, label='Saldo konta x(t)')
+    axs[0].set_xlabel('Czas [dni]')
+    axs[0].set_ylabel('Saldo [PLN]')
+    axs[0].grid(True)
+    axs[0].legend()
+
+    # 2. Składowana pszenica y(t)
+    axs[1].plot(t, y_history, 'g-o', markersize=4, label='Składowana pszenica y(t)')
+    axs[1].set_xlabel('Czas [dni]')
+    axs[1].set_ylabel('Pszenica [t]')
+    axs[1].grid(True)
+    axs[1].legend()
+    axs[1].axhline(0, color='gray', linestyle='--', linewidth=0.8)  # linia y=0 dla odniesienia
+
+    # 3. Prędkość skupu/sprzedaży v(t)
+    axs[2].step(t, v_plot, 'r-', where='post', label='Prędkość skupu v(t)')
+    axs[2].set_xlabel('Czas [dni]')
+    axs[2].set_ylabel('Skup/Sprzedaż [t/dzień]')
+    axs[2].grid(True)
+    axs[2].legend()
+    axs[2].axhline(0, color='gray', linestyle='--', linewidth=0.8)  # linia v=0 dla odniesienia
+
+    # 4. Cena pszenicy p(t)
+    axs[3].step(t, p_plot, 'm-', where='post', label='Cena p(t)')
+    axs[3].set_xlabel('Czas [dni]')
+    axs[3].set_ylabel('Cena [PLN/t]')
+    axs[3].grid(True)
+    axs[3].legend()
+
+    plt.tight_layout(rect=[0, 0.03, 1, 0.96])  # miejsce na suptitle
+    return fig
+
+
+def run_scenario(params):
+    """
+    Uruchomienie bez pytań input() - parametry ze scenariusza (x0, y0, r_daily, h_daily, v, p). \n
+    Zamiast ciągu v można podać blok 'optimize' (v_min, v_max, terminal_price) - wtedy symulowany jest
+    plan optymalny dla prognozy cen p.
+    """
+    p_daily = np.asarray(params['p'], dtype=float)
+    if 'optimize' in params:
+        opt = params['optimize']
+        v_daily = optimal_schedule(p_daily, params['r_daily'], params['h_daily'], params['y0'], opt['v_min'],
+                                   opt['v_max'], opt.get('terminal_price', 0.0))
+    else:
+        v_daily = np.asarray(params['v'], dtype=float)
+    if len(v_daily) != len(p_daily):
+        raise ValueError("Ciągi v i p muszą mieć tę samą długość (horyzont H)")
+    x_history, y_history = simulate_wheat(params['x0'], params['y0'], params['r_daily'], params['h_daily'],
+                                          v_daily, p_daily)
+    results = {'H': len(v_daily), 'final_balance': float(x_history[-1]), 'final_stock': float(y_history[-1]),
+               'min_stock': float(np.min(y_history))}
+
+    # opcjonalnie: rozkład salda końcowego dla losowych ścieżek cen (GBM startujący od p[0])
+    if 'monte_carlo' in params:
+        mc = params['monte_carlo']
+        price_paths = functools.partial(gbm_price_paths, H=len(v_daily), p0=p_daily[0],
+                                        mu=mc.get('mu', 0.0), sigma=mc.get('sigma', 0.02))
+        stats = monte_carlo_wheat(params['x0'], params['y0'], params['r_daily'], params['h_daily'], v_daily,
+                                  price_paths, mc.get('n_paths', 100000), seed=mc.get('seed'),
+                                  alpha=mc.get('alpha', 0.05))
+        stats.pop('final_balance')
+        results['monte_carlo'] = stats
+    return results, [plot_wheat(v_daily, p_daily, x_history, y_history)]
+
+
+def main():
+    # pobieranie parametrów od użytkownika
+    H = int(input("Podaj horyzont czasowy H (liczba dni): "))
+    x0 = float(input("Podaj początkowe saldo konta x(0) [PLN]: "))
+    y0 = float(input("Podaj początkowy stan pszenicy y(0) [t] (> 0): "))
+    r_daily = float(input("Podaj dzienną stopę zysku na koncie r (np. 0.0001 dla 0.01% dziennie): "))
+    h_daily = float(input("Podaj dzienny koszt składowania tony pszenicy h [PLN/(t*dzień)]: "))
+
+    # pobieranie ciągów v(t) i p(t) - v(t) podany ręcznie albo wyznaczony jako plan optymalny
+    p_daily = get_float_sequence(f"Podaj cenę tony pszenicy p(t) [PLN/t] dla kolejnych {H} dni:", H)
+    if input("Wyznaczyć optymalny plan skupu/sprzedaży v(t)? (t/n): ").strip().lower() == 't':
+        v_max = float(input("Podaj maksymalną prędkość skupu [t/dzień]: "))
+        v_min = -float(input("Podaj maksymalną prędkość sprzedaży [t/dzień]: "))
+        v_daily = optimal_schedule(p_daily, r_daily, h_daily, y0, v_min, v_max)
+        print("Optymalny plan v(t):", np.round(v_daily, 3))
+    else:
+        v_daily = get_float_sequence(f"Podaj prędkość skupu/sprzedaży v(t) [t/dzień] dla kolejnych {H} dni "
+                                     f"(<0 to sprzedaż):", H)
+
+    x_history, y_history = simulate_wheat(x0, y0, r_daily, h_daily, v_daily, p_daily)
+
+    plot_wheat(v_daily, p_daily, x_history, y_history)
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,58 +1,99 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from animation import RobotAnimation
+from plotting import draw_trajectory
+from recorder import TrajectoryRecorder
+# model robota i kroki metod RK (silnik tablic Butchera z runge_kutta.py)
+from robot_model import abm4_step, euler_step, exact_step, rk2_step, rk4_step
+from step_selection import positions_target, print_selection, select_step, selection_summary
 
-def robot_dynamics(x, w):
+
+def exact_trajectory(x_initial, phases, t_out=None):
     """
-    Oblicza pochodne stanu [dx1/dt, dx2/dt, dx3/dt] dla danego stanu x i sterowań w.
+    Wyznacza dokładną trajektorię robota w O(liczba faz) - bez kroków całkowania.
 
     Args:
-        x (np.array): Aktualny wektor stanu [x1, x2, x3 (rad)].
-        w (np.array): Aktualny wektor sterowań [w1 (m/s), w2 (rad/s)].
+        x_initial (np.array): Początkowy stan robota.
+        phases (list): Lista słowników definiujących fazy ruchu.
+        t_out (np.array): Chwile, w których trajektoria ma być próbkowana. Domyślnie tylko granice faz.
 
     Returns:
-        np.array: Wektor pochodnych stanu.
+        tuple: (t_out, x1, x2, x3, phase_start_indices) - phase_start_indices to indeksy pierwszych
+        próbek t_out należących do kolejnych faz.
     """
-    x1, x2, x3 = x
-    w1, w2 = w
-    dx1_dt = np.cos(x3) * w1
-    dx2_dt = np.sin(x3) * w1
-    dx3_dt = w2
-    return np.array([dx1_dt, dx2_dt, dx3_dt])
-
+    w_phases = np.array([[phase['w1'], phase['w2']] for phase in phases]).reshape(-1, 2)
+    durations = np.array([phase['duration'] for phase in phases], dtype=float)
+    t_phase_start = np.concatenate(([0.0], np.cumsum(durations)))
+
+    # stany na granicach faz - jeden dokładny krok na fazę
+    x_phase_start = np.zeros((len(phases) + 1, 3))
+    x_phase_start[0] = x_initial
+    for i in range(len(phases)):
+        x_phase_start[i + 1] = exact_step(x_phase_start[i], w_phases[i], durations[i])
+
+    if t_out is None:
+        t_out = t_phase_start
+    t_out = np.asarray(t_out, dtype=float)
+    if len(phases) == 0:
+        x_out = np.broadcast_to(x_phase_start[0], t_out.shape + (3,))
+    else:
+        # faza każdej chwili t_out i czas, jaki upłynął od jej początku (po ostatniej fazie robot stoi)
+        idx = np.clip(np.searchsorted(t_phase_start, t_out, side='right') - 1, 0, len(phases) - 1)
+        dt = np.clip(t_out - t_phase_start[idx], 0.0, durations[idx])
+        x_out = exact_step(x_phase_start[idx], w_phases[idx], dt)
+    phase_start_indices = [0] + np.searchsorted(t_out, t_phase_start[1:-1]).tolist()
+    return t_out, x_out[..., 0], x_out[..., 1], x_out[..., 2], phase_start_indices
+
+
+def simulation_steps(x_initial, phases, h, step_function, phase_start_indices=None):
+    """
+    Generator kolejnych próbek symulacji (t, x) - zaczynając od stanu początkowego. \n
+    Jeśli podano listę phase_start_indices, dopisywany jest do niej indeks próbki rozpoczynającej każdą
+    kolejną fazę (tak jak w run_simulation). \n
+    Kroki metod RK (obiekty z metodą step_into) aktualizują stan w miejscu - zwracany wektor x jest ważny
+    do następnej próbki i trzeba go skopiować, jeśli ma zostać zapamiętany. Metodom wielokrokowym
+    (obiekty z metodą reset) historia pochodnych jest czyszczona na początku każdej fazy, bo sterowania skaczą.
+    """
+    x_current = np.array(x_initial, dtype=float)
+    step_into = getattr(step_function, 'step_into', None)
+    reset = getattr(step_function, 'reset', None)
+    t_current = 0.0
+    t_last = t_current  # czas ostatniej zapisanej próbki
+    n_samples = 1
+    yield t_current, x_current
 
-def euler_step(x, w, h):
-    """Jeden krok jawnej metody Eulera dla danego stanu, sterowań oraz kroku dyskretyzacji. \n
-    (x[n+1]-x[n]) / h = dx/dt"""
-    return x + h * robot_dynamics(x, w)
+    for i, phase in enumerate(phases):
+        w_phase = np.array([phase['w1'], phase['w2']])  # sterowanie dla tej fazy
+        t_phase_start = t_last
+        t_phase_end = t_phase_start + phase['duration']
+        epsilon = h / 100.0  # tolerancja dla porównań zmiennoprzecinkowych
+        if reset is not None:
+            reset()
 
+        # pętla kroków wewnątrz fazy
+        while t_current < t_phase_end - epsilon:
+            time_to_end_phase = t_phase_end - t_current
+            current_h = min(h, time_to_end_phase)
+            if current_h <= epsilon:
+                break  # unikaj bardzo małych kroków na końcu
 
-def rk2_step(x, w, h):
-    """Jeden krok metody RK-2 (punktu środkowego) dla danego stanu, sterowań oraz kroku dyskretyzacji. \n
-    k₁ = h * f(x_n, w_n) \n
-    k₂ = h * f(x_n + k₁/2, w_n) (zakładamy, że sterowanie w jest stałe w kroku h) \n
-    x[n+1] = x[n] + k₂
-    """
-    k1 = h * robot_dynamics(x, w)
-    k2 = h * robot_dynamics(x + 0.5 * k1, w)
-    return x + k2
+            if step_into is not None:
+                step_into(x_current, w_phase, current_h, out=x_current)  # bez nowych tablic w kroku
+            else:
+                x_current = step_function(x_current, w_phase, current_h)
+            t_current += current_h
 
+            t_last = t_current
+            n_samples += 1
+            yield t_current, x_current
 
-def rk4_step(x, w, h):
-    """Jeden krok klasycznej metody RK-4 dla danego stanu, sterowań oraz kroku dyskretyzacji. \n
-    k₁ = h * f(x_n, w_n) \n
-    k₂ = h * f(x_n + k₁/2, w_n) \n
-    k₃ = h * f(x_n + k₂/2, w_n) \n
-    k₄ = h * f(x_n + k₃, w_n) \n
-    x[n+1] = x[n] + (k₁ + 2k₂ + 2k₃ + k₄) / 6"""
-    k1 = h * robot_dynamics(x, w)
-    k2 = h * robot_dynamics(x + 0.5 * k1, w)
-    k3 = h * robot_dynamics(x + 0.5 * k2, w)
-    k4 = h * robot_dynamics(x + k3, w)
-    return x + (k1 + 2*k2 + 2*k3 + k4) / 6.0
+        t_current = t_phase_end  # dokładny czas końca fazy (może być pominięty przez epsilon)
+        if phase_start_indices is not None and i < len(phases) - 1:  # indeks końca tej fazy (startu następnej)
+            phase_start_indices.append(n_samples)
 
 
-def run_simulation(x_initial, phases, h, step_function, method_name):
+def run_simulation(x_initial, phases, h, step_function, method_name, recorder=None):
     """
     Wykonuje symulację dla zadanej metody kroku.
 
@@ -62,103 +103,334 @@ def run_simulation(x_initial, phases, h, step_function, method_name):
         h (float): Krok dyskretyzacji.
         step_function (callable): Funkcja wykonująca jeden krok (w zależności od metody).
         method_name (str): Nazwa metody do wyświetlania postępu.
+        recorder: Obiekt zapisujący trajektorię (kolumny t, x1, x2), np. DecimatingRecorder dla
+            długich symulacji, ChunkRecorder przekazujący bloki dalej (wtedy zwracane historie są puste)
+            lub TrajectoryStore zapisujący trajektorię na dysk (zwracane są kolumny np.memmap).
+            Domyślnie TrajectoryRecorder (wszystkie próbki).
 
     Returns:
-        tuple: (t_history, x1_history, x2_history)
+        tuple: (t_history, x1_history, x2_history, phase_start_indices)
     """
-
-    x_current = x_initial.copy()
-    t_current = 0.0
-    t_history = [t_current]
-    x1_history = [x_current[0]]
-    x2_history = [x_current[1]]
-    total_steps = 0
+    if recorder is None:
+        recorder = TrajectoryRecorder(3)
     phase_start_indices = [0]  # indeks startowy pierwszej fazy
 
-    for i, phase in enumerate(phases):
-        w_phase = np.array([phase['w1'], phase['w2']])  # sterowanie dla tej fazy
-        t_phase_start = t_history[-1]
-        t_phase_end = t_phase_start + phase['duration']
-        epsilon = h / 100.0  # tolerancja dla porównań zmiennoprzecinkowych
+    # próbki liczone tutaj - rejestratory różnie raportują n_samples (decymacja, bloki niezapisane przed finish)
+    n_samples = 0
+    for t_current, x_current in simulation_steps(x_initial, phases, h, step_function, phase_start_indices):
+        recorder.append(t_current, x_current[0], x_current[1])
+        n_samples += 1
+
+    total_steps = n_samples - 1
+    # granice faz jako indeksy zapisanych kolumn (rejestrator decymujący przechowuje tylko część próbek)
+    phase_start_indices = recorder.stored_indices(phase_start_indices)
+    recorder.finish(method=method_name, h=h, phase_start_indices=phase_start_indices,
+                    x_initial=np.asarray(x_initial), phases=phases)
+    print(f"  Symulacja {method_name} zakończona. Wykonano {total_steps} kroków.")
+    return (*recorder.columns(), phase_start_indices)
 
-        # pętla kroków wewnątrz fazy
-        while t_current < t_phase_end - epsilon:
+
+def iter_simulation_chunks(x_initial, phases, h, step_function, chunk_size=65536):
+    """
+    Generator bloków trajektorii o stałym rozmiarze (chunk_size, 3) z kolumnami [t, x1, x2],
+    zwracanych w trakcie symulacji - pamięć nie zależy od długości symulacji. Ostatni blok może być krótszy.
+    """
+    block = np.empty((chunk_size, 3))
+    size = 0
+    for t_current, x_current in simulation_steps(x_initial, phases, h, step_function):
+        block[size] = t_current, x_current[0], x_current[1]
+        size += 1
+        if size == chunk_size:
+            yield block.copy()
+            size = 0
+    if size:
+        yield block[:size].copy()
+
+
+def run_ensemble_simulation(x_initials, phases, h, step_function, method_name):
+    """
+    Wykonuje symulację całej floty N robotów jednocześnie (tryb zespołowy). \n
+    Stan jest macierzą (N, 3), a funkcja kroku przesuwa wszystkie roboty jednym wektorowym wywołaniem
+    na krok. Każdy robot przechodzi dokładnie tę samą sekwencję kroków co w `run_simulation`,
+    więc wyniki są identyczne (bit w bit) z N osobnymi wywołaniami.
+
+    Args:
+        x_initials (np.array): Macierz (N, 3) stanów początkowych robotów.
+        phases (list): Wspólna lista faz (słowników) lub lista N list faz - osobna tabela dla każdego robota.
+        h (float): Krok dyskretyzacji.
+        step_function (callable): Funkcja wykonująca jeden krok (euler_step, rk2_step, rk4_step).
+        method_name (str): Nazwa metody do wyświetlania postępu.
+
+    Returns:
+        tuple: (t_history, x1_history, x2_history, n_samples, phase_start_indices) \n
+        Historie mają wymiar (K+1, N); robot i ma n_samples[i] próbek, a dalsze wiersze powtarzają
+        jego ostatnią wartość. phase_start_indices to lista N list indeksów początków faz.
+    """
+    x_current = np.array(x_initials, dtype=float)
+    n_robots = x_current.shape[0]
+    robot_ids = np.arange(n_robots)
+
+    # tabele faz (N, P) - wspólna tabela jest powielana dla każdego robota
+    if len(phases) == 0 or isinstance(phases[0], dict):
+        phase_tables = [phases] * n_robots
+    else:
+        phase_tables = phases
+    n_phases = np.array([len(table) for table in phase_tables])
+    max_phases = max(1, n_phases.max(initial=0))
+    w_table = np.zeros((n_robots, max_phases, 2))
+    duration_table = np.zeros((n_robots, max_phases))
+    for r, table in enumerate(phase_tables):
+        for i, phase in enumerate(table):
+            w_table[r, i] = (phase['w1'], phase['w2'])
+            duration_table[r, i] = phase['duration']
+
+    epsilon = h / 100.0  # tolerancja dla porównań zmiennoprzecinkowych
+    t_current = np.zeros(n_robots)
+    t_last = np.zeros(n_robots)  # odpowiednik t_history[-1] z run_simulation
+    phase_idx = np.zeros(n_robots, dtype=int)
+    t_phase_end = t_last + duration_table[:, 0]
+    done = n_phases == 0
+    n_samples = np.ones(n_robots, dtype=int)
+    phase_start_indices = [[0] for _ in range(n_robots)]
+
+    t_history = [t_current.copy()]
+    x1_history = [x_current[:, 0].copy()]
+    x2_history = [x_current[:, 1].copy()]
+    total_steps = 0
+
+    while True:
+        # zakończenie faz robotów, które nie potrzebują już kroku w bieżącej fazie
+        while True:
             time_to_end_phase = t_phase_end - t_current
-            current_h = min(h, time_to_end_phase)
-            if current_h <= epsilon:
-                break  # unikaj bardzo małych kroków na końcu
+            needs_step = (~done & (t_current < t_phase_end - epsilon)
+                          & (np.minimum(h, time_to_end_phase) > epsilon))
+            finished = ~done & ~needs_step
+            if not finished.any():
+                break
+            t_current[finished] = t_phase_end[finished]  # dokładny czas końca fazy
+            last_phase = phase_idx == n_phases - 1
+            done |= finished & last_phase
+            advance = finished & ~last_phase
+            for r in np.flatnonzero(advance):
+                phase_start_indices[r].append(n_samples[r])
+            phase_idx[advance] += 1
+            t_phase_end[advance] = t_last[advance] + duration_table[advance, phase_idx[advance]]
+
+        if done.all():
+            break
+
+        # jeden wektorowy krok dla wszystkich aktywnych robotów (zakończone stoją w miejscu)
+        current_h = np.where(done, 0.0, np.minimum(h, t_phase_end - t_current))
+        w_current = w_table[robot_ids, phase_idx]
+        x_next = step_function(x_current, w_current, current_h[:, np.newaxis])
+        x_current = np.where(done[:, np.newaxis], x_current, x_next)
+        t_current = np.where(done, t_current, t_current + current_h)
+        t_last = np.where(done, t_last, t_current)
+
+        t_history.append(t_last)
+        x1_history.append(x_current[:, 0])
+        x2_history.append(x_current[:, 1])
+        n_samples += ~done
+        total_steps += int(np.count_nonzero(~done))
+
+    print(f"  Symulacja zespołowa {method_name} zakończona. {n_robots} robotów, łącznie {total_steps} kroków.")
+    return (np.stack(t_history), np.stack(x1_history), np.stack(x2_history),
+            n_samples, phase_start_indices)
+
+
+METHODS = [("Euler", euler_step, "jawna metoda Eulera"), ("RK-2", rk2_step, "metoda RK-2"),
+           ("RK-4", rk4_step, "metoda RK-4"), ("ABM-4", abm4_step, "metoda Adamsa-Bashfortha-Moultona")]
+METHOD_ORDERS = {"Euler": 1, "RK-2": 2, "RK-4": 4, "ABM-4": 4}  # rzędy zbieżności (dla auto-h)
+
+
+def auto_step(x_initial, phases, tolerance, method="RK-4", target='end'):
+    """
+    Tryb auto-h: największy krok metody z METHODS, dla którego błąd położenia końcowego (target='end')
+    lub całej trajektorii (target='trajectory') nie przekracza tolerance [m] - oszacowany ekstrapolacją
+    Richardsona (step_selection.py). Krok nie przekracza 1/20 czasu ruchu.
 
-            x_next = step_function(x_current, w_phase, current_h)
+    Returns:
+        dict: wynik select_step (h, error, extrapolated, ...).
+    """
+    steps = {name: step for name, step, _ in METHODS}
+    if method not in steps:
+        raise ValueError(f"Nieznana metoda {method!r} (dostępne: {', '.join(steps)})")
+    total_time = sum(phase['duration'] for phase in phases)
+    if total_time <= 0:
+        raise ValueError("Dobór kroku wymaga ruchu o dodatnim czasie trwania")
 
-            t_current += current_h
-            x_current = x_next
+    def simulate(h):
+        recorder = TrajectoryRecorder(3)  # bez komunikatów run_simulation dla każdej symulacji próbnej
+        for t_current, x_current in simulation_steps(x_initial, phases, h, steps[method]):
+            recorder.append(t_current, x_current[0], x_current[1])
+        return positions_target(*recorder.columns(), target)
 
-            t_history.append(t_current)
-            x1_history.append(x_current[0])
-            x2_history.append(x_current[1])
-            total_steps += 1
+    h_max = total_time / 20
+    return select_step(simulate, tolerance, METHOD_ORDERS[method], h_start=h_max, h_max=h_max,
+                       h_min=total_time * 1e-7)
 
-        t_current = t_phase_end  # dokładny czas końca fazy (może być pominięty przez epsilon)
-        if i < len(phases) - 1:  # indeks końca tej fazy (startu następnej)
-            phase_start_indices.append(len(t_history))
 
-    print(f"  Symulacja {method_name} zakończona. Wykonano {total_steps} kroków.")
-    return t_history, x1_history, x2_history, phase_start_indices
-
-
-# parametry początkowe
-x1_0 = float(input("Podaj początkową pozycję x₁ [m]: "))
-x2_0 = float(input("Podaj początkową pozycję x₂ [m]: "))
-x3_0_deg = float(input("Podaj początkowy kąt obrotu x₃ [stopnie]: "))
-x3_0 = np.radians(x3_0_deg)  # konwersja na radiany dla obliczeń
-x_initial = np.array([x1_0, x2_0, x3_0])
-
-h = float(input("Podaj krok dyskretyzacji h [s] (np. 0.1): "))
-
-phases = []
-num_phases = int(input("Podaj liczbę faz ruchu (segmentów trajektorii): "))
-
-total_simulation_time = 0
-for i in range(num_phases):
-    print(f"\n--- Definicja Fazy {i + 1} ---")
-    print("Podaj parametry ruchu dla tej fazy:")
-    w1 = float(input(" Prędkość liniowa w₁ [m/s]: "))
-    w2_deg = float(input(" Prędkość kątowa w₂ [stopnie/s]: "))
-    w2 = np.radians(w2_deg)  # konwersja na rad/s dla obliczeń
-    duration = float(input(" Czas trwania fazy [s]: "))
-    phases.append({'w1': w1, 'w2': w2, 'duration': duration})
-    total_simulation_time += duration
-
-print(f"\nCałkowity czas symulacji: {total_simulation_time:.2f} s")
-print(f"Krok dyskretyzacji h: {h} s")
-
-# uruchomienie symulacji dla każdej metody
-t_euler, x1_euler, x2_euler, _ = run_simulation(x_initial, phases, h, euler_step, "jawna metoda Eulera")
-t_rk2, x1_rk2, x2_rk2, _ = run_simulation(x_initial, phases, h, rk2_step, "metoda RK-2")
-t_rk4, x1_rk4, x2_rk4, phase_indices = run_simulation(x_initial, phases, h, rk4_step, "metoda RK-4")
-
-# wykres porównawczy
-plt.figure(figsize=(12, 9))
-
-# Euler
-plt.plot(x1_euler, x2_euler, 'o-', label='Euler', markersize=3, linewidth=1, color='red', alpha=0.8)
-# RK-2
-plt.plot(x1_rk2, x2_rk2, 's-', label='RK-2', markersize=3, linewidth=1, color='blue', alpha=0.8)
-# RK-4
-plt.plot(x1_rk4, x2_rk4, '^-', label=f'RK-4', markersize=3, linewidth=1, color='green', alpha=0.8)
-
-# punkt startowy (wspólny dla wszystkich)
-plt.plot(x1_euler[0], x2_euler[0], 'ko', markersize=10, label='Start')
-
-# punkty końcowe dla każdej metody (mogą się różnić)
-plt.plot(x1_euler[-1], x2_euler[-1], 'rs', markersize=10, label='Koniec Euler')
-plt.plot(x1_rk2[-1], x2_rk2[-1], 'bs', markersize=10, label='Koniec RK-2')
-plt.plot(x1_rk4[-1], x2_rk4[-1], 'gs', markersize=10, label='Koniec RK-4')
-
-plt.title(f'Porównanie wyznaczonych trajektorii robota - metody numeryczne (h={h} s)')
-plt.xlabel('Pozycja x1 [m]')
-plt.ylabel('Pozycja x2 [m]')
-plt.legend()
-plt.grid(True)
-plt.axis('equal')  # do wizualizacji ruchu po okręgu
-plt.show()
+def compare_methods(x_initial, phases, h):
+    """
+    Symulacje metodami Eulera, RK-2, RK-4, ABM-4 oraz rozwiązanie dokładne na tej samej siatce czasu.
+
+    Returns:
+        dict: nazwa metody -> (t, x1, x2, phase_start_indices); rozwiązanie dokładne pod kluczem "exact".
+    """
+    trajectories = {name: run_simulation(x_initial, phases, h, step, method_name)
+                    for name, step, method_name in METHODS}
+    trajectories["exact"] = run_simulation(x_initial, phases, h, exact_step, "rozwiązanie dokładne")
+    return trajectories
+
+
+def end_errors(trajectories):
+    """Błąd położenia końcowego każdej metody względem rozwiązania dokładnego."""
+    _, x1_exact, x2_exact, _ = trajectories["exact"]
+    return {name: float(np.hypot(x1[-1] - x1_exact[-1], x2[-1] - x2_exact[-1]))
+            for name, (_, x1, x2, _) in trajectories.items() if name != "exact"}
+
+
+def plot_comparison(trajectories, h):
+    """Wykres porównawczy trajektorii (decymowanych min/max do rozdzielczości ekranu)."""
+    _, x1_euler, x2_euler, _ = trajectories["Euler"]
+    _, x1_rk2, x2_rk2, _ = trajectories["RK-2"]
+    _, x1_rk4, x2_rk4, _ = trajectories["RK-4"]
+    _, x1_abm4, x2_abm4, _ = trajectories["ABM-4"]
+    _, x1_exact, x2_exact, _ = trajectories["exact"]
+
+    fig = plt.figure(figsize=(12, 9))
+    ax = plt.gca()
+
+    arrow_step = max(1, int(1.0 / h))  # strzałki kierunku ruchu co ok. 1 s
+
+    # Euler (z punktem startowym wspólnym dla wszystkich metod)
+    draw_trajectory(ax, x1_euler, x2_euler, '-', color='red', label='Euler', linewidth=1, alpha=0.8,
+                    arrow_step=arrow_step, start_marker='ko', start_label='Start', end_marker='rs',
+                    end_label='Koniec Euler')
+    # RK-2
+    draw_trajectory(ax, x1_rk2, x2_rk2, '-', color='blue', label='RK-2', linewidth=1, alpha=0.8,
+                    arrow_step=arrow_step, end_marker='bs', end_label='Koniec RK-2')
+    # RK-4 (punkty końcowe dla każdej metody mogą się różnić)
+    draw_trajectory(ax, x1_rk4, x2_rk4, '-', color='green', label='RK-4', linewidth=1, alpha=0.8,
+                    arrow_step=arrow_step, end_marker='gs', end_label='Koniec RK-4')
+    # ABM-4 (wielokrokowa, start każdej fazy krokami RK-4)
+    draw_trajectory(ax, x1_abm4, x2_abm4, ':', color='magenta', label='ABM-4', linewidth=1.5, alpha=0.8,
+                    end_marker='ms', end_label='Koniec ABM-4')
+    # rozwiązanie dokładne
+    draw_trajectory(ax, x1_exact, x2_exact, 'k--', label='Rozwiązanie dokładne', linewidth=1)
+
+    plt.title(f'Porównanie wyznaczonych trajektorii robota - metody numeryczne (h={h:.4g} s)')
+    plt.xlabel('Pozycja x1 [m]')
+    plt.ylabel('Pozycja x2 [m]')
+    plt.legend()
+    plt.grid(True)
+    plt.axis('equal')  # do wizualizacji ruchu po okręgu
+    return fig
+
+
+def animate_trajectory(x_initial, phases, trajectory, max_playback_s=20.0):
+    """
+    Okno z animacją (blitting, czas rzeczywisty) trajektorii (t, x1, x2, _) z run_simulation. \n
+    Kąt x₃ brany jest z rozwiązania dokładnego - ẋ₃ = w₂ jest stałe w fazie, więc każda z metod liczy x₃
+    dokładnie (do zaokrągleń). Długie misje są przyspieszane tak, by odtwarzanie trwało najwyżej
+    max_playback_s sekund.
+    """
+    t, x1, x2, _ = trajectory
+    _, x1_exact, x2_exact, x3, _ = exact_trajectory(x_initial, phases, t)
+    fig, ax = plt.subplots(figsize=(9, 9))
+    ax.plot(x1_exact, x2_exact, 'k--', linewidth=0.8, alpha=0.5, label='Rozwiązanie dokładne')
+    ax.set_title('Animacja ruchu robota (RK-4)')
+    ax.set_xlabel('Pozycja x1 [m]')
+    ax.set_ylabel('Pozycja x2 [m]')
+    ax.grid(True)
+    ax.legend(loc='lower right')
+    speed = max(1.0, (t[-1] - t[0]) / max_playback_s)
+    robot_animation = RobotAnimation(ax, t, x1, x2, heading=x3, speed=speed, trail_seconds=2.0 * speed)
+    return robot_animation.play()
+
+
+def run_scenario(params):
+    """
+    Uruchomienie bez pytań input() - parametry ze scenariusza (x1_0, x2_0, x3_0_deg, h, phases). \n
+    h = "auto" wybiera krok metody 'auto_method' (domyślnie RK-4) do tolerancji 'tolerance' [m] położenia
+    końcowego lub całej trajektorii ('tolerance_target': "end" / "trajectory").
+    """
+    x_initial = np.array([params['x1_0'], params['x2_0'], np.radians(params['x3_0_deg'])])
+    phases = [{'w1': phase['w1'], 'w2': np.radians(phase['w2_deg']), 'duration': phase['duration']}
+              for phase in params['phases']]
+    h = params['h']
+    selection = None
+    if h == 'auto':
+        selection = auto_step(x_initial, phases, params['tolerance'], params.get('auto_method', 'RK-4'),
+                              params.get('tolerance_target', 'end'))
+        h = selection['h']
+
+    trajectories = compare_methods(x_initial, phases, h)
+    _, x1_exact, x2_exact, _ = trajectories["exact"]
+    results = {
+        'n_samples': len(x1_exact),
+        'exact_end_position': [float(x1_exact[-1]), float(x2_exact[-1])],
+        'end_errors': end_errors(trajectories),
+    }
+    if selection is not None:
+        results['auto_h'] = selection_summary(selection)
+    return results, [plot_comparison(trajectories, h)]
+
+
+def main():
+    # parametry początkowe
+    x1_0 = float(input("Podaj początkową pozycję x₁ [m]: "))
+    x2_0 = float(input("Podaj początkową pozycję x₂ [m]: "))
+    x3_0_deg = float(input("Podaj początkowy kąt obrotu x₃ [stopnie]: "))
+    x3_0 = np.radians(x3_0_deg)  # konwersja na radiany dla obliczeń
+    x_initial = np.array([x1_0, x2_0, x3_0])
+
+    h_text = input("Podaj krok dyskretyzacji h [s] (np. 0.1) lub 'auto' (dobór h do zadanej tolerancji): ")
+    tolerance = target = method = None
+    if h_text.strip().lower() == 'auto':
+        tolerance = float(input("Podaj dopuszczalny błąd położenia [m] (np. 1e-3): "))
+        target_text = input("Tolerancja dla położenia (k)ońcowego czy całej (t)rajektorii? [k/t]: ")
+        target = 'trajectory' if target_text.strip().lower().startswith('t') else 'end'
+        method = input(f"Metoda, dla której dobierany jest krok ({', '.join(METHOD_ORDERS)}) [RK-4]: ").strip()
+        method = method or "RK-4"
+    else:
+        h = float(h_text)
+
+    phases = []
+    num_phases = int(input("Podaj liczbę faz ruchu (segmentów trajektorii): "))
+
+    total_simulation_time = 0
+    for i in range(num_phases):
+        print(f"\n--- Definicja Fazy {i + 1} ---")
+        print("Podaj parametry ruchu dla tej fazy:")
+        w1 = float(input(" Prędkość liniowa w₁ [m/s]: "))
+        w2_deg = float(input(" Prędkość kątowa w₂ [stopnie/s]: "))
+        w2 = np.radians(w2_deg)  # konwersja na rad/s dla obliczeń
+        duration = float(input(" Czas trwania fazy [s]: "))
+        phases.append({'w1': w1, 'w2': w2, 'duration': duration})
+        total_simulation_time += duration
+
+    print(f"\nCałkowity czas symulacji: {total_simulation_time:.2f} s")
+    if tolerance is not None:
+        selection = auto_step(x_initial, phases, tolerance, method, target)
+        print_selection(selection)
+        h = selection['h']
+    print(f"Krok dyskretyzacji h: {h:.4g} s")
+
+    # uruchomienie symulacji dla każdej metody
+    trajectories = compare_methods(x_initial, phases, h)
+
+    # błąd położenia końcowego względem rozwiązania dokładnego (referencja o zerowym błędzie metody)
+    for name, end_error in end_errors(trajectories).items():
+        print(f"  Błąd położenia końcowego ({name}): {end_error:.3e} m")
+
+    plot_comparison(trajectories, h)
+
+    animation = None  # referencja do FuncAnimation musi przetrwać do plt.show()
+    if input("Pokazać animację ruchu robota (RK-4)? [t/N]: ").strip().lower().startswith('t'):
+        animation = animate_trajectory(x_initial, phases, trajectories["RK-4"])
+    plt.show()
+
+
+if __name__ == '__main__':
+    main()
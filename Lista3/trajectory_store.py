@@ -0,0 +1,136 @@
+"""
+Zapis bardzo długich trajektorii na dysk w postaci plików .npy mapowanych do pamięci.
+
+Trajektoria to katalog z jednym plikiem .npy na kolumnę (np. t.npy, x1.npy, x2.npy) oraz plikiem meta.json
+z parametrami symulacji (metoda, h, granice faz phase_start_indices itp.). Zapis odbywa się blokami, więc
+w pamięci jest tylko jeden blok; odczyt (open_trajectory) nie kopiuje danych - kolumny są np.memmap,
+a wycinek czasu wybierany jest wyszukiwaniem binarnym.
+"""
+import json
+import os
+
+import numpy as np
+
+NPY_HEADER_SIZE = 128  # stała długość nagłówka .npy (wielokrotność 64), by można go było nadpisać na końcu zapisu
+METADATA_FILE = 'meta.json'
+
+
+def _npy_header(length):
+    """Nagłówek pliku .npy (wersja 1.0) dla jednowymiarowej tablicy float64 o zadanej długości."""
+    header = "{'descr': '<f8', 'fortran_order': False, 'shape': (%d,), }" % length
+    header = header.ljust(NPY_HEADER_SIZE - 10 - 1) + '\n'
+    return b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header.encode('latin1')
+
+
+def to_json(value):
+    """Zamienia tablice i skalary numpy na typy zapisywalne w JSON (argument default= dla json.dump)."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Nie można zapisać obiektu typu {type(value).__name__} w JSON")
+
+
+class TrajectoryStore:
+    """
+    Zapisuje trajektorię blokami do plików .npy (jeden plik na kolumnę) w katalogu 'path'. \n
+    Ma ten sam interfejs co rejestratory z recorder.py (append, n_samples, stored_indices, finish, columns),
+    więc można go przekazać jako 'recorder' do run_simulation. Bloki całych kolumn zapisuje write_block.
+    """
+
+    def __init__(self, path, columns=('t', 'x1', 'x2'), metadata=None, chunk_size=65536):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.column_names = tuple(columns)
+        self.metadata = dict(metadata or {})
+        self.chunk_size = chunk_size
+        self.n_samples = 0
+        self._block = np.empty((chunk_size, len(self.column_names)))
+        self._size = 0
+        self._files = []
+        for name in self.column_names:
+            file = open(os.path.join(path, f'{name}.npy'), 'wb')
+            file.write(_npy_header(0))
+            self._files.append(file)
+
+    def append(self, *values):
+        """Dopisuje jedną próbkę (po jednej wartości na kolumnę)."""
+        self._block[self._size] = values
+        self._size += 1
+        if self._size == self.chunk_size:
+            self.flush()
+
+    def write_block(self, block):
+        """Dopisuje blok próbek o wymiarze (n, liczba kolumn)."""
+        self.flush()
+        block = np.asarray(block, dtype='<f8')
+        for j, file in enumerate(self._files):
+            file.write(np.ascontiguousarray(block[:, j]).tobytes())
+        self.n_samples += len(block)
+
+    def flush(self):
+        """Zapisuje na dysk próbki zebrane w bieżącym bloku."""
+        if self._size:
+            size, self._size = self._size, 0
+            self.write_block(self._block[:size])
+
+    def __len__(self):
+        return self.n_samples + self._size
+
+    def stored_indices(self, indices):
+        """Indeksy w zapisanych kolumnach dla indeksów próbek przekazanych do append (bez zmian)."""
+        return list(indices)
+
+    def finish(self, **metadata):
+        """Kończy zapis: uzupełnia nagłówki .npy o długość kolumn i zapisuje meta.json."""
+        self.flush()
+        for file in self._files:
+            file.seek(0)
+            file.write(_npy_header(self.n_samples))
+            file.close()
+        self._files = []
+        self.metadata.update(metadata)
+        self.metadata.update(columns=list(self.column_names), n_samples=self.n_samples)
+        with open(os.path.join(self.path, METADATA_FILE), 'w') as file:
+            json.dump(self.metadata, file, indent=2, default=to_json)
+
+    def columns(self):
+        """Zapisane kolumny odczytane bez kopiowania (np.memmap) - dostępne po finish()."""
+        return open_trajectory(self.path).columns()
+
+
+class StoredTrajectory:
+    """Trajektoria zapisana przez TrajectoryStore, otwarta w trybie mapowania pamięci (tylko do odczytu)."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, METADATA_FILE)) as file:
+            self.metadata = json.load(file)
+        self.column_names = tuple(self.metadata['columns'])
+        self._columns = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r')
+                         for name in self.column_names}
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def __len__(self):
+        return self.metadata['n_samples']
+
+    def columns(self):
+        """Wszystkie kolumny (np.memmap) w kolejności zapisu."""
+        return tuple(self._columns[name] for name in self.column_names)
+
+    def window(self, start, end, time_column='t'):
+        """
+        Wycinek trajektorii dla start <= t <= end (kolumna czasu musi być niemalejąca). \n
+        Zwraca słownik kolumn - widoki memmap, bez wczytywania całego pliku.
+        """
+        time = self._columns[time_column]
+        i0 = np.searchsorted(time, start, side='left')
+        i1 = np.searchsorted(time, end, side='right')
+        return {name: column[i0:i1] for name, column in self._columns.items()}
+
+
+def open_trajectory(path):
+    """Otwiera trajektorię zapisaną przez TrajectoryStore."""
+    return StoredTrajectory(path)
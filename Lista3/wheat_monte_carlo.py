@@ -0,0 +1,69 @@
+"""
+Analiza ryzyka modelu konta i magazynu pszenicy z zadania 4 metodą Monte Carlo.
+
+Dla zadanego planu skupu/sprzedaży v(t) losowane są ścieżki cen p(t) (geometryczny ruch Browna albo bootstrap
+stóp zwrotu z historycznych cen), a dla każdej liczone jest saldo końcowe x[H]. Raport zawiera kwantyle salda,
+VaR i CVaR straty oraz prawdopodobieństwo ujemnego stanu pszenicy i ujemnego salda.
+
+Przykład:
+    python wheat_monte_carlo.py --x0 10000 --y0 20 --r 0.0001 --h 2 --v 0 5 5 -10 -10 0 -5 \
+        --p0 900 --sigma 0.02 --paths 1000000 --json ryzyko.json
+"""
+import argparse
+import functools
+import json
+import time
+
+import numpy as np
+
+from task_4 import monte_carlo_wheat, gbm_price_paths, bootstrap_price_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo dla modelu skupu i sprzedaży pszenicy (zadanie 4).')
+    parser.add_argument('--x0', type=float, required=True, help='początkowe saldo konta [PLN]')
+    parser.add_argument('--y0', type=float, required=True, help='początkowy stan pszenicy [t]')
+    parser.add_argument('--r', type=float, default=0.0, help='dzienna stopa zysku na koncie')
+    parser.add_argument('--h', type=float, default=0.0, help='dzienny koszt składowania tony [PLN/(t*dzień)]')
+    parser.add_argument('--v', type=float, nargs='+', required=True, help='plan skupu/sprzedaży v(t) [t/dzień]')
+    parser.add_argument('--p0', type=float, help='cena początkowa (domyślnie ostatnia cena historyczna)')
+    parser.add_argument('--mu', type=float, default=0.0, help='dzienny dryf GBM')
+    parser.add_argument('--sigma', type=float, default=0.02, help='dzienna zmienność GBM')
+    parser.add_argument('--history', help='plik z historycznymi cenami (jedna na wiersz) - bootstrap zamiast GBM')
+    parser.add_argument('--paths', type=int, default=100000, help='liczba ścieżek cen')
+    parser.add_argument('--chunk', type=int, default=20000, help='liczba ścieżek liczonych jednocześnie')
+    parser.add_argument('--alpha', type=float, default=0.05, help='poziom VaR/CVaR')
+    parser.add_argument('--seed', type=int, default=None, help='ziarno generatora liczb losowych')
+    parser.add_argument('--json', help='ścieżka raportu JSON')
+    args = parser.parse_args()
+
+    H = len(args.v)
+    if args.history:
+        price_paths = functools.partial(bootstrap_price_paths, H=H, historical_prices=np.loadtxt(args.history),
+                                        p0=args.p0)
+    elif args.p0 is None:
+        parser.error('podaj --p0 (cenę początkową) albo --history')
+    else:
+        price_paths = functools.partial(gbm_price_paths, H=H, p0=args.p0, mu=args.mu, sigma=args.sigma)
+
+    start = time.perf_counter()
+    stats = monte_carlo_wheat(args.x0, args.y0, args.r, args.h, args.v, price_paths, args.paths,
+                              chunk_size=args.chunk, seed=args.seed, alpha=args.alpha)
+    elapsed = time.perf_counter() - start
+    stats.pop('final_balance')
+
+    print(f"Ścieżek: {args.paths}, horyzont: {H} dni, czas: {elapsed:.2f} s")
+    print(f"Saldo końcowe: średnia {stats['mean']:.2f} PLN, odchylenie {stats['std']:.2f} PLN")
+    for q, value in stats['quantiles'].items():
+        print(f"  kwantyl {q:>5.2f}: {value:.2f} PLN")
+    print(f"VaR {1 - args.alpha:.0%} straty: {stats['var']:.2f} PLN, CVaR: {stats['cvar']:.2f} PLN")
+    print(f"P(ujemny stan pszenicy) = {stats['prob_negative_stock']:.4f}, "
+          f"P(ujemne saldo) = {stats['prob_negative_balance']:.4f}")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(dict(stats, wall_time_s=elapsed), file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,455 @@
+"""
+Pomiar szybkości i dokładności wszystkich metod całkowania z repozytorium (test regresji wydajności).
+
+Każdy przypadek uruchamia jedną metodę (Euler z Lista3/task_1.py, task_2.py, task_3.py; Euler, RK-2, RK-4,
+ABM-4 z task_5.py i pozostałe tablice Butchera z robot_model.py; ZOH, RK45 i SDIRK2 z task_2.py; propagacja
+eksponentą macierzy z Lista2/decay_chain.py) na problemie z rozwiązaniem analitycznym z Listy 2
+(odpowiedz_jednostkowa, odpowiedz_diraca, oscillator_response, decay_curve) albo rozwiązaniem dokładnym
+modelu robota. Dla każdego przypadku zapisywane są:
+- liczba kroków na sekundę (mediana z --repeat próbek czasu trwających co najmniej --sample-time s każda,
+  bez śledzenia pamięci i zliczania), przepustowość względna - kroki na czas obciążenia wzorcowego
+  mierzonego obok każdej próbki (reference_workload, niezależna od chwilowej szybkości maszyny) - i jej rozrzut,
+- liczba wywołań prawych stron (funkcje prawych stron podmieniane na czas pomiaru na zliczające; kroki
+  jawnych metod RK z Lista3/runge_kutta.py zliczają je same),
+- szczytowe zużycie pamięci (tracemalloc),
+- błąd maksymalny i RMS względem rozwiązania analitycznego.
+
+Wyniki porównywane są z linią bazową (baseline.json); spadek przepustowości względnej o więcej niż
+--throughput-tolerance (albo o więcej niż NOISE_SIGMAS łącznych odchyleń szumu pomiaru, gdy szum jest większy),
+wzrost błędu o więcej niż --accuracy-tolerance, więcej wywołań prawych stron lub wzrost pamięci o więcej niż
+--memory-tolerance kończą program kodem 1. Przepustowość zależy od maszyny - linię bazową należy odświeżyć
+(--update-baseline) na maszynie, na której uruchamiane są obliczenia.
+
+Przykład:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --update-baseline
+    python benchmarks/run_benchmarks.py --cases robot --repeat 10 --json wyniki_benchmarku.json
+"""
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+ERROR_FLOOR = 1e-12  # bezwzględny zapas przy porównaniu błędów (szum zaokrągleń przy błędach bliskich zeru)
+MEMORY_FLOOR_KB = 64.0  # bezwzględny zapas przy porównaniu pamięci
+MIN_SAMPLE_TIME = 0.2  # minimalny czas [s] jednej próbki pomiaru przepustowości (przypadek jest powtarzany)
+REFERENCE_SAMPLE_TIME = 0.05  # czas [s] pomiaru obciążenia wzorcowego przed i po każdej próbce
+NOISE_SIGMAS = 3.0  # próg spadku przepustowości w odchyleniach szumu pomiaru, gdy szum przekracza tolerancję
+MAX_THROUGHPUT_DROP = 0.4  # próg szumowy nie przekracza tego względnego spadku - wyraźna regresja zawsze wychodzi
+
+_modules = {}
+
+
+def load_module(relative_path):
+    """
+    Importuje skrypt z repozytorium (raz na proces), jak load_model w scenarios/run_batch.py - katalog skryptu
+    trafia do sys.path, a unikalna nazwa modułu rozróżnia task_*.py z różnych list.
+    """
+    if relative_path not in _modules:
+        path = os.path.join(ROOT, relative_path)
+        directory = os.path.dirname(path)
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+        name = relative_path.replace('/', '_').removesuffix('.py')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[relative_path] = module
+    return _modules[relative_path]
+
+
+class RhsCounter:
+    """
+    Zliczanie wywołań prawych stron: wrap podmienia funkcję w module na wersję zliczającą (metody wywołują
+    ją przez nazwę globalną modułu), a restore przywraca oryginał. Przy enabled=False wrap zwraca oryginał.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.count = 0
+        self._patched = []
+
+    def wrap(self, module, name):
+        original = getattr(module, name)
+        if not self.enabled:
+            return original
+
+        def counted(*args, **kwargs):
+            self.count += 1
+            return original(*args, **kwargs)
+
+        setattr(module, name, counted)
+        self._patched.append((module, name, original))
+        return counted
+
+    def restore(self):
+        for module, name, original in reversed(self._patched):
+            setattr(module, name, original)
+        self._patched.clear()
+
+
+# przypadki testowe - każdy zwraca słownik z liczbą kroków (n_steps), błędem względem rozwiązania analitycznego
+# (error) i opcjonalnie liczbą wywołań prawych stron (n_rhs), gdy prawe strony liczone są w pętli bez funkcji
+
+def first_order_euler(input_type):
+    """Lista3/task_1.py: człon inercyjny I rzędu, jawny Euler, h = T/2000 na [0, 5T]."""
+    def case(rhs):
+        simulation = load_module('Lista3/task_1.py')
+        reference = load_module('Lista2/task_2.py')
+        T, k, h = 1.0, 2.0, 5e-4
+        _, y = simulation.euler_simulation(h, input_type, T=T, k=k, y0=0.0, t_end=5 * T)
+        t = np.arange(len(y)) * h
+        if input_type == 'step':
+            error = y - reference.odpowiedz_jednostkowa(t, T, k)
+        else:
+            error = (y - reference.odpowiedz_diraca(t, T, k))[1:]  # y[0] to stan przed impulsem
+        return {'n_steps': len(y) - 1, 'n_rhs': len(y) - 1, 'error': error}  # prawa strona liczona w pętli
+    return case
+
+
+def second_order_step(method):
+    """Lista3/task_2.py: człon inercyjny II rzędu, skok jednostkowy, porównanie z oscillator_response."""
+    def case(rhs):
+        simulation = load_module('Lista3/task_2.py')
+        signals = importlib.import_module('signals')  # ten sam moduł, z którego korzysta task_2.py
+        reference = load_module('Lista2/task_5.py')
+        k, T, zeta, t_end = 2.0, 1.0, 0.3, 20.0
+        x0 = np.array([0.0, 0.0])
+        if method == 'zoh':
+            # macierze stanu wybierane są według funkcji prawych stron - bez podmiany; kroki bez prawych stron
+            t, y, _ = simulation.zoh_simulation(simulation.inertial_2nd_order, (k, T, zeta), signals.Step(), (),
+                                                (0.0, t_end), 1e-3, x0)
+            exact, _ = reference.oscillator_response(t, T**2, 2 * zeta * T, 1.0, k)
+            return {'n_steps': len(t) - 1, 'n_rhs': 0, 'error': y - exact}
+        system = rhs.wrap(simulation, 'inertial_2nd_order')
+        if method == 'euler':
+            t, y, _ = simulation.euler_simulation(system, (k, T, zeta), signals.Step(), (), (0.0, t_end), 1e-3, x0)
+            n_steps = len(t) - 1
+        else:
+            t, y, _, stats = simulation.dormand_prince_simulation(system, (k, T, zeta), signals.Step(), (),
+                                                                  (0.0, t_end), x0, rtol=1e-8, atol=1e-10)
+            n_steps = stats['n_accepted'] + stats['n_rejected']
+        # T²y'' + 2ζTy' + y = ku  <=>  my'' + by' + ky = F dla m = T², b = 2ζT, sztywności 1 i F = k
+        exact, _ = reference.oscillator_response(t, T**2, 2 * zeta * T, 1.0, k)
+        return {'n_steps': n_steps, 'error': y - exact}
+    return case
+
+
+def stiff_second_order(newton):
+    """
+    Lista3/task_2.py: sztywny człon inercyjny II rzędu (ζ = 50, bieguny -0.01 i -100), SDIRK2 z krokiem
+    h = 0.5 (25 razy powyżej granicy stabilności jawnego Eulera); newton=True wymusza ścieżkę metody Newtona
+    (podmieniona funkcja nie jest w STATE_SPACE_MODELS), newton=False - macierze kroku liczone raz.
+    """
+    def case(rhs):
+        simulation = load_module('Lista3/task_2.py')
+        signals = importlib.import_module('signals')
+        reference = load_module('Lista2/task_5.py')
+        k, T, zeta, t_end, h = 1.0, 1.0, 50.0, 200.0, 0.5
+        system = rhs.wrap(simulation, 'inertial_2nd_order') if newton else simulation.inertial_2nd_order
+        t, y, _ = simulation.euler_simulation(system, (k, T, zeta), signals.Step(), (), (0.0, t_end), h,
+                                              np.zeros(2), method='sdirk2')
+        exact, _ = reference.oscillator_response(t, T**2, 2 * zeta * T, 1.0, k)
+        result = {'n_steps': len(t) - 1, 'error': y - exact}
+        if not newton:
+            result['n_rhs'] = 0
+        return result
+    return case
+
+
+def integrating_euler(rhs):
+    """Lista3/task_2.py: człon całkujący z inercją, skok jednostkowy, porównanie z Lista2/task_3.py."""
+    simulation = load_module('Lista3/task_2.py')
+    signals = importlib.import_module('signals')
+    reference = load_module('Lista2/task_3.py')
+    k, T, h, t_end = 1.5, 2.0, 1e-3, 20.0
+    system = rhs.wrap(simulation, 'integrating_inertial')
+    t, y, _ = simulation.euler_simulation(system, (k, T), signals.Step(), (), (0.0, t_end), h, np.zeros(2))
+    return {'n_steps': len(t) - 1, 'error': y - reference.odpowiedz_jednostkowa(t, T, k)}
+
+
+ROBOT_PHASES = [{'w1': 1.0, 'w2': np.deg2rad(36.0), 'duration': 10.0},
+                {'w1': 0.5, 'w2': -np.deg2rad(20.0), 'duration': 5.0},
+                {'w1': 2.0, 'w2': 0.0, 'duration': 5.0}]
+
+
+def robot_euler(rhs):
+    """Lista3/task_3.py: robot mobilny, jawny Euler, błąd stanu końcowego względem exact_final_state."""
+    simulation = load_module('Lista3/task_3.py')
+    # krok to obiekt silnika RK z runge_kutta.py - wywołania prawej strony zlicza on sam (n_rhs)
+    n_rhs_start = simulation.euler_step.n_rhs
+    x_initial = np.array([0.0, 0.0, 0.0])
+    _, _, _, x_final, total_steps = simulation.simulate_robot(x_initial, ROBOT_PHASES, 1e-3)
+    error = x_final - simulation.exact_final_state(x_initial, ROBOT_PHASES)
+    return {'n_steps': total_steps, 'n_rhs': simulation.euler_step.n_rhs - n_rhs_start, 'error': error}
+
+
+def robot_method(method_name):
+    """Lista3/task_5.py: robot mobilny, metoda z METHODS, błąd położenia na całej trajektorii."""
+    def case(rhs):
+        simulation = load_module('Lista3/task_5.py')
+        step = {name: step for name, step, _ in simulation.METHODS}[method_name]
+        n_rhs_start = step.n_rhs
+        x_initial = np.array([0.0, 0.0, 0.0])
+        t, x1, x2, _ = simulation.run_simulation(x_initial, ROBOT_PHASES, 1e-2, step, method_name)
+        _, x1_exact, x2_exact, _, _ = simulation.exact_trajectory(x_initial, ROBOT_PHASES, t)
+        return {'n_steps': len(t) - 1, 'n_rhs': step.n_rhs - n_rhs_start,
+                'error': np.hypot(x1 - x1_exact, x2 - x2_exact)}
+    return case
+
+
+def robot_tableau(method):
+    """Lista3/robot_model.py: robot mobilny, krok RK_STEPS[method] w pętli run_simulation z task_5.py."""
+    def case(rhs):
+        simulation = load_module('Lista3/task_5.py')
+        step = importlib.import_module('robot_model').RK_STEPS[method]  # moduł, z którego korzysta task_5.py
+        n_rhs_start = step.n_rhs
+        x_initial = np.array([0.0, 0.0, 0.0])
+        t, x1, x2, _ = simulation.run_simulation(x_initial, ROBOT_PHASES, 1e-2, step, method)
+        _, x1_exact, x2_exact, _, _ = simulation.exact_trajectory(x_initial, ROBOT_PHASES, t)
+        return {'n_steps': len(t) - 1, 'n_rhs': step.n_rhs - n_rhs_start,
+                'error': np.hypot(x1 - x1_exact, x2 - x2_exact)}
+    return case
+
+
+def decay_expm(rhs):
+    """
+    Lista2/decay_chain.py: łańcuch A → B o równych okresach połowicznego rozpadu (propagacja eksponentą
+    macierzy) na 20 000 chwil; N_A porównywane z decay_curve z Lista2/task_4.py, N_B z N₀λt·e^{-λt}.
+    """
+    chain = load_module('Lista2/decay_chain.py')
+    reference = load_module('Lista2/task_4.py')
+    T_half, n0 = 2.0, 1000.0
+    t, n_a, lambda_decay = reference.decay_curve(T_half, n0, n_points=20000)
+    inventory = chain.decay_chain([T_half, T_half]).evaluate(t, [n0, 0.0])
+    n_b = n0 * lambda_decay * t * np.exp(-lambda_decay * t)
+    error = np.concatenate((inventory[:, 0] - n_a, inventory[:, 1] - n_b))
+    return {'n_steps': len(t) - 1, 'n_rhs': 0, 'error': error}
+
+
+CASES = {
+    'lista3_task1_euler_step': first_order_euler('step'),
+    'lista3_task1_euler_impulse': first_order_euler('impulse'),
+    'lista3_task2_euler_inertial2': second_order_step('euler'),
+    'lista3_task2_zoh_inertial2': second_order_step('zoh'),
+    'lista3_task2_rk45_inertial2': second_order_step('rk45'),
+    'lista3_task2_sdirk2_stiff_linear': stiff_second_order(newton=False),
+    'lista3_task2_sdirk2_stiff_newton': stiff_second_order(newton=True),
+    'lista3_task2_euler_integrating': integrating_euler,
+    'lista3_task3_robot_euler': robot_euler,
+    'lista3_task5_robot_euler': robot_method('Euler'),
+    'lista3_task5_robot_rk2': robot_method('RK-2'),
+    'lista3_task5_robot_rk4': robot_method('RK-4'),
+    'lista3_task5_robot_abm4': robot_method('ABM-4'),
+    'lista3_robot_heun': robot_tableau('heun'),
+    'lista3_robot_rk38': robot_tableau('rk38'),
+    'lista3_robot_ssprk3': robot_tableau('ssprk3'),
+    'lista2_decay_chain_expm': decay_expm,
+}
+
+
+def reference_workload():
+    """
+    Stałe obciążenie wzorcowe o profilu przypadków (pętla Pythona z małymi działaniami numpy jak w krokach
+    całkowania i kilka mnożeń macierzy). Czas przypadku dzielony przez czas tego obciążenia zmierzony tuż obok
+    nie zależy od chwilowej szybkości maszyny (taktowanie, obciążenie przez inne procesy), która na maszynach
+    współdzielonych zmienia się o kilkadziesiąt procent w ciągu sekund.
+    """
+    x = np.zeros(3)
+    w = np.array([1.0, 0.5])
+    derivative = np.empty(3)
+    for _ in range(4000):
+        derivative[0] = np.cos(x[2]) * w[0]
+        derivative[1] = np.sin(x[2]) * w[0]
+        derivative[2] = w[1]
+        x += 1e-3 * derivative
+    matrix = np.full((64, 64), 1.0 / 64)
+    for _ in range(50):
+        matrix = matrix @ matrix
+    return x
+
+
+def timed_sample(function, sample_time):
+    """Średni czas jednego wywołania function() w próbce trwającej co najmniej sample_time sekund."""
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        with contextlib.redirect_stdout(io.StringIO()):
+            function()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= sample_time:
+            return elapsed / runs
+
+
+def measure(case, repeat=5, sample_time=MIN_SAMPLE_TIME):
+    """
+    Pomiar jednego przypadku: przebieg rozgrzewający (import modułów nie wlicza się do pamięci ani czasu),
+    przebieg ze zliczaniem prawych stron i tracemalloc (liczba wywołań, pamięć, błędy), a potem repeat próbek
+    czasu bez instrumentacji. Każda próbka powtarza przypadek, aż minie co najmniej sample_time sekund (krótkie
+    przypadki, np. kilka ms, nie odróżniłyby się inaczej od szumu planisty), i jest dzielona przez czas
+    reference_workload zmierzony przed nią i po niej. Przepustowość (bezwzględna i względna - kroki na jedno
+    obciążenie wzorcowe) liczona jest z median próbek, a rozrzut (względne odchylenie MAD) - z próbek względnych.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        case(RhsCounter(enabled=False))
+
+    rhs = RhsCounter()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = case(rhs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        rhs.restore()
+
+    wall_times, relative_times = [], []
+    for _ in range(repeat):
+        reference_before = timed_sample(reference_workload, REFERENCE_SAMPLE_TIME)
+        wall_time = timed_sample(lambda: case(RhsCounter(enabled=False)), sample_time)
+        reference_after = timed_sample(reference_workload, REFERENCE_SAMPLE_TIME)
+        wall_times.append(wall_time)
+        relative_times.append(wall_time / np.sqrt(reference_before * reference_after))
+
+    error = np.abs(np.asarray(result['error'], dtype=float))
+    wall_time = float(np.median(wall_times))
+    relative_time = float(np.median(relative_times))
+    spread = 1.4826 * float(np.median(np.abs(np.asarray(relative_times) - relative_time))) / relative_time
+    return {
+        'n_steps': int(result['n_steps']),
+        'n_rhs': int(result.get('n_rhs', rhs.count)),
+        'wall_time_s': wall_time,
+        'steps_per_s': result['n_steps'] / wall_time,
+        'relative_throughput': result['n_steps'] / relative_time,
+        'throughput_spread': spread,
+        'peak_memory_kb': peak / 1024,
+        'max_error': float(error.max()),
+        'rms_error': float(np.sqrt(np.mean(error**2))),
+    }
+
+
+def throughput_threshold(row, reference, tolerance):
+    """
+    Próg przepustowości względnej (kroki na obciążenie wzorcowe; dla starszej linii bazowej bez niej -
+    bezwzględnej): spadek o tolerance albo o NOISE_SIGMAS łącznych odchyleń pomiaru i linii bazowej,
+    jeśli szum jest większy (najwyżej MAX_THROUGHPUT_DROP).
+
+    Returns:
+        tuple: (klucz porównywanej przepustowości, najmniejsza akceptowana wartość)
+    """
+    key = 'relative_throughput' if 'relative_throughput' in reference else 'steps_per_s'
+    noise = np.hypot(row.get('throughput_spread', 0.0), reference.get('throughput_spread', 0.0))
+    return key, reference[key] * (1 - min(max(tolerance, NOISE_SIGMAS * noise), MAX_THROUGHPUT_DROP))
+
+
+def compare(results, baseline, throughput_tolerance=0.3, accuracy_tolerance=0.01, memory_tolerance=0.5):
+    """
+    Regresje względem linii bazowej.
+
+    Returns:
+        list: Opisy regresji (pusta lista - brak regresji).
+    """
+    regressions = []
+    for name, row in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        key, threshold = throughput_threshold(row, reference, throughput_tolerance)
+        if row[key] < threshold:
+            regressions.append(f"{name}: przepustowość {row[key]:.4g} ({key}; linia bazowa {reference[key]:.4g}, "
+                               f"próg {threshold:.4g})")
+        for key in ('max_error', 'rms_error'):
+            if row[key] > reference[key] * (1 + accuracy_tolerance) + ERROR_FLOOR:
+                regressions.append(f"{name}: {key} {row[key]:.4e} (linia bazowa {reference[key]:.4e})")
+        if row['n_rhs'] > reference['n_rhs']:
+            regressions.append(f"{name}: {row['n_rhs']} wywołań prawych stron (linia bazowa {reference['n_rhs']})")
+        if row['peak_memory_kb'] > reference['peak_memory_kb'] * (1 + memory_tolerance) + MEMORY_FLOOR_KB:
+            regressions.append(f"{name}: pamięć {row['peak_memory_kb']:.1f} KiB "
+                               f"(linia bazowa {reference['peak_memory_kb']:.1f} KiB)")
+    return regressions
+
+
+def machine_info():
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine(),
+            'processor': platform.processor() or platform.machine(), 'system': platform.system()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark szybkości i dokładności metod całkowania.')
+    parser.add_argument('--cases', nargs='+', default=None,
+                        help='uruchom tylko przypadki, których nazwa zawiera któryś z podanych fragmentów')
+    parser.add_argument('--repeat', type=int, default=5, help='liczba próbek czasu (liczy się mediana)')
+    parser.add_argument('--sample-time', type=float, default=MIN_SAMPLE_TIME,
+                        help='minimalny czas jednej próbki [s] - przypadek jest powtarzany do jego upływu')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='plik linii bazowej (JSON)')
+    parser.add_argument('--update-baseline', action='store_true', help='zapisz wyniki jako nową linię bazową')
+    parser.add_argument('--throughput-tolerance', type=float, default=0.3,
+                        help='dopuszczalny względny spadek liczby kroków na sekundę')
+    parser.add_argument('--accuracy-tolerance', type=float, default=0.01, help='dopuszczalny względny wzrost błędu')
+    parser.add_argument('--memory-tolerance', type=float, default=0.5, help='dopuszczalny względny wzrost pamięci')
+    parser.add_argument('--json', help='ścieżka raportu JSON z wynikami')
+    args = parser.parse_args()
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+    names = [name for name in CASES if args.cases is None or any(part in name for part in args.cases)]
+    results = {}
+    print(f"{'przypadek':>32} {'kroki':>6} {'kroki/s':>9} {'względna':>9} {'rozrzut':>7} {'prawe str.':>10} "
+          f"{'pamięć [KiB]':>12} {'max błąd':>10} {'RMS':>10}")
+    for name in names:
+        results[name] = row = measure(CASES[name], args.repeat, args.sample_time)
+        print(f"{name:>32} {row['n_steps']:>6} {row['steps_per_s']:>9.3g} {row['relative_throughput']:>9.3g} "
+              f"{row['throughput_spread']:>7.1%} {row['n_rhs']:>10} {row['peak_memory_kb']:>12.1f} "
+              f"{row['max_error']:>10.3e} {row['rms_error']:>10.3e}")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'machine': machine_info(), 'cases': results}, file, indent=2)
+
+    if args.update_baseline:
+        baseline = {'machine': machine_info(), 'cases': {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as file:
+                baseline['cases'] = json.load(file)['cases']
+        baseline['cases'].update(results)
+        with open(args.baseline, 'w') as file:
+            json.dump(baseline, file, indent=2)
+        print(f"\nZapisano linię bazową: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nBrak linii bazowej {args.baseline} - uruchom z --update-baseline.")
+        return
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    if baseline.get('machine') != machine_info():
+        print(f"\nUwaga: linia bazowa zmierzona na innej maszynie ({baseline.get('machine')}) - "
+              f"przepustowość może nie być porównywalna.")
+    regressions = compare(results, baseline['cases'], args.throughput_tolerance, args.accuracy_tolerance,
+                          args.memory_tolerance)
+    missing = [name for name in results if name not in baseline['cases']]
+    if missing:
+        print(f"\nPrzypadki bez linii bazowej: {', '.join(missing)}")
+    if regressions:
+        print("\nREGRESJE:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"\nBrak regresji ({len(results)} przypadków).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+Wsadowe uruchamianie scenariuszy symulacji bez interakcji (bez pytań input()).
+
+Scenariusz to plik JSON lub TOML opisujący model i jego parametry:
+
+    {"name": "robot_kolo", "model": "robot_methods",
+     "params": {"x1_0": 0, "x2_0": 0, "x3_0_deg": 0, "h": 0.1,
+                "phases": [{"w1": 1.0, "w2_deg": 36.0, "duration": 10.0}]}}
+
+Pole 'model' wskazuje skrypt (patrz MODELS), a 'params' to dokładnie te wielkości, o które skrypt pyta
+interaktywnie (stan początkowy, h, fazy ruchu, ciągi v(t) i p(t), parametry układu). Wszystkie scenariusze
+z podanych plików/katalogów są liczone równolegle na puli procesów z backendem Agg; dla każdego powstaje
+katalog z result.json i wykresami PNG.
+
+Przykład:
+    python scenarios/run_batch.py scenarios/examples --out wyniki --workers 8
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+import tomllib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# zapis tablic numpy w JSON wspólny z trajectory_store.py (katalog dopisywany na końcu sys.path, więc nie
+# przesłania modułów dodawanych przez load_model)
+sys.path.append(os.path.join(ROOT, 'Lista3'))
+from trajectory_store import to_json
+
+# model -> skrypt z funkcją run_scenario(params)
+MODELS = {
+    'robot_rotation': 'Lista2/task_1.py',
+    'inertial_response': 'Lista2/task_2.py',
+    'integrating_response': 'Lista2/task_3.py',
+    'decay': 'Lista2/task_4.py',
+    'decay_chain': 'Lista2/decay_chain.py',
+    'oscillator': 'Lista2/task_5.py',
+    'robot_euler': 'Lista3/task_3.py',
+    'wheat': 'Lista3/task_4.py',
+    'robot_methods': 'Lista3/task_5.py',
+}
+SCENARIO_SUFFIXES = ('.json', '.toml')
+
+
+def load_scenario(path):
+    """Wczytuje scenariusz z pliku JSON lub TOML (nazwa domyślnie z nazwy pliku)."""
+    if path.endswith('.toml'):
+        with open(path, 'rb') as file:
+            scenario = tomllib.load(file)
+    else:
+        with open(path) as file:
+            scenario = json.load(file)
+    if scenario.get('model') not in MODELS:
+        raise ValueError(f"{path}: nieznany model {scenario.get('model')!r} (dostępne: {', '.join(MODELS)})")
+    scenario.setdefault('name', os.path.splitext(os.path.basename(path))[0])
+    scenario.setdefault('params', {})
+    return scenario
+
+
+def find_scenarios(paths):
+    """Lista plików scenariuszy - podane pliki oraz pliki .json/.toml z podanych katalogów."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if name.endswith(SCENARIO_SUFFIXES))
+        else:
+            files.append(path)
+    return files
+
+
+_modules = {}
+
+
+def load_model(model):
+    """
+    Importuje skrypt modelu (raz na proces). Katalog skryptu trafia do sys.path, bo skrypty importują
+    moduły z sąsiednich plików (plotting, recorder...); unikalna nazwa modułu rozróżnia task_*.py z list.
+    """
+    if model not in _modules:
+        path = os.path.join(ROOT, MODELS[model])
+        directory = os.path.dirname(path)
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+        name = MODELS[model].replace('/', '_').removesuffix('.py')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[model] = module
+    return _modules[model]
+
+
+def _init_worker():
+    """Backend bez okien - wykresy są tylko zapisywane do plików."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def run_one(task):
+    """Uruchamia jeden scenariusz w procesie roboczym i zapisuje result.json oraz wykresy PNG."""
+    path, out_dir, dpi = task
+    start = time.perf_counter()
+    name = os.path.splitext(os.path.basename(path))[0]
+    try:
+        scenario = load_scenario(path)
+        name = scenario['name']
+        target = os.path.join(out_dir, name)
+        os.makedirs(target, exist_ok=True)
+
+        import matplotlib.pyplot as plt
+        results, figures = load_model(scenario['model']).run_scenario(scenario['params'])
+        png_files = []
+        for i, fig in enumerate(figures):
+            png_files.append(f'figure_{i + 1}.png')
+            fig.savefig(os.path.join(target, png_files[-1]), dpi=dpi)
+            plt.close(fig)
+
+        report = {'name': name, 'model': scenario['model'], 'status': 'ok', 'params': scenario['params'],
+                  'results': results, 'figures': png_files, 'wall_time_s': time.perf_counter() - start}
+        with open(os.path.join(target, 'result.json'), 'w') as file:
+            json.dump(report, file, indent=2, default=to_json)
+    except Exception as error:
+        report = {'name': name, 'source': path, 'status': 'error', 'error': repr(error),
+                  'traceback': traceback.format_exc(), 'wall_time_s': time.perf_counter() - start}
+    return report
+
+
+def run_batch(paths, out_dir, workers=None, dpi=100):
+    """Liczy wszystkie scenariusze równolegle; zwraca raporty w kolejności plików."""
+    files = find_scenarios(paths)
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(path, out_dir, dpi) for path in files]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return list(pool.map(run_one, tasks))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Wsadowe uruchamianie scenariuszy (JSON/TOML) bez interakcji.')
+    parser.add_argument('paths', nargs='+', help='pliki scenariuszy lub katalogi z plikami .json/.toml')
+    parser.add_argument('--out', default='wyniki', help='katalog wyników (podkatalog na scenariusz)')
+    parser.add_argument('--workers', type=int, default=None, help='liczba procesów (domyślnie liczba rdzeni)')
+    parser.add_argument('--dpi', type=int, default=100, help='rozdzielczość zapisywanych wykresów')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    reports = run_batch(args.paths, args.out, args.workers, args.dpi)
+    elapsed = time.perf_counter() - start
+
+    with open(os.path.join(args.out, 'summary.json'), 'w') as file:
+        json.dump([{key: report[key] for key in ('name', 'status', 'wall_time_s')} for report in reports],
+                  file, indent=2)
+    for report in reports:
+        if report['status'] == 'ok':
+            print(f"{report['name']:>30}  ok      {report['wall_time_s']:.3f} s")
+        else:
+            print(f"{report['name']:>30}  BŁĄD    {report['error']}")
+    n_failed = sum(report['status'] != 'ok' for report in reports)
+    print(f"\n{len(reports)} scenariuszy w {elapsed:.2f} s ({len(reports) / max(elapsed, 1e-9):.1f} scenariuszy/s), "
+          f"błędów: {n_failed}")
+    sys.exit(1 if n_failed else 0)
+
+
+if __name__ == '__main__':
+    main()